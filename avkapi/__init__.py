@@ -4,4 +4,4 @@ https://github.com/aiogram/aiogram/
 
 """
 
-from .vk import VK
+from .vk import VK, ConnectionProfile
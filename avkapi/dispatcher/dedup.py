@@ -0,0 +1,205 @@
+import collections
+import hashlib
+import math
+import typing
+
+from .storage import BaseStorage
+
+DEFAULT_CAPACITY = 10000
+DEFAULT_ERROR_RATE = 0.001
+DEDUP_CHAT = '$dedup'
+
+
+def get_event_key(data: typing.Dict) -> typing.Optional[str]:
+    """
+    Get identity of the raw event: `event_id` or group_id + type + object id.
+
+    Messages in chats have no `id` (it is 0), they are identified by `conversation_message_id`.
+
+    :param data: raw event
+    :return: key or None if event can't be identified
+    """
+    event_id = data.get('event_id')
+    if event_id:
+        return str(event_id)
+
+    obj = data.get('object')
+    if not isinstance(obj, dict):
+        return None
+    event_type = data.get('type')
+    object_id = obj.get('id')
+    if not object_id:
+        conversation_message_id = obj.get('conversation_message_id')
+        if not conversation_message_id or not str(event_type).startswith('message_'):
+            return None
+        object_id = f"c{conversation_message_id}"
+    return f"{data.get('group_id')}:{event_type}:{obj.get('peer_id', '')}:{object_id}"
+
+
+class BaseDeduplicator:
+    """
+    Base class for the memory of recently received events
+    """
+
+    async def check(self, key: str) -> bool:
+        """
+        Remember the key and check it was already seen
+
+        :param key: event key
+        :return: True if event is duplicate
+        """
+        raise NotImplementedError
+
+    async def forget(self, key: str):
+        """
+        Forget the key of the event which was not accepted (e.g. rejected by the full queue),
+        so it is processed when VK sends it again
+
+        :param key: event key
+        """
+        raise NotImplementedError
+
+
+class LRUDeduplicator(BaseDeduplicator):
+    """
+    Exact set of the last `capacity` event keys
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._keys = collections.OrderedDict()
+
+    def add(self, key: str) -> bool:
+        """
+        Synchronous version of :meth:`check`
+        """
+        if key in self._keys:
+            self._keys.move_to_end(key)
+            return True
+
+        self._keys[key] = None
+        if len(self._keys) > self.capacity:
+            self._keys.popitem(last=False)
+        return False
+
+    async def check(self, key: str) -> bool:
+        return self.add(key)
+
+    def discard(self, key: str):
+        """
+        Synchronous version of :meth:`forget`
+        """
+        self._keys.pop(key, None)
+
+    async def forget(self, key: str):
+        self.discard(key)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+
+class BloomDeduplicator(BaseDeduplicator):
+    """
+    Rotating Bloom filter.
+
+    Remembers at least `capacity` last keys in fixed memory. When the current filter is full
+    the oldest one is dropped, so not duplicate events are reported as duplicates
+    with probability about `error_rate` for each of the filters.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, error_rate=DEFAULT_ERROR_RATE, generations=2):
+        """
+        :param capacity: count of keys in one generation
+        :param error_rate: false-positive rate of one generation
+        :param generations: count of filters kept in memory
+        """
+        if not 0 < error_rate < 1:
+            raise ValueError('`error_rate` must be in range (0, 1)')
+        if capacity <= 0 or generations <= 0:
+            raise ValueError('`capacity` and `generations` must be positive')
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.generations = generations
+
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+
+        self._filters = collections.deque([self._new_filter()], maxlen=generations)
+        self._count = 0
+
+        # Bits can't be removed from the filter, so forgotten keys are kept aside until they are seen again
+        self._forgotten = LRUDeduplicator(capacity)
+
+    def _new_filter(self):
+        return bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key: str) -> bool:
+        """
+        Synchronous version of :meth:`check`
+        """
+        positions = self._positions(key)
+        if self._forgotten and key in self._forgotten:
+            self._forgotten.discard(key)
+        else:
+            for bits in self._filters:
+                if all(bits[pos >> 3] & (1 << (pos & 7)) for pos in positions):
+                    return True
+
+        if self._count >= self.capacity:
+            self._filters.appendleft(self._new_filter())
+            self._count = 0
+
+        current = self._filters[0]
+        for pos in positions:
+            current[pos >> 3] |= 1 << (pos & 7)
+        self._count += 1
+        return False
+
+    async def check(self, key: str) -> bool:
+        return self.add(key)
+
+    def discard(self, key: str):
+        """
+        Synchronous version of :meth:`forget`
+        """
+        self._forgotten.add(key)
+
+    async def forget(self, key: str):
+        self.discard(key)
+
+
+class StorageDeduplicator(BaseDeduplicator):
+    """
+    Keep keys of events in the FSM storage, so deduplication works across processes.
+
+    Recently seen keys are also kept in the local LRU set for skipping requests to the storage.
+    Storage has no TTL for records, so the backend has to expire them by itself.
+    """
+
+    def __init__(self, storage: BaseStorage, local_capacity=DEFAULT_CAPACITY):
+        self.storage = storage
+        self.local = LRUDeduplicator(local_capacity)
+
+    async def check(self, key: str) -> bool:
+        if self.local.add(key):
+            return True
+
+        data = await self.storage.get_data(chat=DEDUP_CHAT, user=key)
+        if data:
+            return True
+        await self.storage.set_data(chat=DEDUP_CHAT, user=key, data={'seen': True})
+        return False
+
+    async def forget(self, key: str):
+        self.local.discard(key)
+        await self.storage.set_data(chat=DEDUP_CHAT, user=key, data={})
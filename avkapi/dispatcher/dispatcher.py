@@ -2,17 +2,22 @@ import asyncio
 import functools
 import logging
 
-from .filters import generate_default_filters
+from .dedup import LRUDeduplicator, get_event_key
+from .filters import RegexpMatcher, generate_default_filters
 from .handler import Handler
-from .storage import DisabledStorage
+from .storage import USER_DATA, USER_STATE, DisabledStorage
 from .middlewares import MiddlewareManager
+from .queue import DEFAULT_QUEUE_SIZE, DEFAULT_WORKERS, EventQueue, QueuePolicy, ShardedEventQueue, \
+    get_peer_key, is_low_priority
 
-from ..types import Message, MessageType
+from ..types import Event, EventType, MessageType
 from ..utils import context
 from ..vk import VK
 
 EVENT_OBJECT = 'event_object'
 
+DEFAULT_POLLING_TIMEOUT = 25
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,13 +35,25 @@ class Dispatcher:
         self.message_handlers = Handler(self, middleware_key='message')
         self.errors_handlers = Handler(self, once=False, middleware_key='error')
 
+        # Routing table: event type -> handlers
+        self.event_handlers = {event_type: self.message_handlers for event_type in EventType.MESSAGES}
+
+        # Patterns of all regexp filters, text of each message is scanned once for all of them
+        self.regexp_matcher = RegexpMatcher()
+
         self.middleware = MiddlewareManager(self)
         self.events_handler.register(self.process_event)
 
+        self.events_queue = None
+        self.deduplicator = None
+
         self._polling = False
         self._closed = True
         self._close_waiter = loop.create_future()
 
+        self._long_poll_server = None
+        self._long_poll_request = None
+
     async def process_events(self, events):
         """
         Process list of updates
@@ -49,6 +66,34 @@ class Dispatcher:
             tasks.append(self.events_handler.notify(event))
         return await asyncio.gather(*tasks)
 
+    def has_handlers(self, event_type) -> bool:
+        """
+        Check any handler is registered for the event type
+
+        :param event_type:
+        :return:
+        """
+        handler = self.event_handlers.get(event_type)
+        return handler is not None and bool(handler.handlers)
+
+    async def process_raw_event(self, data):
+        """
+        Deserialize and process single event.
+        Events of types without handlers are skipped without deserialization.
+
+        Event is passed through the events handler, so `event` middlewares are triggered
+        as for events processed by :meth:`process_events`.
+
+        :param data: event as :obj:`dict`
+        :return:
+        """
+        if not self.has_handlers(data.get('type')):
+            return
+        event = Event(**data)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'New event: {event}')
+        return await self.events_handler.notify(event)
+
     async def process_event(self, event):
         """
         Process single event object
@@ -56,18 +101,241 @@ class Dispatcher:
         :param event:
         :return:
         """
-        context.set_value(EVENT_OBJECT, event)
+        # States and data cached by the previous event of the task are dropped
+        context.update_state({EVENT_OBJECT: event, USER_STATE: None, USER_DATA: None})
 
-        if event.message and isinstance(event.message, Message):
+        handler = self.event_handlers.get(event.type)
+        if handler is None:
+            logger.debug(f'No handlers for event type {event.type!r}')
+            return
+
+        if handler is self.message_handlers:
             msg = event.message
             logger.info(f"Received message from {msg.from_id}, text: {msg.text}")
             return await self.message_handlers.notify(msg)
 
+        return await handler.notify(event)
+
+    def setup_events_queue(self, maxsize=DEFAULT_QUEUE_SIZE, workers=DEFAULT_WORKERS, policy=QueuePolicy.REJECT,
+                           low_priority=is_low_priority, ordered=False, key=get_peer_key):
+        """
+        Pass raw events through the bounded queue instead of processing each of them in a new task.
+
+        With `ordered=True` events are spread over `workers` shards by conversation:
+        events of one conversation are processed in order (handlers are not moved to separate tasks),
+        different conversations are processed in parallel.
+
+        :param maxsize: max count of queued events
+        :param workers: count of workers (shards) processing events
+        :param policy: what to do when the queue is full, one of :class:`QueuePolicy` values
+        :param low_priority: callable which checks event can be shed with `QueuePolicy.SHED`
+        :param ordered: keep order of events in each conversation
+        :param key: callable which returns conversation of the raw event (only for ordered queue)
+        :return: :obj:`EventQueue`
+        """
+        if ordered:
+            self.events_queue = ShardedEventQueue(self, maxsize=maxsize, workers=workers, policy=policy,
+                                                  low_priority=low_priority, key=key)
+        else:
+            self.events_queue = EventQueue(self, maxsize=maxsize, workers=workers, policy=policy,
+                                           low_priority=low_priority)
+        return self.events_queue
+
+    @property
+    def ordered_processing(self) -> bool:
+        """
+        Events are processed in order of each conversation
+
+        :return:
+        """
+        return isinstance(self.events_queue, ShardedEventQueue)
+
+    def setup_deduplicator(self, deduplicator=None):
+        """
+        Skip events which were already received (e.g. callbacks retried by VK)
+
+        :param deduplicator: instance of :obj:`avkapi.dispatcher.dedup.BaseDeduplicator`.
+            :obj:`LRUDeduplicator` is used by default.
+        :return: deduplicator
+        """
+        if deduplicator is None:
+            deduplicator = LRUDeduplicator()
+        self.deduplicator = deduplicator
+        return deduplicator
+
+    async def is_duplicate(self, data) -> bool:
+        """
+        Check raw event was already received
+
+        :param data: raw event
+        :return:
+        """
+        if self.deduplicator is None:
+            return False
+        key = get_event_key(data)
+        if key is None:
+            return False
+        if await self.deduplicator.check(key):
+            logger.info(f'Skip duplicate event {key}')
+            return True
+        return False
+
+    async def forget_event(self, data):
+        """
+        Forget raw event which was not accepted, so it isn't reported as duplicate when VK sends it again
+
+        :param data: raw event
+        """
+        if self.deduplicator is None:
+            return
+        key = get_event_key(data)
+        if key is not None:
+            await self.deduplicator.forget(key)
+
+    async def reset_webhook(self, check=True) -> bool:
+        """
+        Callback API servers don't prevent receiving events with Bots Long Poll,
+        so there is nothing to reset. Kept for compatibility with the executor.
+
+        :param check:
+        :return: True
+        """
+        return True
+
+    async def _get_long_poll_server(self):
+        group_id = await self.vk.get_group_id()
+        return await self.vk.groups.get_long_poll_server(group_id=group_id)
+
+    async def skip_updates(self):
+        """
+        Jump to the newest event of Long Poll server.
+
+        :return: count of skipped events (if polling was started before)
+        """
+        previous = self._long_poll_server
+        self._long_poll_server = await self._get_long_poll_server()
+
+        if previous is not None:
+            return max(0, int(self._long_poll_server['ts']) - int(previous['ts']))
+        return 0
+
+    async def start_polling(self, timeout=DEFAULT_POLLING_TIMEOUT, reset_webhook=None, error_sleep=5):
+        """
+        Start Bots Long Poll.
+
+        The next request to Long Poll server is kept in flight while the current batch of events is dispatched.
+
+        :param timeout: max waiting time of one request in seconds (up to 90)
+        :param reset_webhook:
+        :param error_sleep: delay after failed request
+        """
+        if self._polling:
+            raise RuntimeError('Polling already started')
+
+        if timeout is None:
+            timeout = DEFAULT_POLLING_TIMEOUT
+        if reset_webhook:
+            await self.reset_webhook(check=True)
+
+        logger.info('Start polling.')
+
+        self._polling = True
+        self._closed = False
+        if self._close_waiter.done():
+            self._close_waiter = self.loop.create_future()
+
+        try:
+            server = self._long_poll_server
+            if server is None:
+                server = await self._get_long_poll_server()
+            else:
+                # Continue from the last received event with the new key
+                server = dict(await self._get_long_poll_server(), ts=server['ts'])
+            self._long_poll_server = server
+
+            request = self._check_long_poll(server, timeout)
+            while self._polling:
+                try:
+                    data = await request
+                    failed = data.get('failed')
+                    if failed:
+                        # Expired key is usual, so errors of refreshing are retried as errors of requests
+                        server = await self._refresh_long_poll_server(server, data)
+                        request = self._check_long_poll(server, timeout)
+                        continue
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    logger.exception(f'Cause exception while getting events: {e}')
+                    await asyncio.sleep(error_sleep)
+                    request = self._check_long_poll(server, timeout)
+                    continue
+
+                server['ts'] = data['ts']
+                # Keep the next request in flight while the current batch is dispatched
+                request = self._check_long_poll(server, timeout)
+
+                updates = data.get('updates')
+                if updates:
+                    logger.debug(f'Received {len(updates)} events.')
+                    await self._process_polling_events(updates)
+        finally:
+            self._polling = False
+            if self._long_poll_request is not None:
+                self._long_poll_request.cancel()
+                self._long_poll_request = None
+            self._closed = True
+            if not self._close_waiter.done():
+                self._close_waiter.set_result(None)
+            logger.warning('Polling is stopped.')
+
+    def _check_long_poll(self, server, timeout):
+        self._long_poll_request = self.loop.create_task(
+            self.vk.check_long_poll(server['server'], server['key'], server['ts'], wait=timeout))
+        return self._long_poll_request
+
+    async def _refresh_long_poll_server(self, server, data):
+        """
+        Refresh only what is needed for `failed` response of Long Poll server
+
+        :param server: current server info
+        :param data: response with `failed` key
+        :return: server info
+        """
+        failed = data['failed']
+        if failed == 1:
+            # Events history is outdated or partially lost
+            logger.warning('Long Poll events history is lost.')
+            server['ts'] = data['ts']
+        elif failed == 2:
+            # Key is expired
+            server['key'] = (await self._get_long_poll_server())['key']
         else:
-            logger.error('ERROR! HELP ME!')
+            # Information is lost
+            server.update(await self._get_long_poll_server())
+        return server
+
+    async def _process_polling_events(self, updates):
+        """
+        Deserialize and process events received from Long Poll server
+
+        :param updates: list of raw events
+        """
+        try:
+            if self.deduplicator is not None:
+                updates = [update for update in updates if not await self.is_duplicate(update)]
+            updates = [update for update in updates if self.has_handlers(update.get('type'))]
+            if self.events_queue is not None:
+                # Long Poll server keeps events, so wait for the free place instead of losing them
+                for update in updates:
+                    await self.events_queue.put(update, policy=QueuePolicy.BLOCK)
+                return
+            await self.process_events([Event(**update) for update in updates])
+        except Exception as e:
+            logger.exception(f'Cause exception while processing events: {e}')
 
     def register_message_handler(self, callback, *, commands=None, regexp=None, content_types=None, func=None,
-                                 state=None, custom_filters=None, run_task=None, **kwargs):
+                                 state=None, custom_filters=None, run_task=None, reorder_filters=True, **kwargs):
         if content_types is None:
             content_types = MessageType.ANY
 
@@ -83,24 +351,137 @@ class Dispatcher:
                                                state=state,
                                                **kwargs)
 
-        self.message_handlers.register(self._wrap_async_task(callback, run_task), filters_set)
+        self.message_handlers.register(self._wrap_async_task(callback, run_task), filters_set,
+                                       reorder_filters=reorder_filters)
 
     def message_handler(self, *custom_filters, commands=None, regexp=None, content_types=None, func=None, state=None,
-                        run_task=None, **kwargs):
+                        run_task=None, reorder_filters=True, **kwargs):
 
         def decorator(callback):
             self.register_message_handler(callback,
                                           commands=commands, regexp=regexp, content_types=content_types,
                                           func=func, state=state, custom_filters=custom_filters, run_task=run_task,
-                                          **kwargs)
+                                          reorder_filters=reorder_filters, **kwargs)
             return callback
 
         return decorator
 
+    def register_event_handler(self, callback, event_types, *, func=None, custom_filters=None, run_task=None,
+                               reorder_filters=True, **kwargs):
+        """
+        Register handler for events of other types than messages.
+        Handler receives :obj:`avkapi.types.Event` with the raw `object`.
+
+        :param callback:
+        :param event_types: event type or list of types, see :class:`avkapi.types.EventType`
+        :param func:
+        :param custom_filters:
+        :param run_task: run callback in task (no wait results)
+        :param reorder_filters: check cheap filters first, disable it for filters which depend on order
+        :param kwargs:
+        """
+        if isinstance(event_types, str):
+            event_types = [event_types]
+        if custom_filters is None:
+            custom_filters = []
+
+        filters_set = generate_default_filters(self, *custom_filters, func=func, **kwargs)
+        callback = self._wrap_async_task(callback, run_task)
+
+        for event_type in event_types:
+            if event_type in EventType.MESSAGES or event_type == EventType.CONFIRMATION:
+                raise ValueError(f"Use message handlers for '{event_type}' events")
+            handler = self.event_handlers.get(event_type)
+            if handler is None:
+                handler = self.event_handlers[event_type] = Handler(self, middleware_key=event_type)
+            handler.register(callback, filters_set, reorder_filters=reorder_filters)
+
+    def event_handler(self, *custom_filters, event_types, func=None, run_task=None, **kwargs):
+        """
+        Decorator for event handler
+
+        .. code-block:: python3
+
+            @dp.event_handler(event_types=[EventType.GROUP_JOIN, EventType.GROUP_LEAVE])
+            async def members_handler(event: types.Event):
+                ...
+
+        :param custom_filters:
+        :param event_types: event type or list of types
+        :param func:
+        :param run_task: run callback in task (no wait results)
+        :param kwargs:
+        :return: decorated function
+        """
+
+        def decorator(callback):
+            self.register_event_handler(callback, event_types, func=func, custom_filters=custom_filters,
+                                        run_task=run_task, **kwargs)
+            return callback
+
+        return decorator
+
+    def message_allow_handler(self, *custom_filters, func=None, run_task=None, **kwargs):
+        return self.event_handler(*custom_filters, event_types=EventType.MESSAGE_ALLOW, func=func,
+                                  run_task=run_task, **kwargs)
+
+    def message_deny_handler(self, *custom_filters, func=None, run_task=None, **kwargs):
+        return self.event_handler(*custom_filters, event_types=EventType.MESSAGE_DENY, func=func,
+                                  run_task=run_task, **kwargs)
+
+    def photo_new_handler(self, *custom_filters, func=None, run_task=None, **kwargs):
+        return self.event_handler(*custom_filters, event_types=EventType.PHOTO_NEW, func=func,
+                                  run_task=run_task, **kwargs)
+
+    def video_new_handler(self, *custom_filters, func=None, run_task=None, **kwargs):
+        return self.event_handler(*custom_filters, event_types=EventType.VIDEO_NEW, func=func,
+                                  run_task=run_task, **kwargs)
+
+    def wall_post_new_handler(self, *custom_filters, func=None, run_task=None, **kwargs):
+        return self.event_handler(*custom_filters, event_types=EventType.WALL_POST_NEW, func=func,
+                                  run_task=run_task, **kwargs)
+
+    def wall_repost_handler(self, *custom_filters, func=None, run_task=None, **kwargs):
+        return self.event_handler(*custom_filters, event_types=EventType.WALL_REPOST, func=func,
+                                  run_task=run_task, **kwargs)
+
+    def wall_reply_new_handler(self, *custom_filters, func=None, run_task=None, **kwargs):
+        return self.event_handler(*custom_filters, event_types=EventType.WALL_REPLY_NEW, func=func,
+                                  run_task=run_task, **kwargs)
+
+    def board_post_new_handler(self, *custom_filters, func=None, run_task=None, **kwargs):
+        return self.event_handler(*custom_filters, event_types=EventType.BOARD_POST_NEW, func=func,
+                                  run_task=run_task, **kwargs)
+
+    def group_join_handler(self, *custom_filters, func=None, run_task=None, **kwargs):
+        return self.event_handler(*custom_filters, event_types=EventType.GROUP_JOIN, func=func,
+                                  run_task=run_task, **kwargs)
+
+    def group_leave_handler(self, *custom_filters, func=None, run_task=None, **kwargs):
+        return self.event_handler(*custom_filters, event_types=EventType.GROUP_LEAVE, func=func,
+                                  run_task=run_task, **kwargs)
+
+    def user_block_handler(self, *custom_filters, func=None, run_task=None, **kwargs):
+        return self.event_handler(*custom_filters, event_types=EventType.USER_BLOCK, func=func,
+                                  run_task=run_task, **kwargs)
+
+    def user_unblock_handler(self, *custom_filters, func=None, run_task=None, **kwargs):
+        return self.event_handler(*custom_filters, event_types=EventType.USER_UNBLOCK, func=func,
+                                  run_task=run_task, **kwargs)
+
+    def poll_vote_new_handler(self, *custom_filters, func=None, run_task=None, **kwargs):
+        return self.event_handler(*custom_filters, event_types=EventType.POLL_VOTE_NEW, func=func,
+                                  run_task=run_task, **kwargs)
+
+    def vkpay_transaction_handler(self, *custom_filters, func=None, run_task=None, **kwargs):
+        return self.event_handler(*custom_filters, event_types=EventType.VKPAY_TRANSACTION, func=func,
+                                  run_task=run_task, **kwargs)
+
     def async_task(self, func):
         """
         Execute handler as task and return None.
 
+        When events are processed in order of conversations, handler is executed in the current task.
 
         :param func:
         :return:
@@ -116,6 +497,13 @@ class Dispatcher:
 
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
+            if self.ordered_processing:
+                try:
+                    await func(*args, **kwargs)
+                except Exception as e:
+                    await self.errors_handlers.notify(self, context.get_value(EVENT_OBJECT), e)
+                return
+
             task = self.loop.create_task(func(*args, **kwargs))
             task.add_done_callback(process_response)
 
@@ -138,6 +526,8 @@ class Dispatcher:
         if self._polling:
             logger.info('Stop polling...')
             self._polling = False
+            if self._long_poll_request is not None:
+                self._long_poll_request.cancel()
 
     async def wait_closed(self):
         """
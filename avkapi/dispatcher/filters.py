@@ -2,11 +2,41 @@ import asyncio
 import inspect
 import re
 
+from .storage import USER_STATE  # Re-exported for compatibility, the state cache is in storage now
 from ..types import MessageType, Message
-from ..utils import context
 from ..utils.helper import Helper, HelperMode, Item
 
-USER_STATE = 'USER_STATE'
+REGEXP_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# Kinds of patterns of RegexpMatcher
+PATTERN_WORD = 'word'
+PATTERN_LITERAL = 'literal'
+PATTERN_REGEXP = 'regexp'
+
+_WORD = re.compile(r'\w+')
+_WORD_PATTERN = re.compile(r'^\\b(\w+)\\b$')
+_LITERAL_PATTERN = re.compile(r'^[\w ]+$')
+
+
+# Filters of the handler are checked in order of their cost (cheap ones first), see :class:`FilterChain`
+CHEAP_FILTER = 0
+DEFAULT_FILTER_COST = 1
+EXPENSIVE_FILTER = 2
+
+
+def is_async_filter(filter_) -> bool:
+    """
+    Check filter has to be awaited
+
+    :param filter_:
+    :return:
+    """
+    if not callable(filter_):
+        raise TypeError('Filter must be callable and/or awaitable!')
+    if isinstance(filter_, Filter):
+        # Subclasses can override `check` with coroutine or usual function regardless of the base class
+        return inspect.iscoroutinefunction(filter_.check)
+    return inspect.isawaitable(filter_) or inspect.iscoroutinefunction(filter_)
 
 
 async def check_filter(filter_, args):
@@ -18,10 +48,7 @@ async def check_filter(filter_, args):
     :param kwargs:
     :return:
     """
-    if not callable(filter_):
-        raise TypeError('Filter must be callable and/or awaitable!')
-
-    if inspect.isawaitable(filter_) or inspect.iscoroutinefunction(filter_):
+    if is_async_filter(filter_):
         return await filter_(*args)
     else:
         return filter_(*args)
@@ -43,10 +70,79 @@ async def check_filters(filters, args):
     return True
 
 
+class FilterChain:
+    """
+    Filters of the handler prepared for checks.
+
+    Filters are classified once, so sync filters are called inline and only async ones are awaited.
+    Cheap filters are moved ahead of expensive ones (by `cost` attribute of the filter),
+    pass `reorder=False` for filters which depend on order.
+    """
+    __slots__ = ('filters', 'is_async', '_checks')
+
+    def __init__(self, filters=None, reorder=True):
+        """
+        :param filters: list of filters
+        :param reorder: sort filters by cost (order of filters with the same cost is kept)
+        """
+        filters = list(filters or ())
+        if reorder:
+            filters.sort(key=lambda filter_: getattr(filter_, 'cost', DEFAULT_FILTER_COST))
+        self.filters = tuple(filters)
+        self._checks = tuple((filter_, is_async_filter(filter_)) for filter_ in filters)
+        self.is_async = any(is_async for _, is_async in self._checks)
+
+    def without(self, filter_) -> 'FilterChain':
+        """
+        Get chain without the filter
+
+        :param filter_:
+        :return:
+        """
+        return type(self)([item for item in self.filters if item is not filter_], reorder=False)
+
+    def check_sync(self, args) -> bool:
+        """
+        Check filters of the chain without async filters
+
+        :param args:
+        :return:
+        """
+        for filter_, _ in self._checks:
+            if not filter_(*args):
+                return False
+        return True
+
+    async def check(self, args) -> bool:
+        """
+        Check filters of the chain
+
+        :param args:
+        :return:
+        """
+        for filter_, is_async in self._checks:
+            if is_async:
+                if not await filter_(*args):
+                    return False
+            elif not filter_(*args):
+                return False
+        return True
+
+    def __iter__(self):
+        return iter(self.filters)
+
+    def __len__(self):
+        return len(self.filters)
+
+    def __repr__(self):
+        return f"<FilterChain {list(self.filters)}>"
+
+
 class Filter:
     """
     Base class for filters
     """
+    cost = DEFAULT_FILTER_COST
 
     def __call__(self, *args, **kwargs):
         return self.check(*args, **kwargs)
@@ -95,40 +191,133 @@ class NotFilter(AsyncFilter):
         return not await check_filter(self.filter, args)
 
 
-class CommandsFilter(AsyncFilter):
+class CommandsFilter(Filter):
     """
     Check commands in message
     """
+    cost = CHEAP_FILTER
 
     def __init__(self, commands):
+        if isinstance(commands, str):
+            commands = [commands]
         self.commands = commands
 
-    async def check(self, message):
-        if not message.is_command():
+    def check(self, message):
+        command = message.get_command()
+        if command is None:
             return False
 
-        command = message.text.split()[0][1:]
-        command, _, mention = command.partition('@')
-
-        # if mention and mention != (await message.bot.me).username:
-        #     return False
-
         if command not in self.commands:
             return False
 
         return True
 
 
+class RegexpMatches:
+    """
+    Result of matching of the text by :class:`RegexpMatcher`.
+
+    Words and lowercase text are prepared once for all of the keyword patterns,
+    other patterns are searched on demand and results are cached.
+    """
+    __slots__ = ('matcher', 'text', '_words', '_lower_text', '_checked')
+
+    def __init__(self, matcher, text):
+        self.matcher = matcher
+        self.text = text
+        self._words = None
+        self._lower_text = None
+        self._checked = {}
+
+    def __contains__(self, index):
+        kind, key = self.matcher.kinds[index]
+        if kind == PATTERN_WORD:
+            if self._words is None:
+                self._words = {word.lower() for word in _WORD.findall(self.text)}
+            return key in self._words
+        if kind == PATTERN_LITERAL:
+            if self._lower_text is None:
+                self._lower_text = self.text.lower()
+            return key in self._lower_text
+
+        result = self._checked.get(index)
+        if result is None:
+            result = self._checked[index] = bool(self.matcher.patterns[index].search(self.text))
+        return result
+
+
+class RegexpMatcher:
+    """
+    Shared matcher of the patterns of many regexp filters, so each message is scanned once for all of them.
+
+    Patterns of keywords (``\\bhello\\b``) are looked up in the set of words of the text,
+    patterns of literal phrases are looked up in the lowercase text,
+    other patterns are searched as usual (once for each text).
+    """
+
+    def __init__(self, flags=REGEXP_FLAGS):
+        self.flags = flags
+        self.patterns = []
+        self.kinds = []
+        self._indexes = {}
+        self._last = None
+
+    def add(self, pattern: str) -> int:
+        """
+        Add pattern
+
+        :param pattern:
+        :return: index of the pattern for checks in results of :meth:`match`
+        """
+        index = self._indexes.get(pattern)
+        if index is None:
+            index = self._indexes[pattern] = len(self.patterns)
+            self.patterns.append(re.compile(pattern, self.flags))
+            self.kinds.append(self._get_kind(pattern))
+        return index
+
+    def _get_kind(self, pattern):
+        if not self.flags & re.IGNORECASE:
+            return PATTERN_REGEXP, None
+        word = _WORD_PATTERN.match(pattern)
+        if word:
+            return PATTERN_WORD, word.group(1).lower()
+        if _LITERAL_PATTERN.match(pattern):
+            return PATTERN_LITERAL, pattern.lower()
+        return PATTERN_REGEXP, None
+
+    def match(self, text: str) -> RegexpMatches:
+        """
+        Get matches of the text. Result of the last text is reused.
+
+        :param text:
+        :return: container of indexes of the patterns found in the text
+        """
+        last = self._last
+        if last is not None and (text is last.text or text == last.text):
+            return last
+        self._last = result = RegexpMatches(self, text)
+        return result
+
+
 class RegexpFilter(Filter):
     """
     Regexp filter for messages
     """
 
-    def __init__(self, regexp):
-        self.regexp = re.compile(regexp, flags=re.IGNORECASE | re.MULTILINE)
+    def __init__(self, regexp, matcher: RegexpMatcher = None):
+        """
+        :param regexp: pattern
+        :param matcher: shared matcher of patterns, text is searched by this filter itself without it
+        """
+        self.regexp = re.compile(regexp, flags=REGEXP_FLAGS)
+        self.matcher = matcher
+        self.index = matcher.add(regexp) if matcher is not None else None
 
     def check(self, obj):
         if isinstance(obj, Message) and obj.text:
+            if self.matcher is not None:
+                return self.index in self.matcher.match(obj.text)
             return bool(self.regexp.search(obj.text))
         return False
 
@@ -138,20 +327,26 @@ class RegexpCommandsFilter(AsyncFilter):
     Check commands by regexp in message
     """
 
-    def __init__(self, regexp_commands):
-        self.regexp_commands = [re.compile(command, flags=re.IGNORECASE | re.MULTILINE) for command in regexp_commands]
+    def __init__(self, regexp_commands, matcher: RegexpMatcher = None):
+        """
+        :param regexp_commands: patterns of commands
+        :param matcher: shared matcher of patterns
+        """
+        self.regexp_commands = [re.compile(command, flags=REGEXP_FLAGS) for command in regexp_commands]
+        self.matcher = matcher
+        self.indexes = [matcher.add(command) for command in regexp_commands] if matcher is not None else None
 
     async def check(self, message):
         if not message.is_command():
             return False
 
-        command = message.text.split()[0][1:]
-        command, _, mention = command.partition('@')
-
-        # if mention and mention != (await message.bot.me).username:
-        #     return False
+        if self.matcher is not None:
+            found = self.matcher.match(message.text)
+            commands = [command for command, index in zip(self.regexp_commands, self.indexes) if index in found]
+        else:
+            commands = self.regexp_commands
 
-        for command in self.regexp_commands:
+        for command in commands:
             search = command.search(message.text)
             if search:
                 message.conf['regexp_command'] = search
@@ -163,6 +358,7 @@ class ContentTypeFilter(Filter):
     """
     Check message content type
     """
+    cost = CHEAP_FILTER
 
     def __init__(self, content_types):
         self.content_types = content_types
@@ -176,6 +372,7 @@ class CancelFilter(Filter):
     """
     Find cancel in message text
     """
+    cost = CHEAP_FILTER
 
     def __init__(self, cancel_set=None):
         if cancel_set is None:
@@ -191,6 +388,7 @@ class StateFilter(AsyncFilter):
     """
     Check user state
     """
+    cost = EXPENSIVE_FILTER
 
     def __init__(self, dispatcher, state):
         self.dispatcher = dispatcher
@@ -203,14 +401,9 @@ class StateFilter(AsyncFilter):
         if self.state == '*':
             return True
 
-        if context.check_value(USER_STATE):
-            context_state = context.get_value(USER_STATE)
-            return self.state == context_state
-        else:
-            chat, user = self.get_target(obj)
-
-            if chat or user:
-                return await self.dispatcher.storage.get_state(chat=chat, user=user) == self.state
+        chat, user = self.get_target(obj)
+        if chat or user:
+            return await self.dispatcher.storage.get_cached_state(chat=chat, user=user) == self.state
         return False
 
 
@@ -223,7 +416,7 @@ class StatesListFilter(StateFilter):
         chat, user = self.get_target(obj)
 
         if chat or user:
-            return await self.dispatcher.storage.get_state(chat=chat, user=user) in self.state
+            return await self.dispatcher.storage.get_cached_state(chat=chat, user=user) in self.state
         return False
 
 
@@ -231,6 +424,7 @@ class ExceptionsFilter(Filter):
     """
     Filter for exceptions
     """
+    cost = CHEAP_FILTER
 
     def __init__(self, exception):
         self.exception = exception
@@ -261,7 +455,7 @@ def generate_default_filters(dispatcher, *args, **kwargs):
                 filters_set.append(CommandsFilter(filter_))
 
         elif name == DefaultFilters.REGEXP:
-            filters_set.append(RegexpFilter(filter_))
+            filters_set.append(RegexpFilter(filter_, matcher=dispatcher.regexp_matcher))
 
         elif name == DefaultFilters.CONTENT_TYPES:
             filters_set.append(ContentTypeFilter(filter_))
@@ -1,4 +1,4 @@
-from .filters import check_filters
+from .filters import CommandsFilter, FilterChain
 from ..utils import context
 import logging
 
@@ -20,8 +20,16 @@ class Handler:
 
         self.handlers = []
         self.middleware_key = middleware_key
+        # Names of middleware actions
+        self._pre_process_action = f"pre_process_{middleware_key}"
+        self._process_action = f"process_{middleware_key}"
+        self._post_process_action = f"post_process_{middleware_key}"
 
-    def register(self, handler, filters=None, index=None):
+        # Handlers by commands, built on the first notification after changes of handlers
+        self._commands_index = None
+        self._common_handlers = None
+
+    def register(self, handler, filters=None, index=None, reorder_filters=True):
         """
         Register callback
 
@@ -30,14 +38,16 @@ class Handler:
         :param handler: coroutine
         :param filters: list of filters
         :param index: you can reorder handlers
+        :param reorder_filters: check cheap filters first, disable it for filters which depend on order
         """
         if filters and not isinstance(filters, (list, tuple, set)):
             filters = [filters]
-        record = (filters, handler)
+        record = (FilterChain(filters, reorder=reorder_filters), handler)
         if index is None:
             self.handlers.append(record)
         else:
             self.handlers.insert(index, record)
+        self._commands_index = None
 
     def unregister(self, handler):
         """
@@ -50,9 +60,54 @@ class Handler:
             _, registered = handler_with_filters
             if handler is registered:
                 self.handlers.remove(handler_with_filters)
+                self._commands_index = None
                 return True
         raise ValueError('This handler is not registered!')
 
+    def _build_commands_index(self):
+        """
+        Build index of handlers by commands.
+
+        Handlers without commands filter are candidates for any message, handlers with it
+        only for messages with their commands (the commands filter is not checked again).
+        Subclasses of :class:`CommandsFilter` can check commands in other way, so they are not indexed.
+        Candidates of each command are kept in order of registration.
+        """
+        common = []
+        commands = {}
+        for position, (filters, handler) in enumerate(self.handlers):
+            commands_filter = next((filter_ for filter_ in filters if type(filter_) is CommandsFilter), None)
+            if commands_filter is None:
+                common.append((position, filters, handler))
+                continue
+            other_filters = filters.without(commands_filter)
+            for command in commands_filter.commands:
+                commands.setdefault(command, []).append((position, other_filters, handler))
+
+        self._commands_index = {
+            command: [(filters, handler) for _, filters, handler in sorted(common + records, key=lambda r: r[0])]
+            for command, records in commands.items()
+        }
+        self._common_handlers = [(filters, handler) for _, filters, handler in common]
+
+    def get_candidates(self, args):
+        """
+        Get handlers which filters have to be checked for the arguments
+
+        :param args:
+        :return: list of (filter chain, handler)
+        """
+        if self._commands_index is None:
+            self._build_commands_index()
+        if not self._commands_index:
+            return self.handlers
+
+        get_command = getattr(args[0], 'get_command', None) if args else None
+        command = get_command() if get_command is not None else None
+        if command is None:
+            return self._common_handlers
+        return self._commands_index.get(command, self._common_handlers)
+
     async def notify(self, *args):
         """
         Notify handlers
@@ -60,22 +115,26 @@ class Handler:
         :param args:
         :return:
         """
-        logger.debug(f'handler is notified with {args}')
+        logger.debug('handler is notified with %s', args)
         results = []
+        middleware = self.dispatcher.middleware
 
-        if self.middleware_key:
+        if self.middleware_key and middleware.get_handlers(self._pre_process_action):
             try:
-                await self.dispatcher.middleware.trigger(f"pre_process_{self.middleware_key}", args)
+                await middleware.trigger(self._pre_process_action, args)
             except CancelHandler:  # Allow to cancel current event
                 return results
 
-        for filters, handler in self.handlers:
-            logger.debug(f'Checking filters {filters} in handler {handler}')
-            if await check_filters(filters, args):
+        for filters, handler in self.get_candidates(args):
+            # Formatting of filters is deferred, this line runs for each candidate of each event
+            logger.debug('Checking filters %s in handler %s', filters, handler)
+            passed = await filters.check(args) if filters.is_async else filters.check_sync(args)
+            if passed:
                 try:
                     if self.middleware_key:
                         context.set_value('handler', handler)
-                        await self.dispatcher.middleware.trigger(f"process_{self.middleware_key}", args)
+                        if middleware.get_handlers(self._process_action):
+                            await middleware.trigger(self._process_action, args)
 
                     response = await handler(*args)
                     if response is not None:
@@ -92,8 +151,7 @@ class Handler:
                     logger.debug(f'Handler {handler} cancelled')
                     break
 
-        if self.middleware_key:
-            await self.dispatcher.middleware.trigger(f"post_process_{self.middleware_key}",
-                                                     args + (results,))
+        if self.middleware_key and middleware.get_handlers(self._post_process_action):
+            await middleware.trigger(self._post_process_action, args + (results,))
 
         return results
@@ -21,6 +21,9 @@ class MiddlewareManager:
         self.storage = dispatcher.storage
         self.applications = []
 
+        # Table of actions: action -> handlers of middlewares, rebuilt on setup of the middleware
+        self._actions = {}
+
     def setup(self, middleware):
         """
         Setup middleware
@@ -35,9 +38,31 @@ class MiddlewareManager:
 
         self.applications.append(middleware)
         middleware.setup(self)
+        self._build_actions()
         logger.debug(f"Loaded middleware '{middleware.__class__.__name__}'")
         return middleware
 
+    def _build_actions(self):
+        self._actions = {}
+        for app in self.applications:
+            for action in app.get_actions():
+                self.get_handlers(action)
+
+    def get_handlers(self, action: str) -> typing.Tuple[typing.Callable, ...]:
+        """
+        Get handlers of the action in order of setup of middlewares
+
+        :param action:
+        :return: tuple of coroutine functions, empty if nobody listens to the action
+        """
+        handlers = self._actions.get(action)
+        if handlers is None:
+            # Actions without `on_` methods are only listened by middlewares with own `trigger`
+            handlers = tuple(handler for handler in (app.get_handler(action) for app in self.applications)
+                             if handler is not None)
+            self._actions[action] = handlers
+        return handlers
+
     async def trigger(self, action: str, args: typing.Iterable):
         """
         Call action to middlewares with args lilt.
@@ -46,8 +71,8 @@ class MiddlewareManager:
         :param args:
         :return:
         """
-        for app in self.applications:
-            await app.trigger(action, args)
+        for handler in self.get_handlers(action):
+            await handler(*args)
 
 
 class BaseMiddleware:
@@ -88,6 +113,26 @@ class BaseMiddleware:
         """
         return self._configured
 
+    def get_actions(self) -> typing.List[str]:
+        """
+        Get actions implemented by `on_` methods
+
+        :return:
+        """
+        return [name[3:] for name in dir(type(self)) if name.startswith('on_') and callable(getattr(self, name))]
+
+    def get_handler(self, action) -> typing.Optional[typing.Callable]:
+        """
+        Get handler of the action
+
+        :param action:
+        :return: bound coroutine function or None
+        """
+        if type(self).trigger is not BaseMiddleware.trigger:
+            # Overridden trigger receives all of the actions
+            return lambda *args: self.trigger(action, args)
+        return getattr(self, f"on_{action}", None)
+
     async def trigger(self, action, args):
         """
         Trigger action.
@@ -0,0 +1,301 @@
+import asyncio
+import collections
+import logging
+
+from ..types import EventType
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_WORKERS = 8
+
+
+class QueuePolicy:
+    """
+    What to do with the new event when the queue is full
+    """
+    REJECT = 'reject'  # Don't accept the event, VK will retry it later
+    BLOCK = 'block'  # Wait for the free place
+    SHED = 'shed'  # Drop low-priority events (new or already queued ones)
+
+
+def is_low_priority(data):
+    """
+    Default check for events which can be dropped under pressure: everything except messages.
+
+    :param data: raw event
+    :return:
+    """
+    return data.get('type') not in EventType.MESSAGES
+
+
+def get_peer_key(data):
+    """
+    Get conversation of the raw event
+
+    :param data: raw event
+    :return:
+    """
+    obj = data.get('object')
+    if isinstance(obj, dict):
+        for key in ('peer_id', 'user_id', 'from_id', 'owner_id'):
+            value = obj.get(key)
+            if value is not None:
+                return value
+    return data.get('group_id')
+
+
+class _Shard:
+    """
+    Items and waiters of one queue
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.items = collections.deque()
+        self.getters = collections.deque()
+        self.putters = collections.deque()
+        self.processed = 0
+
+    def full(self):
+        return len(self.items) >= self.maxsize
+
+
+class EventQueue:
+    """
+    Bounded queue of raw events with the fixed count of workers which pass them to the dispatcher.
+    """
+
+    def __init__(self, dispatcher, maxsize=DEFAULT_QUEUE_SIZE, workers=DEFAULT_WORKERS,
+                 policy=QueuePolicy.REJECT, low_priority=is_low_priority):
+        """
+        :param dispatcher: instance of Dispatcher
+        :param maxsize: max count of queued events
+        :param workers: count of workers processing events
+        :param policy: one of :class:`QueuePolicy` values
+        :param low_priority: callable which checks raw event can be shed
+        """
+        if maxsize <= 0 or workers <= 0:
+            raise ValueError('`maxsize` and `workers` must be positive')
+        if policy not in (QueuePolicy.REJECT, QueuePolicy.BLOCK, QueuePolicy.SHED):
+            raise ValueError(f"Unknown policy: {policy}")
+
+        self.dispatcher = dispatcher
+        self.loop = dispatcher.loop
+        self.maxsize = maxsize
+        self.workers = workers
+        self.policy = policy
+        self.low_priority = low_priority
+
+        self._shards = self._create_shards()
+        self._tasks = []
+        self._closing = False
+
+        self.rejected = 0
+        self.shed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _create_shards(self):
+        return [_Shard(self.maxsize)]
+
+    def _get_shard(self, event):
+        return self._shards[0]
+
+    def _get_worker_shards(self):
+        return [self._shards[0]] * self.workers
+
+    @property
+    def depth(self):
+        """
+        Count of events waiting in the queue
+
+        :return:
+        """
+        return sum(len(shard.items) for shard in self._shards)
+
+    @property
+    def processed(self):
+        return sum(shard.processed for shard in self._shards)
+
+    def full(self):
+        return all(shard.full() for shard in self._shards)
+
+    def get_stats(self):
+        """
+        Get queue statistics
+
+        :return: dict
+        """
+        processed = self.processed
+        return {
+            'depth': self.depth,
+            'maxsize': self.maxsize,
+            'processed': processed,
+            'rejected': self.rejected,
+            'shed': self.shed,
+            'avg_wait': self._total_wait / processed if processed else 0.0,
+            'max_wait': self._max_wait,
+        }
+
+    def start(self):
+        """
+        Start workers
+        """
+        if self._tasks:
+            return
+        self._tasks = [self.loop.create_task(self._worker(shard)) for shard in self._get_worker_shards()]
+
+    async def close(self, timeout=None):
+        """
+        Stop accepting new events, wait until workers process queued events and stop them.
+
+        Queued events were already confirmed to VK, so they are dropped only when `timeout` is exceeded.
+
+        :param timeout: max time in seconds for processing of queued events (wait without limit if None)
+        """
+        self._closing = True
+        for shard in self._shards:
+            # Idle workers are stopped, blocked producers are rejected
+            for waiters in (shard.getters, shard.putters):
+                while waiters:
+                    waiter = waiters.popleft()
+                    if not waiter.done():
+                        waiter.set_result(None)
+
+        tasks, self._tasks = self._tasks, []
+        try:
+            if not tasks:
+                return
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            if pending:
+                logger.warning(f'Events queue is closed by timeout, {self.depth} events are dropped')
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            self._closing = False
+
+    async def put(self, event, policy=None):
+        """
+        Put event to the queue according to the queue policy
+
+        :param event: raw event
+        :param policy: override policy of the queue
+        :return: False if event is rejected and has to be retried by VK
+        """
+        if self._closing:
+            self.rejected += 1
+            return False
+
+        self.start()
+        if policy is None:
+            policy = self.policy
+
+        shard = self._get_shard(event)
+        if shard.full():
+            if policy == QueuePolicy.BLOCK:
+                while shard.full():
+                    waiter = self.loop.create_future()
+                    shard.putters.append(waiter)
+                    await waiter
+                    if self._closing:
+                        self.rejected += 1
+                        return False
+            elif policy == QueuePolicy.SHED and self.low_priority(event):
+                self.shed += 1
+                return True
+            elif policy == QueuePolicy.SHED and self._shed_queued(shard):
+                self.shed += 1
+            else:
+                self.rejected += 1
+                return False
+
+        shard.items.append((event, self.loop.time()))
+        self._wakeup(shard.getters)
+        return True
+
+    def _shed_queued(self, shard):
+        for item in shard.items:
+            event, _ = item
+            if self.low_priority(event):
+                shard.items.remove(item)
+                return True
+        return False
+
+    @staticmethod
+    def _wakeup(waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _worker(self, shard):
+        while True:
+            while not shard.items:
+                if self._closing:
+                    return
+                waiter = self.loop.create_future()
+                shard.getters.append(waiter)
+                await waiter
+
+            event, queued_at = shard.items.popleft()
+            self._wakeup(shard.putters)
+
+            wait = self.loop.time() - queued_at
+            shard.processed += 1
+            self._total_wait += wait
+            if wait > self._max_wait:
+                self._max_wait = wait
+
+            try:
+                await self.dispatcher.process_raw_event(event)
+            except Exception as e:
+                logger.exception(f'Cause exception while processing event: {e}')
+
+
+class ShardedEventQueue(EventQueue):
+    """
+    Events are spread by conversation over `workers` shards with one worker for each of them.
+
+    Events of the same conversation are processed one by one in order of receiving,
+    while different conversations are processed in parallel.
+    """
+
+    def __init__(self, dispatcher, maxsize=DEFAULT_QUEUE_SIZE, workers=DEFAULT_WORKERS,
+                 policy=QueuePolicy.REJECT, low_priority=is_low_priority, key=get_peer_key):
+        """
+        :param key: callable which returns conversation of the raw event
+        """
+        self.key = key
+        super(ShardedEventQueue, self).__init__(dispatcher, maxsize=maxsize, workers=workers, policy=policy,
+                                                low_priority=low_priority)
+
+    def _create_shards(self):
+        shard_size = max(1, -(-self.maxsize // self.workers))
+        return [_Shard(shard_size) for _ in range(self.workers)]
+
+    def _get_shard(self, event):
+        return self._shards[hash(self.key(event)) % len(self._shards)]
+
+    def _get_worker_shards(self):
+        return self._shards
+
+    def get_stats(self):
+        """
+        Get queue statistics with depth and count of processed events of each shard.
+
+        Hot shard is the shard with the biggest count of processed events,
+        its ratio is the share of the shard against the average.
+
+        :return: dict
+        """
+        stats = super(ShardedEventQueue, self).get_stats()
+        stats['shards'] = [{'depth': len(shard.items), 'processed': shard.processed} for shard in self._shards]
+
+        hot = max(range(len(self._shards)), key=lambda index: self._shards[index].processed)
+        average = stats['processed'] / len(self._shards)
+        stats['hot_shard'] = hot
+        stats['hot_shard_ratio'] = self._shards[hot].processed / average if average else 0.0
+        return stats
@@ -1,7 +1,9 @@
+import functools
 import typing
 from abc import ABC
 
 from ..types.exceptions import FSMStorageWarning
+from ..utils import context
 from ..utils.deprecated import warn_deprecated as warn
 
 # Leak bucket
@@ -13,13 +15,72 @@ EXCEEDED_COUNT = 'exceeded'
 DELTA = 'delta'
 THROTTLE_MANAGER = '$throttle_manager'
 
+# Per-event cache of states and data in the execution context: (chat, user) -> value
+USER_STATE = 'USER_STATE'
+USER_DATA = 'USER_DATA'
+
+# Methods of storages which change state or data, they reset the cache of the user
+CHANGING_METHODS = ('set_state', 'set_data', 'update_data', 'reset_state', 'reset_data', 'finish')
+
+
+def _get_event_cache(name, create=False):
+    try:
+        state = context.get_current_state()
+    except RuntimeError:  # Not in task
+        return None
+    cache = state.get(name)
+    if cache is None and create:
+        cache = state[name] = {}
+    return cache
+
+
+def reset_event_cache(*,
+                      chat: typing.Union[str, int, None] = None,
+                      user: typing.Union[str, int, None] = None):
+    """
+    Drop cached state and data of user in chat or of all users when both are not provided.
+
+    :param chat:
+    :param user:
+    """
+    if chat is None and user is None:
+        context.update_state({USER_STATE: None, USER_DATA: None})
+        return
+
+    key = BaseStorage.check_address(chat=chat, user=user)
+    for name in (USER_STATE, USER_DATA):
+        cache = _get_event_cache(name)
+        if cache:
+            cache.pop(key, None)
+
+
+def _resetting_event_cache(method):
+    @functools.wraps(method)
+    async def wrapper(self, *, chat=None, user=None, **kwargs):
+        try:
+            return await method(self, chat=chat, user=user, **kwargs)
+        finally:
+            if chat is not None or user is not None:
+                reset_event_cache(chat=chat, user=user)
+
+    return wrapper
+
 
 class BaseStorage:
     """
     You are able to save current user's state
     and data for all steps in states-storage
+
+    Methods which change state or data are wrapped in subclasses,
+    so cached results of :meth:`get_cached_state` and :meth:`get_cached_data` are dropped by them.
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super(BaseStorage, cls).__init_subclass__(**kwargs)
+        for name in CHANGING_METHODS:
+            if name in cls.__dict__:
+                setattr(cls, name, _resetting_event_cache(cls.__dict__[name]))
+
     async def close(self):
         """
         You have to override this method and use when application shutdowns.
@@ -94,6 +155,44 @@ class BaseStorage:
         """
         raise NotImplementedError
 
+    async def get_cached_state(self, *,
+                               chat: typing.Union[str, int, None] = None,
+                               user: typing.Union[str, int, None] = None) -> typing.Optional[str]:
+        """
+        Get current state of user in chat. State is requested from the storage once for the event
+        and kept in the execution context until it is changed.
+
+        :param chat:
+        :param user:
+        :return:
+        """
+        key = self.check_address(chat=chat, user=user)
+        cache = _get_event_cache(USER_STATE, create=True)
+        if cache is None:
+            return await self.get_state(chat=key[0], user=key[1])
+        if key not in cache:
+            cache[key] = await self.get_state(chat=key[0], user=key[1])
+        return cache[key]
+
+    async def get_cached_data(self, *,
+                              chat: typing.Union[str, int, None] = None,
+                              user: typing.Union[str, int, None] = None) -> typing.Dict:
+        """
+        Get state-data for user in chat. Data is requested from the storage once for the event
+        and kept in the execution context until it is changed, so don't modify the result.
+
+        :param chat:
+        :param user:
+        :return:
+        """
+        key = self.check_address(chat=chat, user=user)
+        cache = _get_event_cache(USER_DATA, create=True)
+        if cache is None:
+            return await self.get_data(chat=key[0], user=key[1])
+        if key not in cache:
+            cache[key] = await self.get_data(chat=key[0], user=key[1])
+        return cache[key]
+
     async def set_state(self, *,
                         chat: typing.Union[str, int, None] = None,
                         user: typing.Union[str, int, None] = None,
@@ -1,13 +1,15 @@
 import asyncio
 import asyncio.tasks
+import functools
 import ipaddress
 import logging
+import typing
 
 from aiohttp import web
 from aiohttp.web_exceptions import HTTPGone
 
 from avkapi.types.event import EventType, Event
-from avkapi.utils import context
+from avkapi.utils import context, json
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +22,8 @@ WEBHOOK = 'webhook'
 WEBHOOK_CONNECTION = 'WEBHOOK_CONNECTION'
 WEBHOOK_REQUEST = 'WEBHOOK_REQUEST'
 
+OK_RESPONSE_BODY = b'ok'
+
 # IP filter
 VK_IP_LOWER = ipaddress.IPv4Address('149.154.167.197')
 VK_IP_UPPER = ipaddress.IPv4Address('149.154.167.233')
@@ -43,6 +47,12 @@ def allow_ip(*ips: str):
 allow_ip(*(ip for ip in range(int(VK_IP_LOWER), int(VK_IP_UPPER) + 1)))
 
 
+@functools.lru_cache(maxsize=None)
+def _encode_confirmation(code: typing.Optional[str]) -> bytes:
+    # Empty body is returned when the code is not set
+    return (code or '').encode()
+
+
 class WebhookRequestHandler(web.View):
     """
     Simple Webhook request handler for aiohttp web server.
@@ -64,6 +74,9 @@ class WebhookRequestHandler(web.View):
 
     """
 
+    #: Decoder of request body. Can be replaced by any function which accepts bytes.
+    loads = staticmethod(json.loads)
+
     def get_dispatcher(self):
         """
         Get Dispatcher instance from environment
@@ -78,28 +91,42 @@ class WebhookRequestHandler(web.View):
             pass
         return dp
 
-    async def parse_event(self, vk):
+    async def read_event(self, vk):
         """
-        Read update from stream and deserialize it.
+        Read raw event from stream without deserializing it into objects.
 
         :param vk: VK instance. You an get it from Dispatcher
-        :return: :class:`avkapi.types.Update`
+        :return: event as :obj:`dict` or response for the confirmation request
         """
-        data = await self.request.json()
-        logger.debug(f'Received request: {self.request} {data}')
+        body = await self.request.read()
+        data = self.loads(body)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'Received request: {self.request} {body}')
 
         # check secret
-        result = await self.check_secret_key(vk, data)
-        if not result:
+        if not await self.check_secret_key(vk, data):
             raise web.HTTPForbidden(reason='Error: wrong callback secret')
 
         # check server confirmation
-        event_type = data.get('type')
-        if event_type and event_type == EventType.CONFIRMATION:
-            return web.Response(text=vk.confirmation_code)
+        if data.get('type') == EventType.CONFIRMATION:
+            return await self.confirm_server(vk)
+
+        return data
+
+    async def parse_event(self, vk):
+        """
+        Read update from stream and deserialize it.
+
+        :param vk: VK instance. You an get it from Dispatcher
+        :return: :class:`avkapi.types.Event`
+        """
+        data = await self.read_event(vk)
+        if isinstance(data, web.Response):
+            return data
 
         event = Event(**data)
-        logger.debug(f'New event: {event}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'New event: {event}')
         return event
 
     @staticmethod
@@ -111,7 +138,7 @@ class WebhookRequestHandler(web.View):
 
     @staticmethod
     async def confirm_server(vk):
-        return web.Response(text=vk.confirmation_code)
+        return web.Response(body=_encode_confirmation(vk.confirmation_code), content_type='text/plain')
 
     async def post(self):
         """ Process POST request """
@@ -122,10 +149,41 @@ class WebhookRequestHandler(web.View):
                               WEBHOOK_REQUEST: self.request})
 
         dispatcher = self.get_dispatcher()
-        event = await self.parse_event(dispatcher.vk)
+        data = await self.read_event(dispatcher.vk)
+        if isinstance(data, web.Response):
+            return data
+
+        if not dispatcher.has_handlers(data.get('type')):
+            return web.Response(body=OK_RESPONSE_BODY, content_type='text/plain')
+
+        if dispatcher.deduplicator is not None and await dispatcher.is_duplicate(data):
+            return web.Response(body=OK_RESPONSE_BODY, content_type='text/plain')
+
+        # Event object is built after the response is returned
+        if dispatcher.events_queue is None:
+            asyncio.ensure_future(dispatcher.process_raw_event(data))
+        else:
+            try:
+                accepted = await dispatcher.events_queue.put(data)
+            except asyncio.CancelledError:  # Client is disconnected while waiting for the free place
+                await dispatcher.forget_event(data)
+                raise
+            if not accepted:
+                await dispatcher.forget_event(data)
+                return self.respond_retry()
+        return web.Response(body=OK_RESPONSE_BODY, content_type='text/plain')
+
+    def respond_retry(self):
+        """
+        Ask VK to send event again later
 
-        asyncio.ensure_future(dispatcher.process_event(event))
-        return web.Response(text='ok')
+        :return: :class:`aiohttp.web.Response`
+        """
+        headers = {}
+        retry_after = self.request.app.get('RETRY_AFTER', None)
+        if retry_after:
+            headers['Retry-After'] = str(retry_after)
+        return web.Response(status=503, text='queue is full', headers=headers)
 
     async def get(self):
         self.validate_ip()
@@ -1 +1,7 @@
+from .base import BaseMethod
+from .batch import ExecuteBatcher
+from .generated import Docs, Groups, Photos, Users
+from .limiter import RateLimiter, RequestPriority
 from .messages import Messages
+from .retry import RetryPolicy
+from .tokens import Token, TokenPool, TokenStrategy
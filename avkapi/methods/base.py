@@ -1,30 +1,153 @@
+import asyncio
+import copy
 import logging
+
+from .limiter import RequestPriority
+from .retry import RetryPolicy
+from .tokens import TokenPool
+from ..types.exceptions import AuthorizationFailed, VKAPIError
+from ..utils import json
+
 logger = logging.getLogger(__name__)
 
+API_URL = 'https://api.vk.com/method/'
+
+
+def _join(value):
+    """
+    Convert list of values to the comma separated string
+
+    :param value:
+    :return:
+    """
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return ','.join(map(str, value))
+    return value
+
 
 class BaseMethod:
-    def __init__(self, session, access_token, api_version):
+    def __init__(self, session, access_token, api_version, batcher=None, priority=RequestPriority.NORMAL,
+                 retry_policy=None):
+        """
+        :param session: instance of :obj:`aiohttp.ClientSession`
+        :param access_token: access token or pool of tokens
+        :type access_token: :obj:`typing.Union[str, TokenPool]`
+        :param api_version:
+        :param batcher: instance of :obj:`avkapi.methods.batch.ExecuteBatcher`
+        :param priority: default priority of requests
+        :param retry_policy: instance of :obj:`avkapi.methods.retry.RetryPolicy`
+        """
+        if not isinstance(access_token, TokenPool):
+            access_token = TokenPool([access_token])
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
+
         self._session = session
-        self._access_token = access_token
+        self._tokens = access_token
         self._api_version = api_version
+        self._batcher = batcher
+        self._priority = priority
+        self._retry_policy = retry_policy
 
-    async def _api_request(self, method_name, parameters):
+    def prioritized(self, priority):
+        """
+        Get copy of this method group which sends requests with another priority
+
+        .. code-block:: python3
+
+            await vk.messages.prioritized(RequestPriority.LOW).send(...)
+
+        :param priority: one of :class:`avkapi.methods.limiter.RequestPriority` values
+        :return: method group
+        """
+        clone = copy.copy(self)
+        clone._priority = priority
+        return clone
+
+    async def _api_request(self, method_name, parameters, priority=None):
         """
 
         :param method_name:
         :type method_name: str
         :param parameters:
         :type parameters: dict
-        :return:
+        :param priority: override priority of the method group
+        :return: decoded `response` object
+        :raise: :obj:`avkapi.types.exceptions.VKAPIError`
         """
-        parameters['access_token'] = self._access_token
-        parameters['v'] = self._api_version
         p = {k: v for k, v in parameters.items() if v is not None}
-        link = f'https://api.vk.com/method/{method_name}'
+        return await self._call(method_name, p, priority)
+
+    async def _call(self, method_name, parameters, priority=None):
+        """
+        Call the method with parameters which are already prepared (without empty values)
+
+        :param method_name:
+        :type method_name: str
+        :param parameters: request data, it is changed by the request
+        :type parameters: dict
+        :param priority: override priority of the method group
+        :return: decoded `response` object
+        :raise: :obj:`avkapi.types.exceptions.VKAPIError`
+        """
+        if priority is None:
+            priority = self._priority
+
+        if self._batcher is not None and self._batcher.accepts(method_name):
+            return await self._batcher.call(method_name, parameters, priority)
+        data = await self._request(method_name, parameters, priority)
+        return data.get('response')
+
+    async def _request(self, method_name, parameters, priority=RequestPriority.NORMAL):
+        """
+        Send request to the API with one of the pool tokens as soon as its rate limit allows.
+
+        Requests failed with transient errors are retried according to the retry policy.
+
+        :param method_name:
+        :type method_name: str
+        :param parameters: parameters without empty values
+        :type parameters: dict
+        :param priority:
+        :return: decoded response body
+        :rtype: :obj:`dict`
+        :raise: :obj:`avkapi.types.exceptions.VKAPIError`
+        """
+        attempt = 0
+        while True:
+            try:
+                return await self._send(method_name, parameters, priority)
+            except VKAPIError as e:
+                if not self._retry_policy.should_retry(e, attempt):
+                    raise
+                delay = self._retry_policy.get_delay(attempt)
+                attempt += 1
+                logger.warning(f"Request '{method_name}' is failed: {e}. Retry #{attempt} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+    async def _send(self, method_name, parameters, priority):
+        token = await self._tokens.acquire(priority)
+
+        parameters['access_token'] = token.access_token
+        parameters['v'] = self._api_version
+        link = f'{API_URL}{method_name}'
+
+        # Server and transport errors (and cancellation) say nothing about the token, so they are not counted
+        async with self._session.post(link, data=parameters) as resp:
+            if resp.status >= 500:
+                resp.raise_for_status()
+            body = await resp.read()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'Response: {resp.status}, {body}')
 
-        async with self._session.post(link, params=p) as resp:
-            status = resp.status
-            text = await resp.text()
-            logger.info(f'Response: {status}, {text}')
+        data = json.loads(body)
+        error = data.get('error')
+        if error is not None:
+            error = VKAPIError.detect(error)
+            if isinstance(error, AuthorizationFailed):
+                self._tokens.report_failure(token)
+            raise error
 
-        return text
+        self._tokens.report_success(token)
+        return data
@@ -0,0 +1,158 @@
+import asyncio
+import logging
+
+from .limiter import RequestPriority
+from ..types.exceptions import VKAPIError
+from ..utils import json
+
+logger = logging.getLogger(__name__)
+
+# VK allows up to 25 API calls in one `execute` request
+MAX_EXECUTE_CALLS = 25
+DEFAULT_BATCH_DELAY = 0.01
+
+# Methods that can't be wrapped into VKScript
+NOT_BATCHABLE = {'execute'}
+
+
+class ExecuteBatcher:
+    """
+    Coalesce API calls made within a short window into `execute` requests.
+
+    Every caller awaits its own future and receives the same result (or exception)
+    as it would get from the direct request. Calls failed with transient errors inside `execute`
+    are put to the next batch according to the retry policy of the API.
+    """
+
+    def __init__(self, api, loop=None, delay=DEFAULT_BATCH_DELAY, max_calls=MAX_EXECUTE_CALLS):
+        """
+        :param api: method group used for sending `execute` requests
+        :type api: :obj:`avkapi.methods.base.BaseMethod`
+        :param loop: asyncio loop instance
+        :param delay: how long (in seconds) calls are collected before sending
+        :param max_calls: max count of calls in one `execute` request
+        """
+        if not 0 < max_calls <= MAX_EXECUTE_CALLS:
+            raise ValueError(f"`max_calls` must be in range 1..{MAX_EXECUTE_CALLS}")
+        if loop is None:
+            loop = asyncio.get_event_loop()
+
+        self.loop = loop
+        self.delay = delay
+        self.max_calls = max_calls
+
+        self._api = api
+        self._pending = []
+        self._flush_handle = None
+
+    @staticmethod
+    def accepts(method_name):
+        """
+        Check method can be called from `execute`
+
+        :param method_name:
+        :return:
+        """
+        return method_name not in NOT_BATCHABLE
+
+    async def call(self, method_name, parameters, priority=RequestPriority.NORMAL):
+        """
+        Add call to the current batch and wait for its own response
+
+        :param method_name:
+        :type method_name: str
+        :param parameters: API parameters without `access_token` and `v`
+        :type parameters: dict
+        :param priority: the batch is sent with the highest priority of its calls
+        :return: decoded `response` object
+        :raise: :obj:`avkapi.types.exceptions.VKAPIError`
+        """
+        future = self.loop.create_future()
+        self._add((method_name, parameters, priority, future, 0))
+        return await future
+
+    def _add(self, call):
+        self._pending.append(call)
+
+        if len(self._pending) >= self.max_calls:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self.loop.call_later(self.delay, self.flush)
+
+    def flush(self):
+        """
+        Send all collected calls without waiting for the end of the window
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, []
+        for start in range(0, len(pending), self.max_calls):
+            self.loop.create_task(self._execute(pending[start:start + self.max_calls]))
+
+    @staticmethod
+    def build_code(calls):
+        """
+        Generate VKScript code for list of calls
+
+        :param calls: list of (method_name, parameters) pairs
+        :return: VKScript code
+        :rtype: :obj:`str`
+        """
+        return 'return [' + ','.join(f"API.{method_name}({json.dumps(parameters)})"
+                                     for method_name, parameters in calls) + '];'
+
+    async def _execute(self, calls):
+        if len(calls) == 1:
+            # Nothing to coalesce
+            method_name, parameters, priority, future, _ = calls[0]
+            await self._resolve(future, self._api._request(method_name, parameters, priority))
+            return
+
+        code = self.build_code((method_name, parameters) for method_name, parameters, _, _, _ in calls)
+        priority = min(priority for _, _, priority, _, _ in calls)
+        logger.debug(f"Execute {len(calls)} calls in one request")
+        try:
+            data = await self._api._request('execute', {'code': code}, priority)
+        except Exception as e:
+            # Whole batch is failed
+            for _, _, _, future, _ in calls:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        results = data.get('response') or []
+        errors = iter(data.get('execute_errors') or [])
+        retry_policy = self._api._retry_policy
+        for index, call in enumerate(calls):
+            method_name, parameters, priority, future, attempt = call
+            if future.done():
+                continue
+            result = results[index] if index < len(results) else False
+            if result is False:
+                # Failed calls are returned as `false`, errors are listed in the same order
+                error = next(errors, None)
+                if error is not None:
+                    error = VKAPIError.detect(error)
+                    if retry_policy.should_retry(error, attempt):
+                        delay = retry_policy.get_delay(attempt)
+                        logger.warning(f"Call '{method_name}' is failed in execute: {error}. "
+                                       f"Retry #{attempt + 1} in {delay:.2f}s")
+                        self.loop.call_later(delay, self._add,
+                                             (method_name, parameters, priority, future, attempt + 1))
+                    else:
+                        future.set_exception(error)
+                    continue
+            future.set_result(result)
+
+    @staticmethod
+    async def _resolve(future, coro):
+        try:
+            result = await coro
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result.get('response'))
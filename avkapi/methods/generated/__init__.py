@@ -0,0 +1,6 @@
+# Generated by scripts/generate_methods.py from avkapi/schema/methods.json. Do not edit.
+from .docs import Docs
+from .groups import Groups
+from .messages import Messages
+from .photos import Photos
+from .users import Users
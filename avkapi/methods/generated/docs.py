@@ -0,0 +1,227 @@
+# Generated by scripts/generate_methods.py from avkapi/schema/methods.json. Do not edit.
+
+from ..base import BaseMethod, _join
+
+
+class Docs(BaseMethod):
+    """
+    Methods of `docs` section
+
+    https://vk.com/dev/methods
+    """
+
+    async def add(self, owner_id, doc_id, access_key=None, priority=None):
+        """
+        Copies a document to a user's or community's document list.
+
+        https://vk.com/dev/docs.add
+
+        :param owner_id: ID of the user or community that owns the document. Use a negative value to designate a
+            community ID.
+        :type owner_id: :obj:`int`
+        :param doc_id: Document ID.
+        :type doc_id: :obj:`int`
+        :param access_key: Access key. This parameter is required if 'access_key' was returned with the document's data.
+        :type access_key: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        params['owner_id'] = owner_id
+        params['doc_id'] = doc_id
+        if access_key is not None:
+            params['access_key'] = access_key
+        return await self._call('docs.add', params, priority)
+
+    async def delete(self, owner_id, doc_id, priority=None):
+        """
+        Deletes a user or community document.
+
+        https://vk.com/dev/docs.delete
+
+        :param owner_id: ID of the user or community that owns the document. Use a negative value to designate a
+            community ID.
+        :type owner_id: :obj:`int`
+        :param doc_id: Document ID.
+        :type doc_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['owner_id'] = owner_id
+        params['doc_id'] = doc_id
+        return await self._call('docs.delete', params, priority)
+
+    async def edit(self, owner_id, doc_id, title=None, tags=None, priority=None):
+        """
+        Edits a document.
+
+        https://vk.com/dev/docs.edit
+
+        :param owner_id: User ID or community ID. Use a negative value to designate a community ID.
+        :type owner_id: :obj:`int`
+        :param doc_id: Document ID.
+        :type doc_id: :obj:`int`
+        :param title: Document title.
+        :type title: :obj:`str`
+        :param tags: Document tags.
+        :type tags: :obj:`list`
+        :return: `response` object
+        """
+        params = {}
+        params['owner_id'] = owner_id
+        params['doc_id'] = doc_id
+        if title is not None:
+            params['title'] = title
+        if tags is not None:
+            params['tags'] = _join(tags)
+        return await self._call('docs.edit', params, priority)
+
+    async def get(self, count=None, offset=None, owner_id=None, priority=None):
+        """
+        Returns detailed information about user or community documents.
+
+        https://vk.com/dev/docs.get
+
+        :param count: Number of documents to return. By default, all documents.
+        :type count: :obj:`int`
+        :param offset: Offset needed to return a specific subset of documents.
+        :type offset: :obj:`int`
+        :param owner_id: ID of the user or community that owns the documents. Use a negative value to designate a
+            community ID.
+        :type owner_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if count is not None:
+            params['count'] = count
+        if offset is not None:
+            params['offset'] = offset
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        return await self._call('docs.get', params, priority)
+
+    async def get_by_id(self, docs, priority=None):
+        """
+        Returns information about documents by their IDs.
+
+        https://vk.com/dev/docs.getById
+
+        :param docs: Document IDs. Example: , "66748_91488,66748_91455",
+        :type docs: :obj:`list`
+        :return: `response` object
+        """
+        params = {}
+        params['docs'] = _join(docs)
+        return await self._call('docs.getById', params, priority)
+
+    async def get_messages_upload_server(self, type=None, peer_id=None, priority=None):
+        """
+        Returns the server address for document upload.
+
+        https://vk.com/dev/docs.getMessagesUploadServer
+
+        :param type: Document type.
+        :type type: :obj:`str`
+        :param peer_id: Destination ID. "For user: 'User ID', e.g. '12345'. For chat: '2000000000' + 'Chat ID', e.g.
+            '2000000001'. For community: '- Community ID', e.g. '-12345'. "
+        :type peer_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if type is not None:
+            params['type'] = type
+        if peer_id is not None:
+            params['peer_id'] = peer_id
+        return await self._call('docs.getMessagesUploadServer', params, priority)
+
+    async def get_types(self, owner_id, priority=None):
+        """
+        Returns documents types available for current user.
+
+        https://vk.com/dev/docs.getTypes
+
+        :param owner_id: ID of the user or community that owns the documents. Use a negative value to designate a
+            community ID.
+        :type owner_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['owner_id'] = owner_id
+        return await self._call('docs.getTypes', params, priority)
+
+    async def get_upload_server(self, group_id=None, priority=None):
+        """
+        Returns the server address for document upload.
+
+        https://vk.com/dev/docs.getUploadServer
+
+        :param group_id: Community ID (if the document will be uploaded to the community).
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if group_id is not None:
+            params['group_id'] = group_id
+        return await self._call('docs.getUploadServer', params, priority)
+
+    async def get_wall_upload_server(self, group_id=None, priority=None):
+        """
+        Returns the server address for document upload onto a user's or community's wall.
+
+        https://vk.com/dev/docs.getWallUploadServer
+
+        :param group_id: Community ID (if the document will be uploaded to the community).
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if group_id is not None:
+            params['group_id'] = group_id
+        return await self._call('docs.getWallUploadServer', params, priority)
+
+    async def save(self, file, title=None, tags=None, priority=None):
+        """
+        Saves a document after [vk.com/dev/upload_files_2|uploading it to a server].
+
+        https://vk.com/dev/docs.save
+
+        :param file: This parameter is returned when the file is [vk.com/dev/upload_files_2|uploaded to the server].
+        :type file: :obj:`str`
+        :param title: Document title.
+        :type title: :obj:`str`
+        :param tags: Document tags.
+        :type tags: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        params['file'] = file
+        if title is not None:
+            params['title'] = title
+        if tags is not None:
+            params['tags'] = tags
+        return await self._call('docs.save', params, priority)
+
+    async def search(self, q, search_own=None, count=None, offset=None, priority=None):
+        """
+        Returns a list of documents matching the search criteria.
+
+        https://vk.com/dev/docs.search
+
+        :param q: Search query string.
+        :type q: :obj:`str`
+        :param search_own:
+        :type search_own: :obj:`bool`
+        :param count: Number of results to return.
+        :type count: :obj:`int`
+        :param offset: Offset needed to return a specific subset of results.
+        :type offset: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['q'] = q
+        if search_own is not None:
+            params['search_own'] = int(search_own)
+        if count is not None:
+            params['count'] = count
+        if offset is not None:
+            params['offset'] = offset
+        return await self._call('docs.search', params, priority)
@@ -0,0 +1,1293 @@
+# Generated by scripts/generate_methods.py from avkapi/schema/methods.json. Do not edit.
+
+from ..base import BaseMethod, _join
+
+
+class Groups(BaseMethod):
+    """
+    Methods of `groups` section
+
+    https://vk.com/dev/methods
+    """
+
+    async def add_link(self, group_id, link, text=None, priority=None):
+        """
+        Allows to add a link to the community.
+
+        https://vk.com/dev/groups.addLink
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :param link: Link URL.
+        :type link: :obj:`str`
+        :param text: Description text for the link.
+        :type text: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        params['link'] = link
+        if text is not None:
+            params['text'] = text
+        return await self._call('groups.addLink', params, priority)
+
+    async def approve_request(self, group_id, user_id, priority=None):
+        """
+        Allows to approve join request to the community.
+
+        https://vk.com/dev/groups.approveRequest
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :param user_id: User ID.
+        :type user_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        params['user_id'] = user_id
+        return await self._call('groups.approveRequest', params, priority)
+
+    async def ban_user(self, group_id, user_id, end_date=None, reason=None, comment=None, comment_visible=None,
+                       priority=None):
+        """
+        Adds a user to a community blacklist.
+
+        https://vk.com/dev/groups.banUser
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :param user_id: User ID.
+        :type user_id: :obj:`int`
+        :param end_date: Date (in Unix time) when the user will be removed from the blacklist.
+        :type end_date: :obj:`int`
+        :param reason: Reason for ban: '1' — spam, '2' — verbal abuse, '3' — strong language, '4' — irrelevant messages,
+            '0' — other (default)
+        :type reason: :obj:`int`
+        :param comment: Text of comment to ban.
+        :type comment: :obj:`str`
+        :param comment_visible: '1' — text of comment will be visible to the user,, '0' — text of comment will be
+            invisible to the user. By default: '0'.
+        :type comment_visible: :obj:`bool`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        params['user_id'] = user_id
+        if end_date is not None:
+            params['end_date'] = end_date
+        if reason is not None:
+            params['reason'] = reason
+        if comment is not None:
+            params['comment'] = comment
+        if comment_visible is not None:
+            params['comment_visible'] = int(comment_visible)
+        return await self._call('groups.banUser', params, priority)
+
+    async def create(self, title, description=None, type=None, public_category=None, subtype=None, priority=None):
+        """
+        Creates a new community.
+
+        https://vk.com/dev/groups.create
+
+        :param title: Community title.
+        :type title: :obj:`str`
+        :param description: Community description (ignored for 'type' = 'public').
+        :type description: :obj:`str`
+        :param type: Community type. Possible values: *'group' – group,, *'event' – event,, *'public' – public page
+        :type type: :obj:`str`
+        :param public_category: Category ID (for 'type' = 'public' only).
+        :type public_category: :obj:`int`
+        :param subtype: Public page subtype. Possible values: *'1' – place or small business,, *'2' – company,
+            organization or website,, *'3' – famous person or group of people,, *'4' – product or work of art.
+        :type subtype: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['title'] = title
+        if description is not None:
+            params['description'] = description
+        if type is not None:
+            params['type'] = type
+        if public_category is not None:
+            params['public_category'] = public_category
+        if subtype is not None:
+            params['subtype'] = subtype
+        return await self._call('groups.create', params, priority)
+
+    async def delete_link(self, group_id, link_id, priority=None):
+        """
+        Allows to delete a link from the community.
+
+        https://vk.com/dev/groups.deleteLink
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :param link_id: Link ID.
+        :type link_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        params['link_id'] = link_id
+        return await self._call('groups.deleteLink', params, priority)
+
+    async def edit(self, group_id, title=None, description=None, screen_name=None, access=None, website=None,
+                   subject=None, email=None, phone=None, rss=None, event_start_date=None,
+                   event_finish_date=None, event_group_id=None, public_category=None,
+                   public_subcategory=None, public_date=None, wall=None, topics=None, photos=None,
+                   video=None, audio=None, links=None, events=None, places=None, contacts=None,
+                   docs=None, wiki=None, messages=None, age_limits=None, market=None,
+                   market_comments=None, market_country=None, market_city=None, market_currency=None,
+                   market_contact=None, market_wiki=None, obscene_filter=None, obscene_stopwords=None,
+                   obscene_words=None, priority=None):
+        """
+        Edits a community.
+
+        https://vk.com/dev/groups.edit
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :param title: Community title.
+        :type title: :obj:`str`
+        :param description: Community description.
+        :type description: :obj:`str`
+        :param screen_name: Community screen name.
+        :type screen_name: :obj:`str`
+        :param access: Community type. Possible values: *'0' – open,, *'1' – closed,, *'2' – private.
+        :type access: :obj:`int`
+        :param website: Website that will be displayed in the community information field.
+        :type website: :obj:`str`
+        :param subject: Community subject. Possible values: , *'1' – auto/moto,, *'2' – activity holidays,, *'3' –
+            business,, *'4' – pets,, *'5' – health,, *'6' – dating and communication, , *'7' – games,, *'8' – IT
+            (computers and software),, *'9' – cinema,, *'10' – beauty and fashion,, *'11' – cooking,, *'12' – art and
+            culture,, *'13' – literature,, *'14' – mobile services and internet,, *'15' – music,, *'16' – science and
+            technology,, *'17' – real estate,, *'18' – news and media,, *'19' – security,, *'20' – education,, *'21' –
+            home and renovations,, *'22' – politics,, *'23' – food,, *'24' – industry,, *'25' – travel,, *'26' – work,,
+            *'27' – entertainment,, *'28' – religion,, *'29' – family,, *'30' – sports,, *'31' – insurance,, *'32' –
+            television,, *'33' – goods and services,, *'34' – hobbies,, *'35' – finance,, *'36' – photo,, *'37' –
+            esoterics,, *'38' – electronics and appliances,, *'39' – erotic,, *'40' – humor,, *'41' – society,
+            humanities,, *'42' – design and graphics.
+        :type subject: :obj:`str`
+        :param email: Organizer email (for events).
+        :type email: :obj:`str`
+        :param phone: Organizer phone number (for events).
+        :type phone: :obj:`str`
+        :param rss: RSS feed address for import (available only to communities with special permission. Contact
+            vk.com/support to get it.
+        :type rss: :obj:`str`
+        :param event_start_date: Event start date in Unixtime format.
+        :type event_start_date: :obj:`int`
+        :param event_finish_date: Event finish date in Unixtime format.
+        :type event_finish_date: :obj:`int`
+        :param event_group_id: Organizer community ID (for events only).
+        :type event_group_id: :obj:`int`
+        :param public_category: Public page category ID.
+        :type public_category: :obj:`int`
+        :param public_subcategory: Public page subcategory ID.
+        :type public_subcategory: :obj:`int`
+        :param public_date: Founding date of a company or organization owning the community in "dd.mm.YYYY" format.
+        :type public_date: :obj:`str`
+        :param wall: Wall settings. Possible values: *'0' – disabled,, *'1' – open,, *'2' – limited (groups and events
+            only),, *'3' – closed (groups and events only).
+        :type wall: :obj:`int`
+        :param topics: Board topics settings. Possbile values: , *'0' – disabled,, *'1' – open,, *'2' – limited (for
+            groups and events only).
+        :type topics: :obj:`int`
+        :param photos: Photos settings. Possible values: *'0' – disabled,, *'1' – open,, *'2' – limited (for groups and
+            events only).
+        :type photos: :obj:`int`
+        :param video: Video settings. Possible values: *'0' – disabled,, *'1' – open,, *'2' – limited (for groups and
+            events only).
+        :type video: :obj:`int`
+        :param audio: Audio settings. Possible values: *'0' – disabled,, *'1' – open,, *'2' – limited (for groups and
+            events only).
+        :type audio: :obj:`int`
+        :param links: Links settings (for public pages only). Possible values: *'0' – disabled,, *'1' – enabled.
+        :type links: :obj:`bool`
+        :param events: Events settings (for public pages only). Possible values: *'0' – disabled,, *'1' – enabled.
+        :type events: :obj:`bool`
+        :param places: Places settings (for public pages only). Possible values: *'0' – disabled,, *'1' – enabled.
+        :type places: :obj:`bool`
+        :param contacts: Contacts settings (for public pages only). Possible values: *'0' – disabled,, *'1' – enabled.
+        :type contacts: :obj:`bool`
+        :param docs: Documents settings. Possible values: *'0' – disabled,, *'1' – open,, *'2' – limited (for groups and
+            events only).
+        :type docs: :obj:`int`
+        :param wiki: Wiki pages settings. Possible values: *'0' – disabled,, *'1' – open,, *'2' – limited (for groups
+            and events only).
+        :type wiki: :obj:`int`
+        :param messages: Community messages. Possible values: *'0' — disabled,, *'1' — enabled.
+        :type messages: :obj:`bool`
+        :param age_limits: Community age limits. Possible values: *'1' — no limits,, *'2' — 16+,, *'3' — 18+.
+        :type age_limits: :obj:`int`
+        :param market: Market settings. Possible values: *'0' – disabled,, *'1' – enabled.
+        :type market: :obj:`bool`
+        :param market_comments: market comments settings. Possible values: *'0' – disabled,, *'1' – enabled.
+        :type market_comments: :obj:`bool`
+        :param market_country: Market delivery countries.
+        :type market_country: :obj:`list`
+        :param market_city: Market delivery cities (if only one country is specified).
+        :type market_city: :obj:`list`
+        :param market_currency: Market currency settings. Possbile values: , *'643' – Russian rubles,, *'980' –
+            Ukrainian hryvnia,, *'398' – Kazakh tenge,, *'978' – Euro,, *'840' – US dollars
+        :type market_currency: :obj:`int`
+        :param market_contact: Seller contact for market. Set '0' for community messages.
+        :type market_contact: :obj:`int`
+        :param market_wiki: ID of a wiki page with market description.
+        :type market_wiki: :obj:`int`
+        :param obscene_filter: Obscene expressions filter in comments. Possible values: , *'0' – disabled,, *'1' –
+            enabled.
+        :type obscene_filter: :obj:`bool`
+        :param obscene_stopwords: Stopwords filter in comments. Possible values: , *'0' – disabled,, *'1' – enabled.
+        :type obscene_stopwords: :obj:`bool`
+        :param obscene_words: Keywords for stopwords filter.
+        :type obscene_words: :obj:`list`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        if title is not None:
+            params['title'] = title
+        if description is not None:
+            params['description'] = description
+        if screen_name is not None:
+            params['screen_name'] = screen_name
+        if access is not None:
+            params['access'] = access
+        if website is not None:
+            params['website'] = website
+        if subject is not None:
+            params['subject'] = subject
+        if email is not None:
+            params['email'] = email
+        if phone is not None:
+            params['phone'] = phone
+        if rss is not None:
+            params['rss'] = rss
+        if event_start_date is not None:
+            params['event_start_date'] = event_start_date
+        if event_finish_date is not None:
+            params['event_finish_date'] = event_finish_date
+        if event_group_id is not None:
+            params['event_group_id'] = event_group_id
+        if public_category is not None:
+            params['public_category'] = public_category
+        if public_subcategory is not None:
+            params['public_subcategory'] = public_subcategory
+        if public_date is not None:
+            params['public_date'] = public_date
+        if wall is not None:
+            params['wall'] = wall
+        if topics is not None:
+            params['topics'] = topics
+        if photos is not None:
+            params['photos'] = photos
+        if video is not None:
+            params['video'] = video
+        if audio is not None:
+            params['audio'] = audio
+        if links is not None:
+            params['links'] = int(links)
+        if events is not None:
+            params['events'] = int(events)
+        if places is not None:
+            params['places'] = int(places)
+        if contacts is not None:
+            params['contacts'] = int(contacts)
+        if docs is not None:
+            params['docs'] = docs
+        if wiki is not None:
+            params['wiki'] = wiki
+        if messages is not None:
+            params['messages'] = int(messages)
+        if age_limits is not None:
+            params['age_limits'] = age_limits
+        if market is not None:
+            params['market'] = int(market)
+        if market_comments is not None:
+            params['market_comments'] = int(market_comments)
+        if market_country is not None:
+            params['market_country'] = _join(market_country)
+        if market_city is not None:
+            params['market_city'] = _join(market_city)
+        if market_currency is not None:
+            params['market_currency'] = market_currency
+        if market_contact is not None:
+            params['market_contact'] = market_contact
+        if market_wiki is not None:
+            params['market_wiki'] = market_wiki
+        if obscene_filter is not None:
+            params['obscene_filter'] = int(obscene_filter)
+        if obscene_stopwords is not None:
+            params['obscene_stopwords'] = int(obscene_stopwords)
+        if obscene_words is not None:
+            params['obscene_words'] = _join(obscene_words)
+        return await self._call('groups.edit', params, priority)
+
+    async def edit_link(self, group_id, link_id, text=None, priority=None):
+        """
+        Allows to edit a link in the community.
+
+        https://vk.com/dev/groups.editLink
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :param link_id: Link ID.
+        :type link_id: :obj:`int`
+        :param text: New description text for the link.
+        :type text: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        params['link_id'] = link_id
+        if text is not None:
+            params['text'] = text
+        return await self._call('groups.editLink', params, priority)
+
+    async def edit_manager(self, group_id, user_id, role=None, is_contact=None, contact_position=None,
+                           contact_phone=None, contact_email=None, priority=None):
+        """
+        Allows to add, remove or edit the community manager.
+
+        https://vk.com/dev/groups.editManager
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :param user_id: User ID.
+        :type user_id: :obj:`int`
+        :param role: Manager role. Possible values: *'moderator',, *'editor',, *'administrator'.
+        :type role: :obj:`str`
+        :param is_contact: '1' — to show the manager in Contacts block of the community.
+        :type is_contact: :obj:`bool`
+        :param contact_position: Position to show in Contacts block.
+        :type contact_position: :obj:`str`
+        :param contact_phone: Contact phone.
+        :type contact_phone: :obj:`str`
+        :param contact_email: Contact e-mail.
+        :type contact_email: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        params['user_id'] = user_id
+        if role is not None:
+            params['role'] = role
+        if is_contact is not None:
+            params['is_contact'] = int(is_contact)
+        if contact_position is not None:
+            params['contact_position'] = contact_position
+        if contact_phone is not None:
+            params['contact_phone'] = contact_phone
+        if contact_email is not None:
+            params['contact_email'] = contact_email
+        return await self._call('groups.editManager', params, priority)
+
+    async def edit_place(self, group_id, title=None, address=None, country_id=None, city_id=None, latitude=None,
+                         longitude=None, priority=None):
+        """
+        Edits the place in community.
+
+        https://vk.com/dev/groups.editPlace
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :param title: Place title.
+        :type title: :obj:`str`
+        :param address: Place address.
+        :type address: :obj:`str`
+        :param country_id: Country ID.
+        :type country_id: :obj:`int`
+        :param city_id: City ID.
+        :type city_id: :obj:`int`
+        :param latitude: Geographical latitude.
+        :type latitude: :obj:`float`
+        :param longitude: Geographical longitude.
+        :type longitude: :obj:`float`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        if title is not None:
+            params['title'] = title
+        if address is not None:
+            params['address'] = address
+        if country_id is not None:
+            params['country_id'] = country_id
+        if city_id is not None:
+            params['city_id'] = city_id
+        if latitude is not None:
+            params['latitude'] = latitude
+        if longitude is not None:
+            params['longitude'] = longitude
+        return await self._call('groups.editPlace', params, priority)
+
+    async def get(self, user_id=None, extended=None, filter=None, fields=None, offset=None, count=None, priority=None):
+        """
+        Returns a list of the communities to which a user belongs.
+
+        https://vk.com/dev/groups.get
+
+        :param user_id: User ID.
+        :type user_id: :obj:`int`
+        :param extended: '1' — to return complete information about a user's communities, '0' — to return a list of
+            community IDs without any additional fields (default),
+        :type extended: :obj:`bool`
+        :param filter: Types of communities to return: 'admin' — to return communities administered by the user ,
+            'editor' — to return communities where the user is an administrator or editor, 'moder' — to return
+            communities where the user is an administrator, editor, or moderator, 'groups' — to return only groups,
+            'publics' — to return only public pages, 'events' — to return only events
+        :type filter: :obj:`list`
+        :param fields: Profile fields to return.
+        :type fields: :obj:`list`
+        :param offset: Offset needed to return a specific subset of communities.
+        :type offset: :obj:`int`
+        :param count: Number of communities to return.
+        :type count: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if user_id is not None:
+            params['user_id'] = user_id
+        if extended is not None:
+            params['extended'] = int(extended)
+        if filter is not None:
+            params['filter'] = _join(filter)
+        if fields is not None:
+            params['fields'] = _join(fields)
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        return await self._call('groups.get', params, priority)
+
+    async def get_banned(self, group_id, offset=None, count=None, fields=None, user_id=None, priority=None):
+        """
+        Returns a list of users on a community blacklist.
+
+        https://vk.com/dev/groups.getBanned
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :param offset: Offset needed to return a specific subset of users.
+        :type offset: :obj:`int`
+        :param count: Number of users to return.
+        :type count: :obj:`int`
+        :param fields:
+        :type fields: :obj:`list`
+        :param user_id:
+        :type user_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        if fields is not None:
+            params['fields'] = _join(fields)
+        if user_id is not None:
+            params['user_id'] = user_id
+        return await self._call('groups.getBanned', params, priority)
+
+    async def get_by_id(self, group_ids=None, group_id=None, fields=None, priority=None):
+        """
+        Returns information about communities by their IDs.
+
+        https://vk.com/dev/groups.getById
+
+        :param group_ids: IDs or screen names of communities.
+        :type group_ids: :obj:`list`
+        :param group_id: ID or screen name of the community.
+        :type group_id: :obj:`str`
+        :param fields: Group fields to return.
+        :type fields: :obj:`list`
+        :return: `response` object
+        """
+        params = {}
+        if group_ids is not None:
+            params['group_ids'] = _join(group_ids)
+        if group_id is not None:
+            params['group_id'] = group_id
+        if fields is not None:
+            params['fields'] = _join(fields)
+        return await self._call('groups.getById', params, priority)
+
+    async def get_callback_confirmation_code(self, group_id, priority=None):
+        """
+        Returns Callback API confirmation code for the community.
+
+        https://vk.com/dev/groups.getCallbackConfirmationCode
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        return await self._call('groups.getCallbackConfirmationCode', params, priority)
+
+    async def get_callback_settings(self, group_id, server_id=None, priority=None):
+        """
+        Returns [vk.com/dev/callback_api|Callback API] notifications settings.
+
+        https://vk.com/dev/groups.getCallbackSettings
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :param server_id: Server ID.
+        :type server_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        if server_id is not None:
+            params['server_id'] = server_id
+        return await self._call('groups.getCallbackSettings', params, priority)
+
+    async def get_catalog(self, category_id=None, subcategory_id=None, priority=None):
+        """
+        Returns communities list for a catalog category.
+
+        https://vk.com/dev/groups.getCatalog
+
+        :param category_id: Category id received from [vk.com/dev/groups.getCatalogInfo|groups.getCatalogInfo].
+        :type category_id: :obj:`int`
+        :param subcategory_id: Subcategory id received from [vk.com/dev/groups.getCatalogInfo|groups.getCatalogInfo].
+        :type subcategory_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if category_id is not None:
+            params['category_id'] = category_id
+        if subcategory_id is not None:
+            params['subcategory_id'] = subcategory_id
+        return await self._call('groups.getCatalog', params, priority)
+
+    async def get_catalog_info(self, extended=None, subcategories=None, priority=None):
+        """
+        Returns categories list for communities catalog
+
+        https://vk.com/dev/groups.getCatalogInfo
+
+        :param extended: 1 – to return communities count and three communities for preview. By default: 0.
+        :type extended: :obj:`bool`
+        :param subcategories: 1 – to return subcategories info. By default: 0.
+        :type subcategories: :obj:`bool`
+        :return: `response` object
+        """
+        params = {}
+        if extended is not None:
+            params['extended'] = int(extended)
+        if subcategories is not None:
+            params['subcategories'] = int(subcategories)
+        return await self._call('groups.getCatalogInfo', params, priority)
+
+    async def get_invited_users(self, group_id, offset=None, count=None, fields=None, name_case=None, priority=None):
+        """
+        Returns invited users list of a community
+
+        https://vk.com/dev/groups.getInvitedUsers
+
+        :param group_id: Group ID to return invited users for.
+        :type group_id: :obj:`int`
+        :param offset: Offset needed to return a specific subset of results.
+        :type offset: :obj:`int`
+        :param count: Number of results to return.
+        :type count: :obj:`int`
+        :param fields: List of additional fields to be returned. Available values: 'sex, bdate, city, country, photo_50,
+            photo_100, photo_200_orig, photo_200, photo_400_orig, photo_max, photo_max_orig, online, online_mobile,
+            lists, domain, has_mobile, contacts, connections, site, education, universities, schools, can_post,
+            can_see_all_posts, can_see_audio, can_write_private_message, status, last_seen, common_count, relation,
+            relatives, counters'.
+        :type fields: :obj:`list`
+        :param name_case: Case for declension of user name and surname. Possible values: *'nom' — nominative (default),,
+            *'gen' — genitive,, *'dat' — dative,, *'acc' — accusative, , *'ins' — instrumental,, *'abl' — prepositional.
+        :type name_case: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        if fields is not None:
+            params['fields'] = _join(fields)
+        if name_case is not None:
+            params['name_case'] = name_case
+        return await self._call('groups.getInvitedUsers', params, priority)
+
+    async def get_invites(self, offset=None, count=None, extended=None, priority=None):
+        """
+        Returns a list of invitations to join communities and events.
+
+        https://vk.com/dev/groups.getInvites
+
+        :param offset: Offset needed to return a specific subset of invitations.
+        :type offset: :obj:`int`
+        :param count: Number of invitations to return.
+        :type count: :obj:`int`
+        :param extended: '1' — to return additional [vk.com/dev/fields_groups|fields] for communities..
+        :type extended: :obj:`bool`
+        :return: `response` object
+        """
+        params = {}
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        if extended is not None:
+            params['extended'] = int(extended)
+        return await self._call('groups.getInvites', params, priority)
+
+    async def get_long_poll_server(self, group_id, priority=None):
+        """
+        Returns the data needed to query a Long Poll server for events
+
+        https://vk.com/dev/groups.getLongPollServer
+
+        :param group_id: Community ID
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        return await self._call('groups.getLongPollServer', params, priority)
+
+    async def get_long_poll_settings(self, group_id, priority=None):
+        """
+        Returns Long Poll notification settings
+
+        https://vk.com/dev/groups.getLongPollSettings
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        return await self._call('groups.getLongPollSettings', params, priority)
+
+    async def get_members(self, group_id=None, sort=None, offset=None, count=None, fields=None, filter=None,
+                          priority=None):
+        """
+        Returns a list of community members.
+
+        https://vk.com/dev/groups.getMembers
+
+        :param group_id: ID or screen name of the community.
+        :type group_id: :obj:`str`
+        :param sort: Sort order. Available values: 'id_asc', 'id_desc', 'time_asc', 'time_desc'. 'time_asc' and
+            'time_desc' are availavle only if the method is called by the group's 'moderator'.
+        :type sort: :obj:`str`
+        :param offset: Offset needed to return a specific subset of community members.
+        :type offset: :obj:`int`
+        :param count: Number of community members to return.
+        :type count: :obj:`int`
+        :param fields: List of additional fields to be returned. Available values: 'sex, bdate, city, country, photo_50,
+            photo_100, photo_200_orig, photo_200, photo_400_orig, photo_max, photo_max_orig, online, online_mobile,
+            lists, domain, has_mobile, contacts, connections, site, education, universities, schools, can_post,
+            can_see_all_posts, can_see_audio, can_write_private_message, status, last_seen, common_count, relation,
+            relatives, counters'.
+        :type fields: :obj:`list`
+        :param filter: *'friends' – only friends in this community will be returned,, *'unsure' – only those who pressed
+            'I may attend' will be returned (if it's an event).
+        :type filter: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        if group_id is not None:
+            params['group_id'] = group_id
+        if sort is not None:
+            params['sort'] = sort
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        if fields is not None:
+            params['fields'] = _join(fields)
+        if filter is not None:
+            params['filter'] = filter
+        return await self._call('groups.getMembers', params, priority)
+
+    async def get_requests(self, group_id, offset=None, count=None, fields=None, priority=None):
+        """
+        Returns a list of requests to the community.
+
+        https://vk.com/dev/groups.getRequests
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :param offset: Offset needed to return a specific subset of results.
+        :type offset: :obj:`int`
+        :param count: Number of results to return.
+        :type count: :obj:`int`
+        :param fields: Profile fields to return.
+        :type fields: :obj:`list`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        if fields is not None:
+            params['fields'] = _join(fields)
+        return await self._call('groups.getRequests', params, priority)
+
+    async def get_settings(self, group_id, priority=None):
+        """
+        Returns community settings.
+
+        https://vk.com/dev/groups.getSettings
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        return await self._call('groups.getSettings', params, priority)
+
+    async def invite(self, group_id, user_id, priority=None):
+        """
+        Allows to invite friends to the community.
+
+        https://vk.com/dev/groups.invite
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :param user_id: User ID.
+        :type user_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        params['user_id'] = user_id
+        return await self._call('groups.invite', params, priority)
+
+    async def is_member(self, group_id, user_id=None, user_ids=None, extended=None, priority=None):
+        """
+        Returns information specifying whether a user is a member of a community.
+
+        https://vk.com/dev/groups.isMember
+
+        :param group_id: ID or screen name of the community.
+        :type group_id: :obj:`str`
+        :param user_id: User ID.
+        :type user_id: :obj:`int`
+        :param user_ids: User IDs.
+        :type user_ids: :obj:`list`
+        :param extended: '1' — to return an extended response with additional fields. By default: '0'.
+        :type extended: :obj:`bool`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        if user_id is not None:
+            params['user_id'] = user_id
+        if user_ids is not None:
+            params['user_ids'] = _join(user_ids)
+        if extended is not None:
+            params['extended'] = int(extended)
+        return await self._call('groups.isMember', params, priority)
+
+    async def join(self, group_id=None, not_sure=None, priority=None):
+        """
+        With this method you can join the group or public page, and also confirm your participation in an event.
+
+        https://vk.com/dev/groups.join
+
+        :param group_id: ID or screen name of the community.
+        :type group_id: :obj:`int`
+        :param not_sure: Optional parameter which is taken into account when 'gid' belongs to the event: '1' — Perhaps I
+            will attend, '0' — I will be there for sure (default), ,
+        :type not_sure: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        if group_id is not None:
+            params['group_id'] = group_id
+        if not_sure is not None:
+            params['not_sure'] = not_sure
+        return await self._call('groups.join', params, priority)
+
+    async def leave(self, group_id, priority=None):
+        """
+        With this method you can leave a group, public page, or event.
+
+        https://vk.com/dev/groups.leave
+
+        :param group_id: ID or screen name of the community.
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        return await self._call('groups.leave', params, priority)
+
+    async def remove_user(self, group_id, user_id, priority=None):
+        """
+        Removes a user from the community.
+
+        https://vk.com/dev/groups.removeUser
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :param user_id: User ID.
+        :type user_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        params['user_id'] = user_id
+        return await self._call('groups.removeUser', params, priority)
+
+    async def reorder_link(self, group_id, link_id, after=None, priority=None):
+        """
+        Allows to reorder links in the community.
+
+        https://vk.com/dev/groups.reorderLink
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :param link_id: Link ID.
+        :type link_id: :obj:`int`
+        :param after: ID of the link after which to place the link with 'link_id'.
+        :type after: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        params['link_id'] = link_id
+        if after is not None:
+            params['after'] = after
+        return await self._call('groups.reorderLink', params, priority)
+
+    async def search(self, q, type=None, country_id=None, city_id=None, future=None, market=None, sort=None,
+                     offset=None, count=None, priority=None):
+        """
+        Returns a list of communities matching the search criteria.
+
+        https://vk.com/dev/groups.search
+
+        :param q: Search query string.
+        :type q: :obj:`str`
+        :param type: Community type. Possible values: 'group, page, event.'
+        :type type: :obj:`str`
+        :param country_id: Country ID.
+        :type country_id: :obj:`int`
+        :param city_id: City ID. If this parameter is transmitted, country_id is ignored.
+        :type city_id: :obj:`int`
+        :param future: '1' — to return only upcoming events. Works with the 'type' = 'event' only.
+        :type future: :obj:`bool`
+        :param market: '1' — to return communities with enabled market only.
+        :type market: :obj:`bool`
+        :param sort: Sort order. Possible values: *'0' — default sorting (similar the full version of the site),, *'1' —
+            by growth speed,, *'2'— by the "day attendance/members number" ratio,, *'3' — by the "Likes number/members
+            number" ratio,, *'4' — by the "comments number/members number" ratio,, *'5' — by the "boards entries
+            number/members number" ratio.
+        :type sort: :obj:`int`
+        :param offset: Offset needed to return a specific subset of results.
+        :type offset: :obj:`int`
+        :param count: Number of communities to return. "Note that you can not receive more than first thousand of
+            results, regardless of 'count' and 'offset' values."
+        :type count: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['q'] = q
+        if type is not None:
+            params['type'] = type
+        if country_id is not None:
+            params['country_id'] = country_id
+        if city_id is not None:
+            params['city_id'] = city_id
+        if future is not None:
+            params['future'] = int(future)
+        if market is not None:
+            params['market'] = int(market)
+        if sort is not None:
+            params['sort'] = sort
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        return await self._call('groups.search', params, priority)
+
+    async def set_callback_settings(self, group_id, server_id=None, message_new=None, message_reply=None,
+                                    message_allow=None, message_deny=None,
+                                    photo_new=None, audio_new=None, video_new=None,
+                                    wall_reply_new=None, wall_reply_edit=None,
+                                    wall_reply_delete=None, wall_reply_restore=None,
+                                    wall_post_new=None, wall_repost=None,
+                                    board_post_new=None, board_post_edit=None,
+                                    board_post_restore=None, board_post_delete=None,
+                                    photo_comment_new=None, photo_comment_edit=None,
+                                    photo_comment_delete=None,
+                                    photo_comment_restore=None,
+                                    video_comment_new=None, video_comment_edit=None,
+                                    video_comment_delete=None,
+                                    video_comment_restore=None,
+                                    market_comment_new=None, market_comment_edit=None,
+                                    market_comment_delete=None,
+                                    market_comment_restore=None, poll_vote_new=None,
+                                    group_join=None, group_leave=None,
+                                    user_block=None, user_unblock=None,
+                                    lead_forms_new=None, priority=None):
+        """
+        Allow to set notifications settings for group.
+
+        https://vk.com/dev/groups.setCallbackSettings
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :param server_id: Server ID.
+        :type server_id: :obj:`int`
+        :param message_new: A new incoming message has been received ('0' — disabled, '1' — enabled).
+        :type message_new: :obj:`bool`
+        :param message_reply: A new outcoming message has been received ('0' — disabled, '1' — enabled).
+        :type message_reply: :obj:`bool`
+        :param message_allow: Allowed messages notifications ('0' — disabled, '1' — enabled).
+        :type message_allow: :obj:`bool`
+        :param message_deny: Denied messages notifications ('0' — disabled, '1' — enabled).
+        :type message_deny: :obj:`bool`
+        :param photo_new: New photos notifications ('0' — disabled, '1' — enabled).
+        :type photo_new: :obj:`bool`
+        :param audio_new: New audios notifications ('0' — disabled, '1' — enabled).
+        :type audio_new: :obj:`bool`
+        :param video_new: New videos notifications ('0' — disabled, '1' — enabled).
+        :type video_new: :obj:`bool`
+        :param wall_reply_new: New wall replies notifications ('0' — disabled, '1' — enabled).
+        :type wall_reply_new: :obj:`bool`
+        :param wall_reply_edit: Wall replies edited notifications ('0' — disabled, '1' — enabled).
+        :type wall_reply_edit: :obj:`bool`
+        :param wall_reply_delete: A wall comment has been deleted ('0' — disabled, '1' — enabled).
+        :type wall_reply_delete: :obj:`bool`
+        :param wall_reply_restore: A wall comment has been restored ('0' — disabled, '1' — enabled).
+        :type wall_reply_restore: :obj:`bool`
+        :param wall_post_new: New wall posts notifications ('0' — disabled, '1' — enabled).
+        :type wall_post_new: :obj:`bool`
+        :param wall_repost: New wall posts notifications ('0' — disabled, '1' — enabled).
+        :type wall_repost: :obj:`bool`
+        :param board_post_new: New board posts notifications ('0' — disabled, '1' — enabled).
+        :type board_post_new: :obj:`bool`
+        :param board_post_edit: Board posts edited notifications ('0' — disabled, '1' — enabled).
+        :type board_post_edit: :obj:`bool`
+        :param board_post_restore: Board posts restored notifications ('0' — disabled, '1' — enabled).
+        :type board_post_restore: :obj:`bool`
+        :param board_post_delete: Board posts deleted notifications ('0' — disabled, '1' — enabled).
+        :type board_post_delete: :obj:`bool`
+        :param photo_comment_new: New comment to photo notifications ('0' — disabled, '1' — enabled).
+        :type photo_comment_new: :obj:`bool`
+        :param photo_comment_edit: A photo comment has been edited ('0' — disabled, '1' — enabled).
+        :type photo_comment_edit: :obj:`bool`
+        :param photo_comment_delete: A photo comment has been deleted ('0' — disabled, '1' — enabled).
+        :type photo_comment_delete: :obj:`bool`
+        :param photo_comment_restore: A photo comment has been restored ('0' — disabled, '1' — enabled).
+        :type photo_comment_restore: :obj:`bool`
+        :param video_comment_new: New comment to video notifications ('0' — disabled, '1' — enabled).
+        :type video_comment_new: :obj:`bool`
+        :param video_comment_edit: A video comment has been edited ('0' — disabled, '1' — enabled).
+        :type video_comment_edit: :obj:`bool`
+        :param video_comment_delete: A video comment has been deleted ('0' — disabled, '1' — enabled).
+        :type video_comment_delete: :obj:`bool`
+        :param video_comment_restore: A video comment has been restored ('0' — disabled, '1' — enabled).
+        :type video_comment_restore: :obj:`bool`
+        :param market_comment_new: New comment to market item notifications ('0' — disabled, '1' — enabled).
+        :type market_comment_new: :obj:`bool`
+        :param market_comment_edit: A market comment has been edited ('0' — disabled, '1' — enabled).
+        :type market_comment_edit: :obj:`bool`
+        :param market_comment_delete: A market comment has been deleted ('0' — disabled, '1' — enabled).
+        :type market_comment_delete: :obj:`bool`
+        :param market_comment_restore: A market comment has been restored ('0' — disabled, '1' — enabled).
+        :type market_comment_restore: :obj:`bool`
+        :param poll_vote_new: A vote in a public poll has been added ('0' — disabled, '1' — enabled).
+        :type poll_vote_new: :obj:`bool`
+        :param group_join: Joined community notifications ('0' — disabled, '1' — enabled).
+        :type group_join: :obj:`bool`
+        :param group_leave: Left community notifications ('0' — disabled, '1' — enabled).
+        :type group_leave: :obj:`bool`
+        :param user_block: User added to community blacklist
+        :type user_block: :obj:`bool`
+        :param user_unblock: User removed from community blacklist
+        :type user_unblock: :obj:`bool`
+        :param lead_forms_new: New form in lead forms
+        :type lead_forms_new: :obj:`bool`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        if server_id is not None:
+            params['server_id'] = server_id
+        if message_new is not None:
+            params['message_new'] = int(message_new)
+        if message_reply is not None:
+            params['message_reply'] = int(message_reply)
+        if message_allow is not None:
+            params['message_allow'] = int(message_allow)
+        if message_deny is not None:
+            params['message_deny'] = int(message_deny)
+        if photo_new is not None:
+            params['photo_new'] = int(photo_new)
+        if audio_new is not None:
+            params['audio_new'] = int(audio_new)
+        if video_new is not None:
+            params['video_new'] = int(video_new)
+        if wall_reply_new is not None:
+            params['wall_reply_new'] = int(wall_reply_new)
+        if wall_reply_edit is not None:
+            params['wall_reply_edit'] = int(wall_reply_edit)
+        if wall_reply_delete is not None:
+            params['wall_reply_delete'] = int(wall_reply_delete)
+        if wall_reply_restore is not None:
+            params['wall_reply_restore'] = int(wall_reply_restore)
+        if wall_post_new is not None:
+            params['wall_post_new'] = int(wall_post_new)
+        if wall_repost is not None:
+            params['wall_repost'] = int(wall_repost)
+        if board_post_new is not None:
+            params['board_post_new'] = int(board_post_new)
+        if board_post_edit is not None:
+            params['board_post_edit'] = int(board_post_edit)
+        if board_post_restore is not None:
+            params['board_post_restore'] = int(board_post_restore)
+        if board_post_delete is not None:
+            params['board_post_delete'] = int(board_post_delete)
+        if photo_comment_new is not None:
+            params['photo_comment_new'] = int(photo_comment_new)
+        if photo_comment_edit is not None:
+            params['photo_comment_edit'] = int(photo_comment_edit)
+        if photo_comment_delete is not None:
+            params['photo_comment_delete'] = int(photo_comment_delete)
+        if photo_comment_restore is not None:
+            params['photo_comment_restore'] = int(photo_comment_restore)
+        if video_comment_new is not None:
+            params['video_comment_new'] = int(video_comment_new)
+        if video_comment_edit is not None:
+            params['video_comment_edit'] = int(video_comment_edit)
+        if video_comment_delete is not None:
+            params['video_comment_delete'] = int(video_comment_delete)
+        if video_comment_restore is not None:
+            params['video_comment_restore'] = int(video_comment_restore)
+        if market_comment_new is not None:
+            params['market_comment_new'] = int(market_comment_new)
+        if market_comment_edit is not None:
+            params['market_comment_edit'] = int(market_comment_edit)
+        if market_comment_delete is not None:
+            params['market_comment_delete'] = int(market_comment_delete)
+        if market_comment_restore is not None:
+            params['market_comment_restore'] = int(market_comment_restore)
+        if poll_vote_new is not None:
+            params['poll_vote_new'] = int(poll_vote_new)
+        if group_join is not None:
+            params['group_join'] = int(group_join)
+        if group_leave is not None:
+            params['group_leave'] = int(group_leave)
+        if user_block is not None:
+            params['user_block'] = int(user_block)
+        if user_unblock is not None:
+            params['user_unblock'] = int(user_unblock)
+        if lead_forms_new is not None:
+            params['lead_forms_new'] = int(lead_forms_new)
+        return await self._call('groups.setCallbackSettings', params, priority)
+
+    async def set_long_poll_settings(self, group_id, enabled=None, message_new=None, message_reply=None,
+                                     message_edit=None, message_allow=None,
+                                     message_deny=None, photo_new=None,
+                                     audio_new=None, video_new=None,
+                                     wall_reply_new=None, wall_reply_edit=None,
+                                     wall_reply_delete=None, wall_reply_restore=None,
+                                     wall_post_new=None, wall_repost=None,
+                                     board_post_new=None, board_post_edit=None,
+                                     board_post_restore=None, board_post_delete=None,
+                                     photo_comment_new=None, photo_comment_edit=None,
+                                     photo_comment_delete=None,
+                                     photo_comment_restore=None,
+                                     video_comment_new=None, video_comment_edit=None,
+                                     video_comment_delete=None,
+                                     video_comment_restore=None,
+                                     market_comment_new=None,
+                                     market_comment_edit=None,
+                                     market_comment_delete=None,
+                                     market_comment_restore=None, poll_vote_new=None,
+                                     group_join=None, group_leave=None,
+                                     user_block=None, user_unblock=None,
+                                     priority=None):
+        """
+        Sets Long Poll notification settings
+
+        https://vk.com/dev/groups.setLongPollSettings
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :param enabled: Sets whether Long Poll is enabled ('0' — disabled, '1' — enabled).
+        :type enabled: :obj:`bool`
+        :param message_new: A new incoming message has been received ('0' — disabled, '1' — enabled).
+        :type message_new: :obj:`bool`
+        :param message_reply: A new outcoming message has been received ('0' — disabled, '1' — enabled).
+        :type message_reply: :obj:`bool`
+        :param message_edit: A message has been edited ('0' — disabled, '1' — enabled).
+        :type message_edit: :obj:`bool`
+        :param message_allow: Allowed messages notifications ('0' — disabled, '1' — enabled).
+        :type message_allow: :obj:`bool`
+        :param message_deny: Denied messages notifications ('0' — disabled, '1' — enabled).
+        :type message_deny: :obj:`bool`
+        :param photo_new: New photos notifications ('0' — disabled, '1' — enabled).
+        :type photo_new: :obj:`bool`
+        :param audio_new: New audios notifications ('0' — disabled, '1' — enabled).
+        :type audio_new: :obj:`bool`
+        :param video_new: New videos notifications ('0' — disabled, '1' — enabled).
+        :type video_new: :obj:`bool`
+        :param wall_reply_new: New wall replies notifications ('0' — disabled, '1' — enabled).
+        :type wall_reply_new: :obj:`bool`
+        :param wall_reply_edit: Wall replies edited notifications ('0' — disabled, '1' — enabled).
+        :type wall_reply_edit: :obj:`bool`
+        :param wall_reply_delete: A wall comment has been deleted ('0' — disabled, '1' — enabled).
+        :type wall_reply_delete: :obj:`bool`
+        :param wall_reply_restore: A wall comment has been restored ('0' — disabled, '1' — enabled).
+        :type wall_reply_restore: :obj:`bool`
+        :param wall_post_new: New wall posts notifications ('0' — disabled, '1' — enabled).
+        :type wall_post_new: :obj:`bool`
+        :param wall_repost: New wall posts notifications ('0' — disabled, '1' — enabled).
+        :type wall_repost: :obj:`bool`
+        :param board_post_new: New board posts notifications ('0' — disabled, '1' — enabled).
+        :type board_post_new: :obj:`bool`
+        :param board_post_edit: Board posts edited notifications ('0' — disabled, '1' — enabled).
+        :type board_post_edit: :obj:`bool`
+        :param board_post_restore: Board posts restored notifications ('0' — disabled, '1' — enabled).
+        :type board_post_restore: :obj:`bool`
+        :param board_post_delete: Board posts deleted notifications ('0' — disabled, '1' — enabled).
+        :type board_post_delete: :obj:`bool`
+        :param photo_comment_new: New comment to photo notifications ('0' — disabled, '1' — enabled).
+        :type photo_comment_new: :obj:`bool`
+        :param photo_comment_edit: A photo comment has been edited ('0' — disabled, '1' — enabled).
+        :type photo_comment_edit: :obj:`bool`
+        :param photo_comment_delete: A photo comment has been deleted ('0' — disabled, '1' — enabled).
+        :type photo_comment_delete: :obj:`bool`
+        :param photo_comment_restore: A photo comment has been restored ('0' — disabled, '1' — enabled).
+        :type photo_comment_restore: :obj:`bool`
+        :param video_comment_new: New comment to video notifications ('0' — disabled, '1' — enabled).
+        :type video_comment_new: :obj:`bool`
+        :param video_comment_edit: A video comment has been edited ('0' — disabled, '1' — enabled).
+        :type video_comment_edit: :obj:`bool`
+        :param video_comment_delete: A video comment has been deleted ('0' — disabled, '1' — enabled).
+        :type video_comment_delete: :obj:`bool`
+        :param video_comment_restore: A video comment has been restored ('0' — disabled, '1' — enabled).
+        :type video_comment_restore: :obj:`bool`
+        :param market_comment_new: New comment to market item notifications ('0' — disabled, '1' — enabled).
+        :type market_comment_new: :obj:`bool`
+        :param market_comment_edit: A market comment has been edited ('0' — disabled, '1' — enabled).
+        :type market_comment_edit: :obj:`bool`
+        :param market_comment_delete: A market comment has been deleted ('0' — disabled, '1' — enabled).
+        :type market_comment_delete: :obj:`bool`
+        :param market_comment_restore: A market comment has been restored ('0' — disabled, '1' — enabled).
+        :type market_comment_restore: :obj:`bool`
+        :param poll_vote_new: A vote in a public poll has been added ('0' — disabled, '1' — enabled).
+        :type poll_vote_new: :obj:`bool`
+        :param group_join: Joined community notifications ('0' — disabled, '1' — enabled).
+        :type group_join: :obj:`bool`
+        :param group_leave: Left community notifications ('0' — disabled, '1' — enabled).
+        :type group_leave: :obj:`bool`
+        :param user_block: User added to community blacklist
+        :type user_block: :obj:`bool`
+        :param user_unblock: User removed from community blacklist
+        :type user_unblock: :obj:`bool`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        if enabled is not None:
+            params['enabled'] = int(enabled)
+        if message_new is not None:
+            params['message_new'] = int(message_new)
+        if message_reply is not None:
+            params['message_reply'] = int(message_reply)
+        if message_edit is not None:
+            params['message_edit'] = int(message_edit)
+        if message_allow is not None:
+            params['message_allow'] = int(message_allow)
+        if message_deny is not None:
+            params['message_deny'] = int(message_deny)
+        if photo_new is not None:
+            params['photo_new'] = int(photo_new)
+        if audio_new is not None:
+            params['audio_new'] = int(audio_new)
+        if video_new is not None:
+            params['video_new'] = int(video_new)
+        if wall_reply_new is not None:
+            params['wall_reply_new'] = int(wall_reply_new)
+        if wall_reply_edit is not None:
+            params['wall_reply_edit'] = int(wall_reply_edit)
+        if wall_reply_delete is not None:
+            params['wall_reply_delete'] = int(wall_reply_delete)
+        if wall_reply_restore is not None:
+            params['wall_reply_restore'] = int(wall_reply_restore)
+        if wall_post_new is not None:
+            params['wall_post_new'] = int(wall_post_new)
+        if wall_repost is not None:
+            params['wall_repost'] = int(wall_repost)
+        if board_post_new is not None:
+            params['board_post_new'] = int(board_post_new)
+        if board_post_edit is not None:
+            params['board_post_edit'] = int(board_post_edit)
+        if board_post_restore is not None:
+            params['board_post_restore'] = int(board_post_restore)
+        if board_post_delete is not None:
+            params['board_post_delete'] = int(board_post_delete)
+        if photo_comment_new is not None:
+            params['photo_comment_new'] = int(photo_comment_new)
+        if photo_comment_edit is not None:
+            params['photo_comment_edit'] = int(photo_comment_edit)
+        if photo_comment_delete is not None:
+            params['photo_comment_delete'] = int(photo_comment_delete)
+        if photo_comment_restore is not None:
+            params['photo_comment_restore'] = int(photo_comment_restore)
+        if video_comment_new is not None:
+            params['video_comment_new'] = int(video_comment_new)
+        if video_comment_edit is not None:
+            params['video_comment_edit'] = int(video_comment_edit)
+        if video_comment_delete is not None:
+            params['video_comment_delete'] = int(video_comment_delete)
+        if video_comment_restore is not None:
+            params['video_comment_restore'] = int(video_comment_restore)
+        if market_comment_new is not None:
+            params['market_comment_new'] = int(market_comment_new)
+        if market_comment_edit is not None:
+            params['market_comment_edit'] = int(market_comment_edit)
+        if market_comment_delete is not None:
+            params['market_comment_delete'] = int(market_comment_delete)
+        if market_comment_restore is not None:
+            params['market_comment_restore'] = int(market_comment_restore)
+        if poll_vote_new is not None:
+            params['poll_vote_new'] = int(poll_vote_new)
+        if group_join is not None:
+            params['group_join'] = int(group_join)
+        if group_leave is not None:
+            params['group_leave'] = int(group_leave)
+        if user_block is not None:
+            params['user_block'] = int(user_block)
+        if user_unblock is not None:
+            params['user_unblock'] = int(user_unblock)
+        return await self._call('groups.setLongPollSettings', params, priority)
+
+    async def unban_user(self, group_id, user_id, priority=None):
+        """
+        Removes a user from a community blacklist.
+
+        https://vk.com/dev/groups.unbanUser
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :param user_id: User ID.
+        :type user_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        params['user_id'] = user_id
+        return await self._call('groups.unbanUser', params, priority)
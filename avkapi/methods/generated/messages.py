@@ -0,0 +1,890 @@
+# Generated by scripts/generate_methods.py from avkapi/schema/methods.json. Do not edit.
+
+from ..base import BaseMethod, _join
+
+
+class Messages(BaseMethod):
+    """
+    Methods of `messages` section
+
+    https://vk.com/dev/methods
+    """
+
+    async def add_chat_user(self, chat_id, user_id, priority=None):
+        """
+        Adds a new user to a chat.
+
+        https://vk.com/dev/messages.addChatUser
+
+        :param chat_id: Chat ID.
+        :type chat_id: :obj:`int`
+        :param user_id: ID of the user to be added to the chat.
+        :type user_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['chat_id'] = chat_id
+        params['user_id'] = user_id
+        return await self._call('messages.addChatUser', params, priority)
+
+    async def allow_messages_from_group(self, group_id, priority=None):
+        """
+        Allows sending messages from community to the current user.
+
+        https://vk.com/dev/messages.allowMessagesFromGroup
+
+        :param group_id: Group ID.
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        return await self._call('messages.allowMessagesFromGroup', params, priority)
+
+    async def create_chat(self, user_ids, title=None, priority=None):
+        """
+        Creates a chat with several participants.
+
+        https://vk.com/dev/messages.createChat
+
+        :param user_ids: IDs of the users to be added to the chat.
+        :type user_ids: :obj:`list`
+        :param title: Chat title.
+        :type title: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        params['user_ids'] = _join(user_ids)
+        if title is not None:
+            params['title'] = title
+        return await self._call('messages.createChat', params, priority)
+
+    async def delete(self, message_ids=None, spam=None, delete_for_all=None, group_id=None, priority=None):
+        """
+        Deletes one or more messages.
+
+        https://vk.com/dev/messages.delete
+
+        :param message_ids: Message IDs.
+        :type message_ids: :obj:`list`
+        :param spam: '1' — to mark message as spam.
+        :type spam: :obj:`bool`
+        :param delete_for_all: '1' — delete message for for all.
+        :type delete_for_all: :obj:`bool`
+        :param group_id: Group ID (for group messages with user access token)
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if message_ids is not None:
+            params['message_ids'] = _join(message_ids)
+        if spam is not None:
+            params['spam'] = int(spam)
+        if delete_for_all is not None:
+            params['delete_for_all'] = int(delete_for_all)
+        if group_id is not None:
+            params['group_id'] = group_id
+        return await self._call('messages.delete', params, priority)
+
+    async def delete_chat_photo(self, chat_id, priority=None):
+        """
+        Deletes a chat's cover picture.
+
+        https://vk.com/dev/messages.deleteChatPhoto
+
+        :param chat_id: Chat ID.
+        :type chat_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['chat_id'] = chat_id
+        return await self._call('messages.deleteChatPhoto', params, priority)
+
+    async def delete_conversation(self, user_id=None, group_id=None, peer_id=None, offset=None, count=None,
+                                  priority=None):
+        """
+        Deletes all private messages in a conversation.
+
+        https://vk.com/dev/messages.deleteConversation
+
+        :param user_id: User ID. To clear a chat history use 'chat_id'
+        :type user_id: :obj:`str`
+        :param group_id: Group ID (for group messages with user access token)
+        :type group_id: :obj:`int`
+        :param peer_id: Destination ID. "For user: 'User ID', e.g. '12345'. For chat: '2000000000' + 'chat_id', e.g.
+            '2000000001'. For community: '- community ID', e.g. '-12345'. "
+        :type peer_id: :obj:`int`
+        :param offset: Offset needed to delete a specific subset of conversations.
+        :type offset: :obj:`int`
+        :param count: Number of conversations to delete. "NOTE: If the number of messages exceeds the maximum, the
+            method shall be called several times."
+        :type count: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if user_id is not None:
+            params['user_id'] = user_id
+        if group_id is not None:
+            params['group_id'] = group_id
+        if peer_id is not None:
+            params['peer_id'] = peer_id
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        return await self._call('messages.deleteConversation', params, priority)
+
+    async def deny_messages_from_group(self, group_id, priority=None):
+        """
+        Denies sending message from community to the current user.
+
+        https://vk.com/dev/messages.denyMessagesFromGroup
+
+        :param group_id: Group ID.
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        return await self._call('messages.denyMessagesFromGroup', params, priority)
+
+    async def edit(self, peer_id, message=None, lat=None, long=None, attachment=None, keep_forward_messages=None,
+                   keep_snippets=None, group_id=None, priority=None):
+        """
+        Edits the message.
+
+        https://vk.com/dev/messages.edit
+
+        :param peer_id: Destination ID. "For user: 'User ID', e.g. '12345'. For chat: '2000000000' + 'chat_id', e.g.
+            '2000000001'. For community: '- community ID', e.g. '-12345'. "
+        :type peer_id: :obj:`int`
+        :param message: (Required if 'attachments' is not set.) Text of the message.
+        :type message: :obj:`str`
+        :param lat: Geographical latitude of a check-in, in degrees (from -90 to 90).
+        :type lat: :obj:`float`
+        :param long: Geographical longitude of a check-in, in degrees (from -180 to 180).
+        :type long: :obj:`float`
+        :param attachment: (Required if 'message' is not set.) List of objects attached to the message, separated by
+            commas, in the following format: "<owner_id>_<media_id>", '' — Type of media attachment: 'photo' — photo,
+            'video' — video, 'audio' — audio, 'doc' — document, 'wall' — wall post, '<owner_id>' — ID of the media
+            attachment owner. '<media_id>' — media attachment ID. Example: "photo100172_166443618"
+        :type attachment: :obj:`list`
+        :param keep_forward_messages: '1' — to keep forwarded, messages.
+        :type keep_forward_messages: :obj:`bool`
+        :param keep_snippets: '1' — to keep attached snippets.
+        :type keep_snippets: :obj:`bool`
+        :param group_id: Group ID (for group messages with user access token)
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['peer_id'] = peer_id
+        if message is not None:
+            params['message'] = message
+        if lat is not None:
+            params['lat'] = lat
+        if long is not None:
+            params['long'] = long
+        if attachment is not None:
+            params['attachment'] = _join(attachment)
+        if keep_forward_messages is not None:
+            params['keep_forward_messages'] = int(keep_forward_messages)
+        if keep_snippets is not None:
+            params['keep_snippets'] = int(keep_snippets)
+        if group_id is not None:
+            params['group_id'] = group_id
+        return await self._call('messages.edit', params, priority)
+
+    async def edit_chat(self, chat_id, title, priority=None):
+        """
+        Edits the title of a chat.
+
+        https://vk.com/dev/messages.editChat
+
+        :param chat_id: Chat ID.
+        :type chat_id: :obj:`int`
+        :param title: New title of the chat.
+        :type title: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        params['chat_id'] = chat_id
+        params['title'] = title
+        return await self._call('messages.editChat', params, priority)
+
+    async def get_by_conversation_message_id(self, conversation_message_ids, peer_id=None, extended=None, fields=None,
+                                             group_id=None, priority=None):
+        """
+        Returns messages by their IDs within the conversation.
+
+        https://vk.com/dev/messages.getByConversationMessageId
+
+        :param peer_id: Destination ID. "For user: 'User ID', e.g. '12345'. For chat: '2000000000' + 'chat_id', e.g.
+            '2000000001'. For community: '- community ID', e.g. '-12345'. "
+        :type peer_id: :obj:`int`
+        :param conversation_message_ids: Conversation message IDs.
+        :type conversation_message_ids: :obj:`list`
+        :param extended: Information whether the response should be extended
+        :type extended: :obj:`bool`
+        :param fields: Profile fields to return.
+        :type fields: :obj:`list`
+        :param group_id: Group ID (for group messages with group access token)
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['conversation_message_ids'] = _join(conversation_message_ids)
+        if peer_id is not None:
+            params['peer_id'] = peer_id
+        if extended is not None:
+            params['extended'] = int(extended)
+        if fields is not None:
+            params['fields'] = _join(fields)
+        if group_id is not None:
+            params['group_id'] = group_id
+        return await self._call('messages.getByConversationMessageId', params, priority)
+
+    async def get_by_id(self, message_ids, preview_length=None, extended=None, fields=None, group_id=None,
+                        priority=None):
+        """
+        Returns messages by their IDs.
+
+        https://vk.com/dev/messages.getById
+
+        :param message_ids: Message IDs.
+        :type message_ids: :obj:`list`
+        :param preview_length: Number of characters after which to truncate a previewed message. To preview the full
+            message, specify '0'. "NOTE: Messages are not truncated by default. Messages are truncated by words."
+        :type preview_length: :obj:`int`
+        :param extended: Information whether the response should be extended
+        :type extended: :obj:`bool`
+        :param fields: Profile fields to return.
+        :type fields: :obj:`list`
+        :param group_id: Group ID (for group messages with group access token)
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['message_ids'] = _join(message_ids)
+        if preview_length is not None:
+            params['preview_length'] = preview_length
+        if extended is not None:
+            params['extended'] = int(extended)
+        if fields is not None:
+            params['fields'] = _join(fields)
+        if group_id is not None:
+            params['group_id'] = group_id
+        return await self._call('messages.getById', params, priority)
+
+    async def get_conversation_members(self, group_id=None, peer_id=None, fields=None, name_case=None, priority=None):
+        """
+        Returns a list of IDs of users participating in a chat.
+
+        https://vk.com/dev/messages.getConversationMembers
+
+        :param group_id: Group ID (for group messages with group access token)
+        :type group_id: :obj:`int`
+        :param peer_id: Peer ID.
+        :type peer_id: :obj:`int`
+        :param fields: Profile fields to return.
+        :type fields: :obj:`list`
+        :param name_case: Case for declension of user name and surname: 'nom' — nominative (default), 'gen' — genitive,
+            'dat' — dative, 'acc' — accusative, 'ins' — instrumental, 'abl' — prepositional
+        :type name_case: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        if group_id is not None:
+            params['group_id'] = group_id
+        if peer_id is not None:
+            params['peer_id'] = peer_id
+        if fields is not None:
+            params['fields'] = _join(fields)
+        if name_case is not None:
+            params['name_case'] = name_case
+        return await self._call('messages.getConversationMembers', params, priority)
+
+    async def get_conversations(self, group_id=None, offset=None, count=None, filter=None, extended=None,
+                                start_message_id=None, fields=None, priority=None):
+        """
+        Returns a list of the current user's conversations.
+
+        https://vk.com/dev/messages.getConversations
+
+        :param group_id: Group ID (for group messages with group access token)
+        :type group_id: :obj:`int`
+        :param offset: Offset needed to return a specific subset of conversations.
+        :type offset: :obj:`int`
+        :param count: Number of conversations to return.
+        :type count: :obj:`int`
+        :param filter: Filter to apply: 'all' — all conversations, 'unread' — conversations with unread messages,
+            'important' — conversations, marked as important (only for community messages), 'unanswered' —
+            conversations, marked as unanswered (only for community messages)
+        :type filter: :obj:`str`
+        :param extended: '1' — return extra information about users and communities
+        :type extended: :obj:`bool`
+        :param start_message_id: ID of the message from what to return dialogs.
+        :type start_message_id: :obj:`int`
+        :param fields: Profile and communities fields to return.
+        :type fields: :obj:`list`
+        :return: `response` object
+        """
+        params = {}
+        if group_id is not None:
+            params['group_id'] = group_id
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        if filter is not None:
+            params['filter'] = filter
+        if extended is not None:
+            params['extended'] = int(extended)
+        if start_message_id is not None:
+            params['start_message_id'] = start_message_id
+        if fields is not None:
+            params['fields'] = _join(fields)
+        return await self._call('messages.getConversations', params, priority)
+
+    async def get_conversations_by_id(self, peer_ids, extended=None, fields=None, group_id=None, priority=None):
+        """
+        Returns conversations by their IDs
+
+        https://vk.com/dev/messages.getConversationsById
+
+        :param peer_ids: Destination IDs. "For user: 'User ID', e.g. '12345'. For chat: '2000000000' + 'chat_id', e.g.
+            '2000000001'. For community: '- community ID', e.g. '-12345'. "
+        :type peer_ids: :obj:`list`
+        :param extended: Return extended properties
+        :type extended: :obj:`bool`
+        :param fields: Profile and communities fields to return.
+        :type fields: :obj:`list`
+        :param group_id: Group ID (for group messages with group access token)
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['peer_ids'] = _join(peer_ids)
+        if extended is not None:
+            params['extended'] = int(extended)
+        if fields is not None:
+            params['fields'] = _join(fields)
+        if group_id is not None:
+            params['group_id'] = group_id
+        return await self._call('messages.getConversationsById', params, priority)
+
+    async def get_history(self, offset=None, count=None, user_id=None, peer_id=None, start_message_id=None,
+                          extended=None, fields=None, group_id=None, rev=None, priority=None):
+        """
+        Returns message history for the specified user or group chat.
+
+        https://vk.com/dev/messages.getHistory
+
+        :param offset: Offset needed to return a specific subset of messages.
+        :type offset: :obj:`int`
+        :param count: Number of messages to return.
+        :type count: :obj:`int`
+        :param user_id: ID of the user whose message history you want to return.
+        :type user_id: :obj:`int`
+        :param peer_id:
+        :type peer_id: :obj:`int`
+        :param start_message_id: Starting message ID from which to return history.
+        :type start_message_id: :obj:`int`
+        :param extended: Information whether the response should be extended
+        :type extended: :obj:`bool`
+        :param fields: Profile fields to return.
+        :type fields: :obj:`list`
+        :param group_id: Group ID (for group messages with group access token)
+        :type group_id: :obj:`int`
+        :param rev: Sort order: '1' — return messages in chronological order. '0' — return messages in reverse
+            chronological order.
+        :type rev: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        if user_id is not None:
+            params['user_id'] = user_id
+        if peer_id is not None:
+            params['peer_id'] = peer_id
+        if start_message_id is not None:
+            params['start_message_id'] = start_message_id
+        if extended is not None:
+            params['extended'] = int(extended)
+        if fields is not None:
+            params['fields'] = _join(fields)
+        if group_id is not None:
+            params['group_id'] = group_id
+        if rev is not None:
+            params['rev'] = rev
+        return await self._call('messages.getHistory', params, priority)
+
+    async def get_history_attachments(self, peer_id, media_type=None, start_from=None, count=None, photo_sizes=None,
+                                      fields=None, group_id=None, priority=None):
+        """
+        Returns media files from the dialog or group chat.
+
+        https://vk.com/dev/messages.getHistoryAttachments
+
+        :param peer_id: Peer ID. ", For group chat: '2000000000 + chat ID' , , For community: '-community ID'"
+        :type peer_id: :obj:`int`
+        :param media_type: Type of media files to return: *'photo',, *'video',, *'audio',, *'doc',,
+            *'link'.,*'market'.,*'wall'.,*'share'
+        :type media_type: :obj:`str`
+        :param start_from: Message ID to start return results from.
+        :type start_from: :obj:`str`
+        :param count: Number of objects to return.
+        :type count: :obj:`int`
+        :param photo_sizes: '1' — to return photo sizes in a
+        :type photo_sizes: :obj:`bool`
+        :param fields: Additional profile [vk.com/dev/fields|fields] to return.
+        :type fields: :obj:`list`
+        :param group_id: Group ID (for group messages with group access token)
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['peer_id'] = peer_id
+        if media_type is not None:
+            params['media_type'] = media_type
+        if start_from is not None:
+            params['start_from'] = start_from
+        if count is not None:
+            params['count'] = count
+        if photo_sizes is not None:
+            params['photo_sizes'] = int(photo_sizes)
+        if fields is not None:
+            params['fields'] = _join(fields)
+        if group_id is not None:
+            params['group_id'] = group_id
+        return await self._call('messages.getHistoryAttachments', params, priority)
+
+    async def get_last_activity(self, user_id, priority=None):
+        """
+        Returns a user's current status and date of last activity.
+
+        https://vk.com/dev/messages.getLastActivity
+
+        :param user_id: User ID.
+        :type user_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['user_id'] = user_id
+        return await self._call('messages.getLastActivity', params, priority)
+
+    async def get_long_poll_history(self, ts=None, pts=None, preview_length=None, onlines=None, fields=None,
+                                    events_limit=None, msgs_limit=None,
+                                    max_msg_id=None, group_id=None, priority=None):
+        """
+        Returns updates in user's private messages.
+
+        https://vk.com/dev/messages.getLongPollHistory
+
+        :param ts: Last value of the 'ts' parameter returned from the Long Poll server or by using
+            [vk.com/dev/messages.getLongPollHistory|messages.getLongPollHistory] method.
+        :type ts: :obj:`int`
+        :param pts: Lsat value of 'pts' parameter returned from the Long Poll server or by using
+            [vk.com/dev/messages.getLongPollHistory|messages.getLongPollHistory] method.
+        :type pts: :obj:`int`
+        :param preview_length: Number of characters after which to truncate a previewed message. To preview the full
+            message, specify '0'. "NOTE: Messages are not truncated by default. Messages are truncated by words."
+        :type preview_length: :obj:`int`
+        :param onlines: '1' — to return history with online users only.
+        :type onlines: :obj:`bool`
+        :param fields: Additional profile [vk.com/dev/fields|fields] to return.
+        :type fields: :obj:`list`
+        :param events_limit: Maximum number of events to return.
+        :type events_limit: :obj:`int`
+        :param msgs_limit: Maximum number of messages to return.
+        :type msgs_limit: :obj:`int`
+        :param max_msg_id: Maximum ID of the message among existing ones in the local copy. Both messages received with
+            API methods (for example, , ), and data received from a Long Poll server (events with code 4) are taken into
+            account.
+        :type max_msg_id: :obj:`int`
+        :param group_id: Group ID (for group messages with user access token)
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if ts is not None:
+            params['ts'] = ts
+        if pts is not None:
+            params['pts'] = pts
+        if preview_length is not None:
+            params['preview_length'] = preview_length
+        if onlines is not None:
+            params['onlines'] = int(onlines)
+        if fields is not None:
+            params['fields'] = _join(fields)
+        if events_limit is not None:
+            params['events_limit'] = events_limit
+        if msgs_limit is not None:
+            params['msgs_limit'] = msgs_limit
+        if max_msg_id is not None:
+            params['max_msg_id'] = max_msg_id
+        if group_id is not None:
+            params['group_id'] = group_id
+        return await self._call('messages.getLongPollHistory', params, priority)
+
+    async def get_long_poll_server(self, lp_version=None, need_pts=None, group_id=None, priority=None):
+        """
+        Returns data required for connection to a Long Poll server.
+
+        https://vk.com/dev/messages.getLongPollServer
+
+        :param lp_version: Long poll version
+        :type lp_version: :obj:`int`
+        :param need_pts: '1' — to return the 'pts' field, needed for the
+            [vk.com/dev/messages.getLongPollHistory|messages.getLongPollHistory] method.
+        :type need_pts: :obj:`bool`
+        :param group_id: Group ID (for group messages with user access token)
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if lp_version is not None:
+            params['lp_version'] = lp_version
+        if need_pts is not None:
+            params['need_pts'] = int(need_pts)
+        if group_id is not None:
+            params['group_id'] = group_id
+        return await self._call('messages.getLongPollServer', params, priority)
+
+    async def is_messages_from_group_allowed(self, group_id, user_id, priority=None):
+        """
+        Returns information whether sending messages from the community to current user is allowed.
+
+        https://vk.com/dev/messages.isMessagesFromGroupAllowed
+
+        :param group_id: Group ID.
+        :type group_id: :obj:`int`
+        :param user_id: User ID.
+        :type user_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        params['user_id'] = user_id
+        return await self._call('messages.isMessagesFromGroupAllowed', params, priority)
+
+    async def mark_as_answered_conversation(self, peer_id, group_id=None, answered=None, priority=None):
+        """
+        Marks and unmarks conversations as unanswered.
+
+        https://vk.com/dev/messages.markAsAnsweredConversation
+
+        :param group_id: Group ID (for group messages with group access token)
+        :type group_id: :obj:`int`
+        :param peer_id: ID of conversation to mark as important.
+        :type peer_id: :obj:`int`
+        :param answered: '1' — to mark as answered, '0' — to remove the mark
+        :type answered: :obj:`bool`
+        :return: `response` object
+        """
+        params = {}
+        params['peer_id'] = peer_id
+        if group_id is not None:
+            params['group_id'] = group_id
+        if answered is not None:
+            params['answered'] = int(answered)
+        return await self._call('messages.markAsAnsweredConversation', params, priority)
+
+    async def mark_as_important(self, message_ids=None, important=None, priority=None):
+        """
+        Marks and unmarks messages as important (starred).
+
+        https://vk.com/dev/messages.markAsImportant
+
+        :param message_ids: IDs of messages to mark as important.
+        :type message_ids: :obj:`list`
+        :param important: '1' — to add a star (mark as important), '0' — to remove the star
+        :type important: :obj:`bool`
+        :return: `response` object
+        """
+        params = {}
+        if message_ids is not None:
+            params['message_ids'] = _join(message_ids)
+        if important is not None:
+            params['important'] = int(important)
+        return await self._call('messages.markAsImportant', params, priority)
+
+    async def mark_as_important_conversation(self, peer_id, group_id=None, important=None, priority=None):
+        """
+        Marks and unmarks conversations as important.
+
+        https://vk.com/dev/messages.markAsImportantConversation
+
+        :param group_id: Group ID (for group messages with group access token)
+        :type group_id: :obj:`int`
+        :param peer_id: ID of conversation to mark as important.
+        :type peer_id: :obj:`int`
+        :param important: '1' — to add a star (mark as important), '0' — to remove the star
+        :type important: :obj:`bool`
+        :return: `response` object
+        """
+        params = {}
+        params['peer_id'] = peer_id
+        if group_id is not None:
+            params['group_id'] = group_id
+        if important is not None:
+            params['important'] = int(important)
+        return await self._call('messages.markAsImportantConversation', params, priority)
+
+    async def mark_as_read(self, message_ids=None, peer_id=None, start_message_id=None, group_id=None, priority=None):
+        """
+        Marks messages as read.
+
+        https://vk.com/dev/messages.markAsRead
+
+        :param message_ids: IDs of messages to mark as read.
+        :type message_ids: :obj:`list`
+        :param peer_id: Destination ID. "For user: 'User ID', e.g. '12345'. For chat: '2000000000' + 'chat_id', e.g.
+            '2000000001'. For community: '- community ID', e.g. '-12345'. "
+        :type peer_id: :obj:`int`
+        :param start_message_id: Message ID to start from.
+        :type start_message_id: :obj:`int`
+        :param group_id: Group ID (for group messages with user access token)
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if message_ids is not None:
+            params['message_ids'] = _join(message_ids)
+        if peer_id is not None:
+            params['peer_id'] = peer_id
+        if start_message_id is not None:
+            params['start_message_id'] = start_message_id
+        if group_id is not None:
+            params['group_id'] = group_id
+        return await self._call('messages.markAsRead', params, priority)
+
+    async def remove_chat_user(self, chat_id, user_id, priority=None):
+        """
+        Allows the current user to leave a chat or, if the current user started the chat, allows the user to remove
+        another user from the chat.
+
+        https://vk.com/dev/messages.removeChatUser
+
+        :param chat_id: Chat ID.
+        :type chat_id: :obj:`int`
+        :param user_id: ID of the user to be removed from the chat.
+        :type user_id: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        params['chat_id'] = chat_id
+        params['user_id'] = user_id
+        return await self._call('messages.removeChatUser', params, priority)
+
+    async def restore(self, message_id, group_id=None, priority=None):
+        """
+        Restores a deleted message.
+
+        https://vk.com/dev/messages.restore
+
+        :param message_id: ID of a previously-deleted message to restore.
+        :type message_id: :obj:`int`
+        :param group_id: Group ID (for group messages with user access token)
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['message_id'] = message_id
+        if group_id is not None:
+            params['group_id'] = group_id
+        return await self._call('messages.restore', params, priority)
+
+    async def search(self, q=None, peer_id=None, date=None, preview_length=None, offset=None, count=None,
+                     group_id=None, priority=None):
+        """
+        Returns a list of the current user's private messages that match search criteria.
+
+        https://vk.com/dev/messages.search
+
+        :param q: Search query string.
+        :type q: :obj:`str`
+        :param peer_id: Destination ID. "For user: 'User ID', e.g. '12345'. For chat: '2000000000' + 'chat_id', e.g.
+            '2000000001'. For community: '- community ID', e.g. '-12345'. "
+        :type peer_id: :obj:`int`
+        :param date: Date to search message before in Unixtime.
+        :type date: :obj:`int`
+        :param preview_length: Number of characters after which to truncate a previewed message. To preview the full
+            message, specify '0'. "NOTE: Messages are not truncated by default. Messages are truncated by words."
+        :type preview_length: :obj:`int`
+        :param offset: Offset needed to return a specific subset of messages.
+        :type offset: :obj:`int`
+        :param count: Number of messages to return.
+        :type count: :obj:`int`
+        :param group_id: Group ID (for group messages with group access token)
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if q is not None:
+            params['q'] = q
+        if peer_id is not None:
+            params['peer_id'] = peer_id
+        if date is not None:
+            params['date'] = date
+        if preview_length is not None:
+            params['preview_length'] = preview_length
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        if group_id is not None:
+            params['group_id'] = group_id
+        return await self._call('messages.search', params, priority)
+
+    async def search_conversations(self, q=None, count=None, extended=None, fields=None, group_id=None, priority=None):
+        """
+        Returns a list of the current user's conversations that match search criteria.
+
+        https://vk.com/dev/messages.searchConversations
+
+        :param q: Search query string.
+        :type q: :obj:`str`
+        :param count: Maximum number of results.
+        :type count: :obj:`int`
+        :param extended: '1' — return extra information about users and communities
+        :type extended: :obj:`bool`
+        :param fields: Profile fields to return.
+        :type fields: :obj:`list`
+        :param group_id: Group ID (for group messages with user access token)
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if q is not None:
+            params['q'] = q
+        if count is not None:
+            params['count'] = count
+        if extended is not None:
+            params['extended'] = int(extended)
+        if fields is not None:
+            params['fields'] = _join(fields)
+        if group_id is not None:
+            params['group_id'] = group_id
+        return await self._call('messages.searchConversations', params, priority)
+
+    async def send(self, user_id=None, random_id=None, peer_id=None, domain=None, chat_id=None, user_ids=None,
+                   message=None, lat=None, long=None, attachment=None, forward_messages=None,
+                   sticker_id=None, notification=None, group_id=None, priority=None):
+        """
+        Sends a message.
+
+        https://vk.com/dev/messages.send
+
+        :param user_id: User ID (by default — current user).
+        :type user_id: :obj:`int`
+        :param random_id: Unique identifier to avoid resending the message.
+        :type random_id: :obj:`int`
+        :param peer_id: Destination ID. "For user: 'User ID', e.g. '12345'. For chat: '2000000000' + 'chat_id', e.g.
+            '2000000001'. For community: '- community ID', e.g. '-12345'. "
+        :type peer_id: :obj:`int`
+        :param domain: User's short address (for example, 'illarionov').
+        :type domain: :obj:`str`
+        :param chat_id: ID of conversation the message will relate to.
+        :type chat_id: :obj:`int`
+        :param user_ids: IDs of message recipients (if new conversation shall be started).
+        :type user_ids: :obj:`list`
+        :param message: (Required if 'attachments' is not set.) Text of the message.
+        :type message: :obj:`str`
+        :param lat: Geographical latitude of a check-in, in degrees (from -90 to 90).
+        :type lat: :obj:`float`
+        :param long: Geographical longitude of a check-in, in degrees (from -180 to 180).
+        :type long: :obj:`float`
+        :param attachment: (Required if 'message' is not set.) List of objects attached to the message, separated by
+            commas, in the following format: "<owner_id>_<media_id>", '' — Type of media attachment: 'photo' — photo,
+            'video' — video, 'audio' — audio, 'doc' — document, 'wall' — wall post, '<owner_id>' — ID of the media
+            attachment owner. '<media_id>' — media attachment ID. Example: "photo100172_166443618"
+        :type attachment: :obj:`list`
+        :param forward_messages: ID of forwarded messages, separated with a comma. Listed messages of the sender will be
+            shown in the message body at the recipient's. Example: "123,431,544"
+        :type forward_messages: :obj:`str`
+        :param sticker_id: Sticker id.
+        :type sticker_id: :obj:`int`
+        :param notification: '1' if the message is a notification (for community messages).
+        :type notification: :obj:`bool`
+        :param group_id: Group ID (for group messages with group access token)
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if user_id is not None:
+            params['user_id'] = user_id
+        if random_id is not None:
+            params['random_id'] = random_id
+        if peer_id is not None:
+            params['peer_id'] = peer_id
+        if domain is not None:
+            params['domain'] = domain
+        if chat_id is not None:
+            params['chat_id'] = chat_id
+        if user_ids is not None:
+            params['user_ids'] = _join(user_ids)
+        if message is not None:
+            params['message'] = message
+        if lat is not None:
+            params['lat'] = lat
+        if long is not None:
+            params['long'] = long
+        if attachment is not None:
+            params['attachment'] = _join(attachment)
+        if forward_messages is not None:
+            params['forward_messages'] = forward_messages
+        if sticker_id is not None:
+            params['sticker_id'] = sticker_id
+        if notification is not None:
+            params['notification'] = int(notification)
+        if group_id is not None:
+            params['group_id'] = group_id
+        return await self._call('messages.send', params, priority)
+
+    async def set_activity(self, user_id=None, type=None, peer_id=None, group_id=None, priority=None):
+        """
+        Changes the status of a user as typing in a conversation.
+
+        https://vk.com/dev/messages.setActivity
+
+        :param user_id: User ID.
+        :type user_id: :obj:`str`
+        :param type: 'typing' — user has started to type.
+        :type type: :obj:`str`
+        :param peer_id: Destination ID. "For user: 'User ID', e.g. '12345'. For chat: '2000000000' + 'chat_id', e.g.
+            '2000000001'. For community: '- community ID', e.g. '-12345'. "
+        :type peer_id: :obj:`int`
+        :param group_id: Group ID (for group messages with group access token)
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if user_id is not None:
+            params['user_id'] = user_id
+        if type is not None:
+            params['type'] = type
+        if peer_id is not None:
+            params['peer_id'] = peer_id
+        if group_id is not None:
+            params['group_id'] = group_id
+        return await self._call('messages.setActivity', params, priority)
+
+    async def set_chat_photo(self, file, priority=None):
+        """
+        Sets a previously-uploaded picture as the cover picture of a chat.
+
+        https://vk.com/dev/messages.setChatPhoto
+
+        :param file: Upload URL from the 'response' field returned by the
+            [vk.com/dev/photos.getChatUploadServer|photos.getChatUploadServer] method upon successfully uploading an
+            image.
+        :type file: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        params['file'] = file
+        return await self._call('messages.setChatPhoto', params, priority)
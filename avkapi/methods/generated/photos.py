@@ -0,0 +1,1317 @@
+# Generated by scripts/generate_methods.py from avkapi/schema/methods.json. Do not edit.
+
+from ..base import BaseMethod, _join
+
+
+class Photos(BaseMethod):
+    """
+    Methods of `photos` section
+
+    https://vk.com/dev/methods
+    """
+
+    async def confirm_tag(self, photo_id, tag_id, owner_id=None, priority=None):
+        """
+        Confirms a tag on a photo.
+
+        https://vk.com/dev/photos.confirmTag
+
+        :param owner_id: ID of the user or community that owns the photo.
+        :type owner_id: :obj:`int`
+        :param photo_id: Photo ID.
+        :type photo_id: :obj:`str`
+        :param tag_id: Tag ID.
+        :type tag_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['photo_id'] = photo_id
+        params['tag_id'] = tag_id
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        return await self._call('photos.confirmTag', params, priority)
+
+    async def copy(self, owner_id, photo_id, access_key=None, priority=None):
+        """
+        Allows to copy a photo to the "Saved photos" album
+
+        https://vk.com/dev/photos.copy
+
+        :param owner_id: photo's owner ID
+        :type owner_id: :obj:`int`
+        :param photo_id: photo ID
+        :type photo_id: :obj:`int`
+        :param access_key: for private photos
+        :type access_key: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        params['owner_id'] = owner_id
+        params['photo_id'] = photo_id
+        if access_key is not None:
+            params['access_key'] = access_key
+        return await self._call('photos.copy', params, priority)
+
+    async def create_album(self, title, group_id=None, description=None, privacy_view=None, privacy_comment=None,
+                           upload_by_admins_only=None, comments_disabled=None, priority=None):
+        """
+        Creates an empty photo album.
+
+        https://vk.com/dev/photos.createAlbum
+
+        :param title: Album title.
+        :type title: :obj:`str`
+        :param group_id: ID of the community in which the album will be created.
+        :type group_id: :obj:`int`
+        :param description: Album description.
+        :type description: :obj:`str`
+        :param privacy_view:
+        :type privacy_view: :obj:`list`
+        :param privacy_comment:
+        :type privacy_comment: :obj:`list`
+        :param upload_by_admins_only:
+        :type upload_by_admins_only: :obj:`bool`
+        :param comments_disabled:
+        :type comments_disabled: :obj:`bool`
+        :return: `response` object
+        """
+        params = {}
+        params['title'] = title
+        if group_id is not None:
+            params['group_id'] = group_id
+        if description is not None:
+            params['description'] = description
+        if privacy_view is not None:
+            params['privacy_view'] = _join(privacy_view)
+        if privacy_comment is not None:
+            params['privacy_comment'] = _join(privacy_comment)
+        if upload_by_admins_only is not None:
+            params['upload_by_admins_only'] = int(upload_by_admins_only)
+        if comments_disabled is not None:
+            params['comments_disabled'] = int(comments_disabled)
+        return await self._call('photos.createAlbum', params, priority)
+
+    async def create_comment(self, photo_id, owner_id=None, message=None, attachments=None, from_group=None,
+                             reply_to_comment=None, sticker_id=None, access_key=None,
+                             guid=None, priority=None):
+        """
+        Adds a new comment on the photo.
+
+        https://vk.com/dev/photos.createComment
+
+        :param owner_id: ID of the user or community that owns the photo.
+        :type owner_id: :obj:`int`
+        :param photo_id: Photo ID.
+        :type photo_id: :obj:`int`
+        :param message: Comment text.
+        :type message: :obj:`str`
+        :param attachments: (Required if 'message' is not set.) List of objects attached to the post, in the following
+            format: "<owner_id>_<media_id>,<owner_id>_<media_id>", '' — Type of media attachment: 'photo' — photo,
+            'video' — video, 'audio' — audio, 'doc' — document, '<owner_id>' — Media attachment owner ID. '<media_id>' —
+            Media attachment ID. Example: "photo100172_166443618,photo66748_265827614"
+        :type attachments: :obj:`list`
+        :param from_group: '1' — to post a comment from the community
+        :type from_group: :obj:`bool`
+        :param reply_to_comment:
+        :type reply_to_comment: :obj:`int`
+        :param sticker_id:
+        :type sticker_id: :obj:`int`
+        :param access_key:
+        :type access_key: :obj:`str`
+        :param guid:
+        :type guid: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        params['photo_id'] = photo_id
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        if message is not None:
+            params['message'] = message
+        if attachments is not None:
+            params['attachments'] = _join(attachments)
+        if from_group is not None:
+            params['from_group'] = int(from_group)
+        if reply_to_comment is not None:
+            params['reply_to_comment'] = reply_to_comment
+        if sticker_id is not None:
+            params['sticker_id'] = sticker_id
+        if access_key is not None:
+            params['access_key'] = access_key
+        if guid is not None:
+            params['guid'] = guid
+        return await self._call('photos.createComment', params, priority)
+
+    async def delete(self, photo_id, owner_id=None, priority=None):
+        """
+        Deletes a photo.
+
+        https://vk.com/dev/photos.delete
+
+        :param owner_id: ID of the user or community that owns the photo.
+        :type owner_id: :obj:`int`
+        :param photo_id: Photo ID.
+        :type photo_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['photo_id'] = photo_id
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        return await self._call('photos.delete', params, priority)
+
+    async def delete_album(self, album_id, group_id=None, priority=None):
+        """
+        Deletes a photo album belonging to the current user.
+
+        https://vk.com/dev/photos.deleteAlbum
+
+        :param album_id: Album ID.
+        :type album_id: :obj:`int`
+        :param group_id: ID of the community that owns the album.
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['album_id'] = album_id
+        if group_id is not None:
+            params['group_id'] = group_id
+        return await self._call('photos.deleteAlbum', params, priority)
+
+    async def delete_comment(self, comment_id, owner_id=None, priority=None):
+        """
+        Deletes a comment on the photo.
+
+        https://vk.com/dev/photos.deleteComment
+
+        :param owner_id: ID of the user or community that owns the photo.
+        :type owner_id: :obj:`int`
+        :param comment_id: Comment ID.
+        :type comment_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['comment_id'] = comment_id
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        return await self._call('photos.deleteComment', params, priority)
+
+    async def edit(self, photo_id, owner_id=None, caption=None, latitude=None, longitude=None, place_str=None,
+                   foursquare_id=None, delete_place=None, priority=None):
+        """
+        Edits the caption of a photo.
+
+        https://vk.com/dev/photos.edit
+
+        :param owner_id: ID of the user or community that owns the photo.
+        :type owner_id: :obj:`int`
+        :param photo_id: Photo ID.
+        :type photo_id: :obj:`int`
+        :param caption: New caption for the photo. If this parameter is not set, it is considered to be equal to an
+            empty string.
+        :type caption: :obj:`str`
+        :param latitude:
+        :type latitude: :obj:`float`
+        :param longitude:
+        :type longitude: :obj:`float`
+        :param place_str:
+        :type place_str: :obj:`str`
+        :param foursquare_id:
+        :type foursquare_id: :obj:`str`
+        :param delete_place:
+        :type delete_place: :obj:`bool`
+        :return: `response` object
+        """
+        params = {}
+        params['photo_id'] = photo_id
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        if caption is not None:
+            params['caption'] = caption
+        if latitude is not None:
+            params['latitude'] = latitude
+        if longitude is not None:
+            params['longitude'] = longitude
+        if place_str is not None:
+            params['place_str'] = place_str
+        if foursquare_id is not None:
+            params['foursquare_id'] = foursquare_id
+        if delete_place is not None:
+            params['delete_place'] = int(delete_place)
+        return await self._call('photos.edit', params, priority)
+
+    async def edit_album(self, album_id, title=None, description=None, owner_id=None, privacy_view=None,
+                         privacy_comment=None, upload_by_admins_only=None,
+                         comments_disabled=None, priority=None):
+        """
+        Edits information about a photo album.
+
+        https://vk.com/dev/photos.editAlbum
+
+        :param album_id: ID of the photo album to be edited.
+        :type album_id: :obj:`int`
+        :param title: New album title.
+        :type title: :obj:`str`
+        :param description: New album description.
+        :type description: :obj:`str`
+        :param owner_id: ID of the user or community that owns the album.
+        :type owner_id: :obj:`int`
+        :param privacy_view:
+        :type privacy_view: :obj:`list`
+        :param privacy_comment:
+        :type privacy_comment: :obj:`list`
+        :param upload_by_admins_only:
+        :type upload_by_admins_only: :obj:`bool`
+        :param comments_disabled:
+        :type comments_disabled: :obj:`bool`
+        :return: `response` object
+        """
+        params = {}
+        params['album_id'] = album_id
+        if title is not None:
+            params['title'] = title
+        if description is not None:
+            params['description'] = description
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        if privacy_view is not None:
+            params['privacy_view'] = _join(privacy_view)
+        if privacy_comment is not None:
+            params['privacy_comment'] = _join(privacy_comment)
+        if upload_by_admins_only is not None:
+            params['upload_by_admins_only'] = int(upload_by_admins_only)
+        if comments_disabled is not None:
+            params['comments_disabled'] = int(comments_disabled)
+        return await self._call('photos.editAlbum', params, priority)
+
+    async def edit_comment(self, comment_id, owner_id=None, message=None, attachments=None, priority=None):
+        """
+        Edits a comment on a photo.
+
+        https://vk.com/dev/photos.editComment
+
+        :param owner_id: ID of the user or community that owns the photo.
+        :type owner_id: :obj:`int`
+        :param comment_id: Comment ID.
+        :type comment_id: :obj:`int`
+        :param message: New text of the comment.
+        :type message: :obj:`str`
+        :param attachments: (Required if 'message' is not set.) List of objects attached to the post, in the following
+            format: "<owner_id>_<media_id>,<owner_id>_<media_id>", '' — Type of media attachment: 'photo' — photo,
+            'video' — video, 'audio' — audio, 'doc' — document, '<owner_id>' — Media attachment owner ID. '<media_id>' —
+            Media attachment ID. Example: "photo100172_166443618,photo66748_265827614"
+        :type attachments: :obj:`list`
+        :return: `response` object
+        """
+        params = {}
+        params['comment_id'] = comment_id
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        if message is not None:
+            params['message'] = message
+        if attachments is not None:
+            params['attachments'] = _join(attachments)
+        return await self._call('photos.editComment', params, priority)
+
+    async def get(self, owner_id=None, album_id=None, photo_ids=None, rev=None, extended=None, feed_type=None,
+                  feed=None, photo_sizes=None, offset=None, count=None, priority=None):
+        """
+        Returns a list of a user's or community's photos.
+
+        https://vk.com/dev/photos.get
+
+        :param owner_id: ID of the user or community that owns the photos. Use a negative value to designate a community
+            ID.
+        :type owner_id: :obj:`int`
+        :param album_id: Photo album ID. To return information about photos from service albums, use the following
+            string values: 'profile, wall, saved'.
+        :type album_id: :obj:`str`
+        :param photo_ids: Photo IDs.
+        :type photo_ids: :obj:`list`
+        :param rev: Sort order: '1' — reverse chronological, '0' — chronological
+        :type rev: :obj:`bool`
+        :param extended: '1' — to return additional 'likes', 'comments', and 'tags' fields, '0' — (default)
+        :type extended: :obj:`bool`
+        :param feed_type: Type of feed obtained in 'feed' field of the method.
+        :type feed_type: :obj:`str`
+        :param feed: unixtime, that can be obtained with [vk.com/dev/newsfeed.get|newsfeed.get] method in date field to
+            get all photos uploaded by the user on a specific day, or photos the user has been tagged on. Also, 'uid'
+            parameter of the user the event happened with shall be specified.
+        :type feed: :obj:`int`
+        :param photo_sizes: '1' — to return photo sizes in a [vk.com/dev/photo_sizes|special format]
+        :type photo_sizes: :obj:`bool`
+        :param offset:
+        :type offset: :obj:`int`
+        :param count:
+        :type count: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        if album_id is not None:
+            params['album_id'] = album_id
+        if photo_ids is not None:
+            params['photo_ids'] = _join(photo_ids)
+        if rev is not None:
+            params['rev'] = int(rev)
+        if extended is not None:
+            params['extended'] = int(extended)
+        if feed_type is not None:
+            params['feed_type'] = feed_type
+        if feed is not None:
+            params['feed'] = feed
+        if photo_sizes is not None:
+            params['photo_sizes'] = int(photo_sizes)
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        return await self._call('photos.get', params, priority)
+
+    async def get_albums(self, owner_id=None, album_ids=None, offset=None, count=None, need_system=None,
+                         need_covers=None, photo_sizes=None, priority=None):
+        """
+        Returns a list of a user's or community's photo albums.
+
+        https://vk.com/dev/photos.getAlbums
+
+        :param owner_id: ID of the user or community that owns the albums.
+        :type owner_id: :obj:`int`
+        :param album_ids: Album IDs.
+        :type album_ids: :obj:`list`
+        :param offset: Offset needed to return a specific subset of albums.
+        :type offset: :obj:`int`
+        :param count: Number of albums to return.
+        :type count: :obj:`int`
+        :param need_system: '1' — to return system albums with negative IDs
+        :type need_system: :obj:`bool`
+        :param need_covers: '1' — to return an additional 'thumb_src' field, '0' — (default)
+        :type need_covers: :obj:`bool`
+        :param photo_sizes: '1' — to return photo sizes in a
+        :type photo_sizes: :obj:`bool`
+        :return: `response` object
+        """
+        params = {}
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        if album_ids is not None:
+            params['album_ids'] = _join(album_ids)
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        if need_system is not None:
+            params['need_system'] = int(need_system)
+        if need_covers is not None:
+            params['need_covers'] = int(need_covers)
+        if photo_sizes is not None:
+            params['photo_sizes'] = int(photo_sizes)
+        return await self._call('photos.getAlbums', params, priority)
+
+    async def get_albums_count(self, user_id=None, group_id=None, priority=None):
+        """
+        Returns the number of photo albums belonging to a user or community.
+
+        https://vk.com/dev/photos.getAlbumsCount
+
+        :param user_id: User ID.
+        :type user_id: :obj:`int`
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if user_id is not None:
+            params['user_id'] = user_id
+        if group_id is not None:
+            params['group_id'] = group_id
+        return await self._call('photos.getAlbumsCount', params, priority)
+
+    async def get_all(self, owner_id=None, extended=None, offset=None, count=None, photo_sizes=None,
+                      no_service_albums=None, need_hidden=None, skip_hidden=None, priority=None):
+        """
+        Returns a list of photos belonging to a user or community, in reverse chronological order.
+
+        https://vk.com/dev/photos.getAll
+
+        :param owner_id: ID of a user or community that owns the photos. Use a negative value to designate a community
+            ID.
+        :type owner_id: :obj:`int`
+        :param extended: '1' — to return detailed information about photos
+        :type extended: :obj:`bool`
+        :param offset: Offset needed to return a specific subset of photos. By default, '0'.
+        :type offset: :obj:`int`
+        :param count: Number of photos to return.
+        :type count: :obj:`int`
+        :param photo_sizes: '1' – to return image sizes in [vk.com/dev/photo_sizes|special format].
+        :type photo_sizes: :obj:`bool`
+        :param no_service_albums: '1' – to return photos only from standard albums, '0' – to return all photos including
+            those in service albums, e.g., 'My wall photos' (default)
+        :type no_service_albums: :obj:`bool`
+        :param need_hidden: '1' – to show information about photos being hidden from the block above the wall.
+        :type need_hidden: :obj:`bool`
+        :param skip_hidden: '1' – not to return photos being hidden from the block above the wall. Works only with
+            owner_id>0, no_service_albums is ignored.
+        :type skip_hidden: :obj:`bool`
+        :return: `response` object
+        """
+        params = {}
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        if extended is not None:
+            params['extended'] = int(extended)
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        if photo_sizes is not None:
+            params['photo_sizes'] = int(photo_sizes)
+        if no_service_albums is not None:
+            params['no_service_albums'] = int(no_service_albums)
+        if need_hidden is not None:
+            params['need_hidden'] = int(need_hidden)
+        if skip_hidden is not None:
+            params['skip_hidden'] = int(skip_hidden)
+        return await self._call('photos.getAll', params, priority)
+
+    async def get_all_comments(self, owner_id=None, album_id=None, need_likes=None, offset=None, count=None,
+                               priority=None):
+        """
+        Returns a list of comments on a specific photo album or all albums of the user sorted in reverse chronological
+        order.
+
+        https://vk.com/dev/photos.getAllComments
+
+        :param owner_id: ID of the user or community that owns the album(s).
+        :type owner_id: :obj:`int`
+        :param album_id: Album ID. If the parameter is not set, comments on all of the user's albums will be returned.
+        :type album_id: :obj:`int`
+        :param need_likes: '1' — to return an additional 'likes' field, '0' — (default)
+        :type need_likes: :obj:`bool`
+        :param offset: Offset needed to return a specific subset of comments. By default, '0'.
+        :type offset: :obj:`int`
+        :param count: Number of comments to return. By default, '20'. Maximum value, '100'.
+        :type count: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        if album_id is not None:
+            params['album_id'] = album_id
+        if need_likes is not None:
+            params['need_likes'] = int(need_likes)
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        return await self._call('photos.getAllComments', params, priority)
+
+    async def get_by_id(self, photos, extended=None, photo_sizes=None, priority=None):
+        """
+        Returns information about photos by their IDs.
+
+        https://vk.com/dev/photos.getById
+
+        :param photos: IDs separated with a comma, that are IDs of users who posted photos and IDs of photos themselves
+            with an underscore character between such IDs. To get information about a photo in the group album, you
+            shall specify group ID instead of user ID. Example: "1_129207899,6492_135055734, , -20629724_271945303"
+        :type photos: :obj:`list`
+        :param extended: '1' — to return additional fields, '0' — (default)
+        :type extended: :obj:`bool`
+        :param photo_sizes: '1' — to return photo sizes in a
+        :type photo_sizes: :obj:`bool`
+        :return: `response` object
+        """
+        params = {}
+        params['photos'] = _join(photos)
+        if extended is not None:
+            params['extended'] = int(extended)
+        if photo_sizes is not None:
+            params['photo_sizes'] = int(photo_sizes)
+        return await self._call('photos.getById', params, priority)
+
+    async def get_chat_upload_server(self, chat_id, crop_x=None, crop_y=None, crop_width=None, priority=None):
+        """
+        Returns an upload link for chat cover pictures.
+
+        https://vk.com/dev/photos.getChatUploadServer
+
+        :param chat_id: ID of the chat for which you want to upload a cover photo.
+        :type chat_id: :obj:`int`
+        :param crop_x:
+        :type crop_x: :obj:`int`
+        :param crop_y:
+        :type crop_y: :obj:`int`
+        :param crop_width: Width (in pixels) of the photo after cropping.
+        :type crop_width: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['chat_id'] = chat_id
+        if crop_x is not None:
+            params['crop_x'] = crop_x
+        if crop_y is not None:
+            params['crop_y'] = crop_y
+        if crop_width is not None:
+            params['crop_width'] = crop_width
+        return await self._call('photos.getChatUploadServer', params, priority)
+
+    async def get_comments(self, photo_id, owner_id=None, need_likes=None, start_comment_id=None, offset=None,
+                           count=None, sort=None, access_key=None, extended=None, fields=None,
+                           priority=None):
+        """
+        Returns a list of comments on a photo.
+
+        https://vk.com/dev/photos.getComments
+
+        :param owner_id: ID of the user or community that owns the photo.
+        :type owner_id: :obj:`int`
+        :param photo_id: Photo ID.
+        :type photo_id: :obj:`int`
+        :param need_likes: '1' — to return an additional 'likes' field, '0' — (default)
+        :type need_likes: :obj:`bool`
+        :param start_comment_id:
+        :type start_comment_id: :obj:`int`
+        :param offset: Offset needed to return a specific subset of comments. By default, '0'.
+        :type offset: :obj:`int`
+        :param count: Number of comments to return.
+        :type count: :obj:`int`
+        :param sort: Sort order: 'asc' — old first, 'desc' — new first
+        :type sort: :obj:`str`
+        :param access_key:
+        :type access_key: :obj:`str`
+        :param extended:
+        :type extended: :obj:`bool`
+        :param fields:
+        :type fields: :obj:`list`
+        :return: `response` object
+        """
+        params = {}
+        params['photo_id'] = photo_id
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        if need_likes is not None:
+            params['need_likes'] = int(need_likes)
+        if start_comment_id is not None:
+            params['start_comment_id'] = start_comment_id
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        if sort is not None:
+            params['sort'] = sort
+        if access_key is not None:
+            params['access_key'] = access_key
+        if extended is not None:
+            params['extended'] = int(extended)
+        if fields is not None:
+            params['fields'] = _join(fields)
+        return await self._call('photos.getComments', params, priority)
+
+    async def get_market_album_upload_server(self, group_id, priority=None):
+        """
+        Returns the server address for market album photo upload.
+
+        https://vk.com/dev/photos.getMarketAlbumUploadServer
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        return await self._call('photos.getMarketAlbumUploadServer', params, priority)
+
+    async def get_market_upload_server(self, group_id, main_photo=None, crop_x=None, crop_y=None, crop_width=None,
+                                       priority=None):
+        """
+        Returns the server address for market photo upload.
+
+        https://vk.com/dev/photos.getMarketUploadServer
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :param main_photo: '1' if you want to upload the main item photo.
+        :type main_photo: :obj:`bool`
+        :param crop_x: X coordinate of the crop left upper corner.
+        :type crop_x: :obj:`int`
+        :param crop_y: Y coordinate of the crop left upper corner.
+        :type crop_y: :obj:`int`
+        :param crop_width: Width of the cropped photo in px.
+        :type crop_width: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        if main_photo is not None:
+            params['main_photo'] = int(main_photo)
+        if crop_x is not None:
+            params['crop_x'] = crop_x
+        if crop_y is not None:
+            params['crop_y'] = crop_y
+        if crop_width is not None:
+            params['crop_width'] = crop_width
+        return await self._call('photos.getMarketUploadServer', params, priority)
+
+    async def get_messages_upload_server(self, peer_id=None, priority=None):
+        """
+        Returns the server address for photo upload in a private message for a user.
+
+        https://vk.com/dev/photos.getMessagesUploadServer
+
+        :param peer_id: Destination ID. "For user: 'User ID', e.g. '12345'. For chat: '2000000000' + 'Chat ID', e.g.
+            '2000000001'. For community: '- Community ID', e.g. '-12345'. "
+        :type peer_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if peer_id is not None:
+            params['peer_id'] = peer_id
+        return await self._call('photos.getMessagesUploadServer', params, priority)
+
+    async def get_new_tags(self, offset=None, count=None, priority=None):
+        """
+        Returns a list of photos with tags that have not been viewed.
+
+        https://vk.com/dev/photos.getNewTags
+
+        :param offset: Offset needed to return a specific subset of photos.
+        :type offset: :obj:`int`
+        :param count: Number of photos to return.
+        :type count: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        return await self._call('photos.getNewTags', params, priority)
+
+    async def get_owner_cover_photo_upload_server(self, group_id=None, crop_x=None, crop_y=None, crop_x2=None,
+                                                  crop_y2=None,
+                                                  priority=None):
+        """
+        Returns the server address for owner cover upload.
+
+        https://vk.com/dev/photos.getOwnerCoverPhotoUploadServer
+
+        :param group_id: ID of community that owns the album (if the photo will be uploaded to a community album).
+        :type group_id: :obj:`int`
+        :param crop_x: X coordinate of the left-upper corner
+        :type crop_x: :obj:`int`
+        :param crop_y: Y coordinate of the left-upper corner
+        :type crop_y: :obj:`int`
+        :param crop_x2: X coordinate of the right-bottom corner
+        :type crop_x2: :obj:`int`
+        :param crop_y2: Y coordinate of the right-bottom corner
+        :type crop_y2: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if group_id is not None:
+            params['group_id'] = group_id
+        if crop_x is not None:
+            params['crop_x'] = crop_x
+        if crop_y is not None:
+            params['crop_y'] = crop_y
+        if crop_x2 is not None:
+            params['crop_x2'] = crop_x2
+        if crop_y2 is not None:
+            params['crop_y2'] = crop_y2
+        return await self._call('photos.getOwnerCoverPhotoUploadServer', params, priority)
+
+    async def get_owner_photo_upload_server(self, owner_id=None, priority=None):
+        """
+        Returns an upload server address for a profile or community photo.
+
+        https://vk.com/dev/photos.getOwnerPhotoUploadServer
+
+        :param owner_id: identifier of a community or current user. "Note that community id must be negative.
+            'owner_id=1' – user, 'owner_id=-1' – community, "
+        :type owner_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        return await self._call('photos.getOwnerPhotoUploadServer', params, priority)
+
+    async def get_tags(self, photo_id, owner_id=None, access_key=None, priority=None):
+        """
+        Returns a list of tags on a photo.
+
+        https://vk.com/dev/photos.getTags
+
+        :param owner_id: ID of the user or community that owns the photo.
+        :type owner_id: :obj:`int`
+        :param photo_id: Photo ID.
+        :type photo_id: :obj:`int`
+        :param access_key:
+        :type access_key: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        params['photo_id'] = photo_id
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        if access_key is not None:
+            params['access_key'] = access_key
+        return await self._call('photos.getTags', params, priority)
+
+    async def get_upload_server(self, album_id=None, group_id=None, priority=None):
+        """
+        Returns the server address for photo upload.
+
+        https://vk.com/dev/photos.getUploadServer
+
+        :param album_id: Album ID.
+        :type album_id: :obj:`int`
+        :param group_id: ID of community that owns the album (if the photo will be uploaded to a community album).
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if album_id is not None:
+            params['album_id'] = album_id
+        if group_id is not None:
+            params['group_id'] = group_id
+        return await self._call('photos.getUploadServer', params, priority)
+
+    async def get_user_photos(self, user_id=None, offset=None, count=None, extended=None, sort=None, priority=None):
+        """
+        Returns a list of photos in which a user is tagged.
+
+        https://vk.com/dev/photos.getUserPhotos
+
+        :param user_id: User ID.
+        :type user_id: :obj:`int`
+        :param offset: Offset needed to return a specific subset of photos. By default, '0'.
+        :type offset: :obj:`int`
+        :param count: Number of photos to return. Maximum value is 1000.
+        :type count: :obj:`int`
+        :param extended: '1' — to return an additional 'likes' field, '0' — (default)
+        :type extended: :obj:`bool`
+        :param sort: Sort order: '1' — by date the tag was added in ascending order, '0' — by date the tag was added in
+            descending order
+        :type sort: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        if user_id is not None:
+            params['user_id'] = user_id
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        if extended is not None:
+            params['extended'] = int(extended)
+        if sort is not None:
+            params['sort'] = sort
+        return await self._call('photos.getUserPhotos', params, priority)
+
+    async def get_wall_upload_server(self, group_id=None, priority=None):
+        """
+        Returns the server address for photo upload onto a user's wall.
+
+        https://vk.com/dev/photos.getWallUploadServer
+
+        :param group_id: ID of community to whose wall the photo will be uploaded.
+        :type group_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if group_id is not None:
+            params['group_id'] = group_id
+        return await self._call('photos.getWallUploadServer', params, priority)
+
+    async def make_cover(self, photo_id, owner_id=None, album_id=None, priority=None):
+        """
+        Makes a photo into an album cover.
+
+        https://vk.com/dev/photos.makeCover
+
+        :param owner_id: ID of the user or community that owns the photo.
+        :type owner_id: :obj:`int`
+        :param photo_id: Photo ID.
+        :type photo_id: :obj:`int`
+        :param album_id: Album ID.
+        :type album_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['photo_id'] = photo_id
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        if album_id is not None:
+            params['album_id'] = album_id
+        return await self._call('photos.makeCover', params, priority)
+
+    async def move(self, target_album_id, photo_id, owner_id=None, priority=None):
+        """
+        Moves a photo from one album to another.
+
+        https://vk.com/dev/photos.move
+
+        :param owner_id: ID of the user or community that owns the photo.
+        :type owner_id: :obj:`int`
+        :param target_album_id: ID of the album to which the photo will be moved.
+        :type target_album_id: :obj:`int`
+        :param photo_id: Photo ID.
+        :type photo_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['target_album_id'] = target_album_id
+        params['photo_id'] = photo_id
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        return await self._call('photos.move', params, priority)
+
+    async def put_tag(self, photo_id, user_id, owner_id=None, x=None, y=None, x2=None, y2=None, priority=None):
+        """
+        Adds a tag on the photo.
+
+        https://vk.com/dev/photos.putTag
+
+        :param owner_id: ID of the user or community that owns the photo.
+        :type owner_id: :obj:`int`
+        :param photo_id: Photo ID.
+        :type photo_id: :obj:`int`
+        :param user_id: ID of the user to be tagged.
+        :type user_id: :obj:`int`
+        :param x: Upper left-corner coordinate of the tagged area (as a percentage of the photo's width).
+        :type x: :obj:`float`
+        :param y: Upper left-corner coordinate of the tagged area (as a percentage of the photo's height).
+        :type y: :obj:`float`
+        :param x2: Lower right-corner coordinate of the tagged area (as a percentage of the photo's width).
+        :type x2: :obj:`float`
+        :param y2: Lower right-corner coordinate of the tagged area (as a percentage of the photo's height).
+        :type y2: :obj:`float`
+        :return: `response` object
+        """
+        params = {}
+        params['photo_id'] = photo_id
+        params['user_id'] = user_id
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        if x is not None:
+            params['x'] = x
+        if y is not None:
+            params['y'] = y
+        if x2 is not None:
+            params['x2'] = x2
+        if y2 is not None:
+            params['y2'] = y2
+        return await self._call('photos.putTag', params, priority)
+
+    async def remove_tag(self, photo_id, tag_id, owner_id=None, priority=None):
+        """
+        Removes a tag from a photo.
+
+        https://vk.com/dev/photos.removeTag
+
+        :param owner_id: ID of the user or community that owns the photo.
+        :type owner_id: :obj:`int`
+        :param photo_id: Photo ID.
+        :type photo_id: :obj:`int`
+        :param tag_id: Tag ID.
+        :type tag_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['photo_id'] = photo_id
+        params['tag_id'] = tag_id
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        return await self._call('photos.removeTag', params, priority)
+
+    async def reorder_albums(self, album_id, owner_id=None, before=None, after=None, priority=None):
+        """
+        Reorders the album in the list of user albums.
+
+        https://vk.com/dev/photos.reorderAlbums
+
+        :param owner_id: ID of the user or community that owns the album.
+        :type owner_id: :obj:`int`
+        :param album_id: Album ID.
+        :type album_id: :obj:`int`
+        :param before: ID of the album before which the album in question shall be placed.
+        :type before: :obj:`int`
+        :param after: ID of the album after which the album in question shall be placed.
+        :type after: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['album_id'] = album_id
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        if before is not None:
+            params['before'] = before
+        if after is not None:
+            params['after'] = after
+        return await self._call('photos.reorderAlbums', params, priority)
+
+    async def reorder_photos(self, photo_id, owner_id=None, before=None, after=None, priority=None):
+        """
+        Reorders the photo in the list of photos of the user album.
+
+        https://vk.com/dev/photos.reorderPhotos
+
+        :param owner_id: ID of the user or community that owns the photo.
+        :type owner_id: :obj:`int`
+        :param photo_id: Photo ID.
+        :type photo_id: :obj:`int`
+        :param before: ID of the photo before which the photo in question shall be placed.
+        :type before: :obj:`int`
+        :param after: ID of the photo after which the photo in question shall be placed.
+        :type after: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['photo_id'] = photo_id
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        if before is not None:
+            params['before'] = before
+        if after is not None:
+            params['after'] = after
+        return await self._call('photos.reorderPhotos', params, priority)
+
+    async def report(self, owner_id, photo_id, reason=None, priority=None):
+        """
+        Reports (submits a complaint about) a photo.
+
+        https://vk.com/dev/photos.report
+
+        :param owner_id: ID of the user or community that owns the photo.
+        :type owner_id: :obj:`int`
+        :param photo_id: Photo ID.
+        :type photo_id: :obj:`int`
+        :param reason: Reason for the complaint: '0' – spam, '1' – child pornography, '2' – extremism, '3' – violence,
+            '4' – drug propaganda, '5' – adult material, '6' – insult, abuse
+        :type reason: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['owner_id'] = owner_id
+        params['photo_id'] = photo_id
+        if reason is not None:
+            params['reason'] = reason
+        return await self._call('photos.report', params, priority)
+
+    async def report_comment(self, owner_id, comment_id, reason=None, priority=None):
+        """
+        Reports (submits a complaint about) a comment on a photo.
+
+        https://vk.com/dev/photos.reportComment
+
+        :param owner_id: ID of the user or community that owns the photo.
+        :type owner_id: :obj:`int`
+        :param comment_id: ID of the comment being reported.
+        :type comment_id: :obj:`int`
+        :param reason: Reason for the complaint: '0' – spam, '1' – child pornography, '2' – extremism, '3' – violence,
+            '4' – drug propaganda, '5' – adult material, '6' – insult, abuse
+        :type reason: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['owner_id'] = owner_id
+        params['comment_id'] = comment_id
+        if reason is not None:
+            params['reason'] = reason
+        return await self._call('photos.reportComment', params, priority)
+
+    async def restore(self, photo_id, owner_id=None, priority=None):
+        """
+        Restores a deleted photo.
+
+        https://vk.com/dev/photos.restore
+
+        :param owner_id: ID of the user or community that owns the photo.
+        :type owner_id: :obj:`int`
+        :param photo_id: Photo ID.
+        :type photo_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['photo_id'] = photo_id
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        return await self._call('photos.restore', params, priority)
+
+    async def restore_comment(self, comment_id, owner_id=None, priority=None):
+        """
+        Restores a deleted comment on a photo.
+
+        https://vk.com/dev/photos.restoreComment
+
+        :param owner_id: ID of the user or community that owns the photo.
+        :type owner_id: :obj:`int`
+        :param comment_id: ID of the deleted comment.
+        :type comment_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        params['comment_id'] = comment_id
+        if owner_id is not None:
+            params['owner_id'] = owner_id
+        return await self._call('photos.restoreComment', params, priority)
+
+    async def save(self, album_id=None, group_id=None, server=None, photos_list=None, hash=None, latitude=None,
+                   longitude=None, caption=None, priority=None):
+        """
+        Saves photos after successful uploading.
+
+        https://vk.com/dev/photos.save
+
+        :param album_id: ID of the album to save photos to.
+        :type album_id: :obj:`int`
+        :param group_id: ID of the community to save photos to.
+        :type group_id: :obj:`int`
+        :param server: Parameter returned when photos are [vk.com/dev/upload_files|uploaded to server].
+        :type server: :obj:`int`
+        :param photos_list: Parameter returned when photos are [vk.com/dev/upload_files|uploaded to server].
+        :type photos_list: :obj:`str`
+        :param hash: Parameter returned when photos are [vk.com/dev/upload_files|uploaded to server].
+        :type hash: :obj:`str`
+        :param latitude: Geographical latitude, in degrees (from '-90' to '90').
+        :type latitude: :obj:`float`
+        :param longitude: Geographical longitude, in degrees (from '-180' to '180').
+        :type longitude: :obj:`float`
+        :param caption: Text describing the photo. 2048 digits max.
+        :type caption: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        if album_id is not None:
+            params['album_id'] = album_id
+        if group_id is not None:
+            params['group_id'] = group_id
+        if server is not None:
+            params['server'] = server
+        if photos_list is not None:
+            params['photos_list'] = photos_list
+        if hash is not None:
+            params['hash'] = hash
+        if latitude is not None:
+            params['latitude'] = latitude
+        if longitude is not None:
+            params['longitude'] = longitude
+        if caption is not None:
+            params['caption'] = caption
+        return await self._call('photos.save', params, priority)
+
+    async def save_market_album_photo(self, group_id, photo, server, hash, priority=None):
+        """
+        Saves market album photos after successful uploading.
+
+        https://vk.com/dev/photos.saveMarketAlbumPhoto
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :param photo: Parameter returned when photos are [vk.com/dev/upload_files|uploaded to server].
+        :type photo: :obj:`str`
+        :param server: Parameter returned when photos are [vk.com/dev/upload_files|uploaded to server].
+        :type server: :obj:`int`
+        :param hash: Parameter returned when photos are [vk.com/dev/upload_files|uploaded to server].
+        :type hash: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        params['group_id'] = group_id
+        params['photo'] = photo
+        params['server'] = server
+        params['hash'] = hash
+        return await self._call('photos.saveMarketAlbumPhoto', params, priority)
+
+    async def save_market_photo(self, photo, server, hash, group_id=None, crop_data=None, crop_hash=None,
+                                priority=None):
+        """
+        Saves market photos after successful uploading.
+
+        https://vk.com/dev/photos.saveMarketPhoto
+
+        :param group_id: Community ID.
+        :type group_id: :obj:`int`
+        :param photo: Parameter returned when photos are [vk.com/dev/upload_files|uploaded to server].
+        :type photo: :obj:`str`
+        :param server: Parameter returned when photos are [vk.com/dev/upload_files|uploaded to server].
+        :type server: :obj:`int`
+        :param hash: Parameter returned when photos are [vk.com/dev/upload_files|uploaded to server].
+        :type hash: :obj:`str`
+        :param crop_data: Parameter returned when photos are [vk.com/dev/upload_files|uploaded to server].
+        :type crop_data: :obj:`str`
+        :param crop_hash: Parameter returned when photos are [vk.com/dev/upload_files|uploaded to server].
+        :type crop_hash: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        params['photo'] = photo
+        params['server'] = server
+        params['hash'] = hash
+        if group_id is not None:
+            params['group_id'] = group_id
+        if crop_data is not None:
+            params['crop_data'] = crop_data
+        if crop_hash is not None:
+            params['crop_hash'] = crop_hash
+        return await self._call('photos.saveMarketPhoto', params, priority)
+
+    async def save_messages_photo(self, photo, server=None, hash=None, priority=None):
+        """
+        Saves a photo after being successfully uploaded. URL obtained with
+        [vk.com/dev/photos.getMessagesUploadServer|photos.getMessagesUploadServer] method.
+
+        https://vk.com/dev/photos.saveMessagesPhoto
+
+        :param photo: Parameter returned when the photo is [vk.com/dev/upload_files|uploaded to the server].
+        :type photo: :obj:`str`
+        :param server:
+        :type server: :obj:`int`
+        :param hash:
+        :type hash: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        params['photo'] = photo
+        if server is not None:
+            params['server'] = server
+        if hash is not None:
+            params['hash'] = hash
+        return await self._call('photos.saveMessagesPhoto', params, priority)
+
+    async def save_owner_cover_photo(self, photo, hash, priority=None):
+        """
+        Saves cover photo after successful uploading.
+
+        https://vk.com/dev/photos.saveOwnerCoverPhoto
+
+        :param photo: Parameter returned when photos are [vk.com/dev/upload_files|uploaded to server].
+        :type photo: :obj:`str`
+        :param hash: Parameter returned when photos are [vk.com/dev/upload_files|uploaded to server].
+        :type hash: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        params['photo'] = photo
+        params['hash'] = hash
+        return await self._call('photos.saveOwnerCoverPhoto', params, priority)
+
+    async def save_owner_photo(self, server=None, hash=None, photo=None, priority=None):
+        """
+        Saves a profile or community photo. Upload URL can be got with the
+        [vk.com/dev/photos.getOwnerPhotoUploadServer|photos.getOwnerPhotoUploadServer] method.
+
+        https://vk.com/dev/photos.saveOwnerPhoto
+
+        :param server: parameter returned after [vk.com/dev/upload_files|photo upload].
+        :type server: :obj:`str`
+        :param hash: parameter returned after [vk.com/dev/upload_files|photo upload].
+        :type hash: :obj:`str`
+        :param photo: parameter returned after [vk.com/dev/upload_files|photo upload].
+        :type photo: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        if server is not None:
+            params['server'] = server
+        if hash is not None:
+            params['hash'] = hash
+        if photo is not None:
+            params['photo'] = photo
+        return await self._call('photos.saveOwnerPhoto', params, priority)
+
+    async def save_wall_photo(self, photo, user_id=None, group_id=None, server=None, hash=None, latitude=None,
+                              longitude=None, caption=None, priority=None):
+        """
+        Saves a photo to a user's or community's wall after being uploaded.
+
+        https://vk.com/dev/photos.saveWallPhoto
+
+        :param user_id: ID of the user on whose wall the photo will be saved.
+        :type user_id: :obj:`int`
+        :param group_id: ID of community on whose wall the photo will be saved.
+        :type group_id: :obj:`int`
+        :param photo: Parameter returned when the the photo is [vk.com/dev/upload_files|uploaded to the server].
+        :type photo: :obj:`str`
+        :param server:
+        :type server: :obj:`int`
+        :param hash:
+        :type hash: :obj:`str`
+        :param latitude: Geographical latitude, in degrees (from '-90' to '90').
+        :type latitude: :obj:`float`
+        :param longitude: Geographical longitude, in degrees (from '-180' to '180').
+        :type longitude: :obj:`float`
+        :param caption: Text describing the photo. 2048 digits max.
+        :type caption: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        params['photo'] = photo
+        if user_id is not None:
+            params['user_id'] = user_id
+        if group_id is not None:
+            params['group_id'] = group_id
+        if server is not None:
+            params['server'] = server
+        if hash is not None:
+            params['hash'] = hash
+        if latitude is not None:
+            params['latitude'] = latitude
+        if longitude is not None:
+            params['longitude'] = longitude
+        if caption is not None:
+            params['caption'] = caption
+        return await self._call('photos.saveWallPhoto', params, priority)
+
+    async def search(self, q=None, lat=None, long=None, start_time=None, end_time=None, sort=None, offset=None,
+                     count=None, radius=None, priority=None):
+        """
+        Returns a list of photos.
+
+        https://vk.com/dev/photos.search
+
+        :param q: Search query string.
+        :type q: :obj:`str`
+        :param lat: Geographical latitude, in degrees (from '-90' to '90').
+        :type lat: :obj:`float`
+        :param long: Geographical longitude, in degrees (from '-180' to '180').
+        :type long: :obj:`float`
+        :param start_time:
+        :type start_time: :obj:`int`
+        :param end_time:
+        :type end_time: :obj:`int`
+        :param sort: Sort order:
+        :type sort: :obj:`int`
+        :param offset: Offset needed to return a specific subset of photos.
+        :type offset: :obj:`int`
+        :param count: Number of photos to return.
+        :type count: :obj:`int`
+        :param radius: Radius of search in meters (works very approximately). Available values: '10', '100', '800',
+            '6000', '50000'.
+        :type radius: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if q is not None:
+            params['q'] = q
+        if lat is not None:
+            params['lat'] = lat
+        if long is not None:
+            params['long'] = long
+        if start_time is not None:
+            params['start_time'] = start_time
+        if end_time is not None:
+            params['end_time'] = end_time
+        if sort is not None:
+            params['sort'] = sort
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        if radius is not None:
+            params['radius'] = radius
+        return await self._call('photos.search', params, priority)
@@ -0,0 +1,336 @@
+# Generated by scripts/generate_methods.py from avkapi/schema/methods.json. Do not edit.
+
+from ..base import BaseMethod, _join
+
+
+class Users(BaseMethod):
+    """
+    Methods of `users` section
+
+    https://vk.com/dev/methods
+    """
+
+    async def get(self, user_ids=None, fields=None, name_case=None, priority=None):
+        """
+        Returns detailed information on users.
+
+        https://vk.com/dev/users.get
+
+        :param user_ids: User IDs or screen names ('screen_name'). By default, current user ID.
+        :type user_ids: :obj:`list`
+        :param fields: Profile fields to return. Sample values: 'nickname', 'screen_name', 'sex', 'bdate' (birthdate),
+            'city', 'country', 'timezone', 'photo', 'photo_medium', 'photo_big', 'has_mobile', 'contacts', 'education',
+            'online', 'counters', 'relation', 'last_seen', 'activity', 'can_write_private_message', 'can_see_all_posts',
+            'can_post', 'universities',
+        :type fields: :obj:`list`
+        :param name_case: Case for declension of user name and surname: 'nom' — nominative (default), 'gen' — genitive ,
+            'dat' — dative, 'acc' — accusative , 'ins' — instrumental , 'abl' — prepositional
+        :type name_case: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        if user_ids is not None:
+            params['user_ids'] = _join(user_ids)
+        if fields is not None:
+            params['fields'] = _join(fields)
+        if name_case is not None:
+            params['name_case'] = name_case
+        return await self._call('users.get', params, priority)
+
+    async def get_followers(self, user_id=None, offset=None, count=None, fields=None, name_case=None, priority=None):
+        """
+        Returns a list of IDs of followers of the user in question, sorted by date added, most recent first.
+
+        https://vk.com/dev/users.getFollowers
+
+        :param user_id: User ID.
+        :type user_id: :obj:`int`
+        :param offset: Offset needed to return a specific subset of followers.
+        :type offset: :obj:`int`
+        :param count: Number of followers to return.
+        :type count: :obj:`int`
+        :param fields: Profile fields to return. Sample values: 'nickname', 'screen_name', 'sex', 'bdate' (birthdate),
+            'city', 'country', 'timezone', 'photo', 'photo_medium', 'photo_big', 'has_mobile', 'rate', 'contacts',
+            'education', 'online'.
+        :type fields: :obj:`list`
+        :param name_case: Case for declension of user name and surname: 'nom' — nominative (default), 'gen' — genitive ,
+            'dat' — dative, 'acc' — accusative , 'ins' — instrumental , 'abl' — prepositional
+        :type name_case: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        if user_id is not None:
+            params['user_id'] = user_id
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        if fields is not None:
+            params['fields'] = _join(fields)
+        if name_case is not None:
+            params['name_case'] = name_case
+        return await self._call('users.getFollowers', params, priority)
+
+    async def get_nearby(self, latitude, longitude, accuracy=None, timeout=None, radius=None, fields=None,
+                         name_case=None, priority=None):
+        """
+        Indexes current user location and returns nearby users.
+
+        https://vk.com/dev/users.getNearby
+
+        :param latitude: geographic latitude of the place a user is located, in degrees (from -90 to 90)
+        :type latitude: :obj:`float`
+        :param longitude: geographic longitude of the place a user is located, in degrees (from -180 to 180)
+        :type longitude: :obj:`float`
+        :param accuracy: current location accuracy in meters
+        :type accuracy: :obj:`int`
+        :param timeout: time when a user disappears from location search results, in seconds
+        :type timeout: :obj:`int`
+        :param radius: search zone radius type (1 to 4), :* 1 – 300 m,, :* 2 – 2400 m,, :* 3 – 18 km,, :* 4 – 150 km.
+        :type radius: :obj:`int`
+        :param fields: list of additional fields to return. Available values: sex, bdate, city, country, photo_50,
+            photo_100, photo_200_orig, photo_200, photo_400_orig, photo_max, photo_max_orig, online, online_mobile,
+            domain, has_mobile, contacts, connections, site, education, universities, schools, can_post,
+            can_see_all_posts, can_see_audio, can_write_private_message, status, last_seen, common_count, relation,
+            relatives, counters, screen_name, maiden_name, timezone, occupation
+        :type fields: :obj:`list`
+        :param name_case: Case for declension of user name and surname: , nom –nominative (default) , gen – genitive ,
+            dat – dative , acc – accusative , ins – instrumental , abl – prepositional
+        :type name_case: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        params['latitude'] = latitude
+        params['longitude'] = longitude
+        if accuracy is not None:
+            params['accuracy'] = accuracy
+        if timeout is not None:
+            params['timeout'] = timeout
+        if radius is not None:
+            params['radius'] = radius
+        if fields is not None:
+            params['fields'] = _join(fields)
+        if name_case is not None:
+            params['name_case'] = name_case
+        return await self._call('users.getNearby', params, priority)
+
+    async def get_subscriptions(self, user_id=None, extended=None, offset=None, count=None, fields=None, priority=None):
+        """
+        Returns a list of IDs of users and communities followed by the user.
+
+        https://vk.com/dev/users.getSubscriptions
+
+        :param user_id: User ID.
+        :type user_id: :obj:`int`
+        :param extended: '1' — to return a combined list of users and communities, '0' — to return separate lists of
+            users and communities (default)
+        :type extended: :obj:`bool`
+        :param offset: Offset needed to return a specific subset of subscriptions.
+        :type offset: :obj:`int`
+        :param count: Number of users and communities to return.
+        :type count: :obj:`int`
+        :param fields:
+        :type fields: :obj:`list`
+        :return: `response` object
+        """
+        params = {}
+        if user_id is not None:
+            params['user_id'] = user_id
+        if extended is not None:
+            params['extended'] = int(extended)
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        if fields is not None:
+            params['fields'] = _join(fields)
+        return await self._call('users.getSubscriptions', params, priority)
+
+    async def is_app_user(self, user_id=None, priority=None):
+        """
+        Returns information whether a user installed the application.
+
+        https://vk.com/dev/users.isAppUser
+
+        :param user_id:
+        :type user_id: :obj:`int`
+        :return: `response` object
+        """
+        params = {}
+        if user_id is not None:
+            params['user_id'] = user_id
+        return await self._call('users.isAppUser', params, priority)
+
+    async def report(self, user_id, type, comment=None, priority=None):
+        """
+        Reports (submits a complain about) a user.
+
+        https://vk.com/dev/users.report
+
+        :param user_id: ID of the user about whom a complaint is being made.
+        :type user_id: :obj:`int`
+        :param type: Type of complaint: 'porn' – pornography, 'spam' – spamming, 'insult' – abusive behavior,
+            'advertisment' – disruptive advertisements
+        :type type: :obj:`str`
+        :param comment: Comment describing the complaint.
+        :type comment: :obj:`str`
+        :return: `response` object
+        """
+        params = {}
+        params['user_id'] = user_id
+        params['type'] = type
+        if comment is not None:
+            params['comment'] = comment
+        return await self._call('users.report', params, priority)
+
+    async def search(self, q=None, sort=None, offset=None, count=None, fields=None, city=None, country=None,
+                     hometown=None, university_country=None, university=None, university_year=None,
+                     university_faculty=None, university_chair=None, sex=None, status=None,
+                     age_from=None, age_to=None, birth_day=None, birth_month=None, birth_year=None,
+                     online=None, has_photo=None, school_country=None, school_city=None,
+                     school_class=None, school=None, school_year=None, religion=None, interests=None,
+                     company=None, position=None, group_id=None, from_list=None, priority=None):
+        """
+        Returns a list of users matching the search criteria.
+
+        https://vk.com/dev/users.search
+
+        :param q: Search query string (e.g., 'Vasya Babich').
+        :type q: :obj:`str`
+        :param sort: Sort order: '1' — by date registered, '0' — by rating
+        :type sort: :obj:`int`
+        :param offset: Offset needed to return a specific subset of users.
+        :type offset: :obj:`int`
+        :param count: Number of users to return.
+        :type count: :obj:`int`
+        :param fields: Profile fields to return. Sample values: 'nickname', 'screen_name', 'sex', 'bdate' (birthdate),
+            'city', 'country', 'timezone', 'photo', 'photo_medium', 'photo_big', 'has_mobile', 'rate', 'contacts',
+            'education', 'online',
+        :type fields: :obj:`list`
+        :param city: City ID.
+        :type city: :obj:`int`
+        :param country: Country ID.
+        :type country: :obj:`int`
+        :param hometown: City name in a string.
+        :type hometown: :obj:`str`
+        :param university_country: ID of the country where the user graduated.
+        :type university_country: :obj:`int`
+        :param university: ID of the institution of higher education.
+        :type university: :obj:`int`
+        :param university_year: Year of graduation from an institution of higher education.
+        :type university_year: :obj:`int`
+        :param university_faculty: Faculty ID.
+        :type university_faculty: :obj:`int`
+        :param university_chair: Chair ID.
+        :type university_chair: :obj:`int`
+        :param sex: '1' — female, '2' — male, '0' — any (default)
+        :type sex: :obj:`int`
+        :param status: Relationship status: '1' — Not married, '2' — In a relationship, '3' — Engaged, '4' — Married,
+            '5' — It's complicated, '6' — Actively searching, '7' — In love
+        :type status: :obj:`int`
+        :param age_from: Minimum age.
+        :type age_from: :obj:`int`
+        :param age_to: Maximum age.
+        :type age_to: :obj:`int`
+        :param birth_day: Day of birth.
+        :type birth_day: :obj:`int`
+        :param birth_month: Month of birth.
+        :type birth_month: :obj:`int`
+        :param birth_year: Year of birth.
+        :type birth_year: :obj:`int`
+        :param online: '1' — online only, '0' — all users
+        :type online: :obj:`bool`
+        :param has_photo: '1' — with photo only, '0' — all users
+        :type has_photo: :obj:`bool`
+        :param school_country: ID of the country where users finished school.
+        :type school_country: :obj:`int`
+        :param school_city: ID of the city where users finished school.
+        :type school_city: :obj:`int`
+        :param school_class:
+        :type school_class: :obj:`int`
+        :param school: ID of the school.
+        :type school: :obj:`int`
+        :param school_year: School graduation year.
+        :type school_year: :obj:`int`
+        :param religion: Users' religious affiliation.
+        :type religion: :obj:`str`
+        :param interests: Users' interests.
+        :type interests: :obj:`str`
+        :param company: Name of the company where users work.
+        :type company: :obj:`str`
+        :param position: Job position.
+        :type position: :obj:`str`
+        :param group_id: ID of a community to search in communities.
+        :type group_id: :obj:`int`
+        :param from_list:
+        :type from_list: :obj:`list`
+        :return: `response` object
+        """
+        params = {}
+        if q is not None:
+            params['q'] = q
+        if sort is not None:
+            params['sort'] = sort
+        if offset is not None:
+            params['offset'] = offset
+        if count is not None:
+            params['count'] = count
+        if fields is not None:
+            params['fields'] = _join(fields)
+        if city is not None:
+            params['city'] = city
+        if country is not None:
+            params['country'] = country
+        if hometown is not None:
+            params['hometown'] = hometown
+        if university_country is not None:
+            params['university_country'] = university_country
+        if university is not None:
+            params['university'] = university
+        if university_year is not None:
+            params['university_year'] = university_year
+        if university_faculty is not None:
+            params['university_faculty'] = university_faculty
+        if university_chair is not None:
+            params['university_chair'] = university_chair
+        if sex is not None:
+            params['sex'] = sex
+        if status is not None:
+            params['status'] = status
+        if age_from is not None:
+            params['age_from'] = age_from
+        if age_to is not None:
+            params['age_to'] = age_to
+        if birth_day is not None:
+            params['birth_day'] = birth_day
+        if birth_month is not None:
+            params['birth_month'] = birth_month
+        if birth_year is not None:
+            params['birth_year'] = birth_year
+        if online is not None:
+            params['online'] = int(online)
+        if has_photo is not None:
+            params['has_photo'] = int(has_photo)
+        if school_country is not None:
+            params['school_country'] = school_country
+        if school_city is not None:
+            params['school_city'] = school_city
+        if school_class is not None:
+            params['school_class'] = school_class
+        if school is not None:
+            params['school'] = school
+        if school_year is not None:
+            params['school_year'] = school_year
+        if religion is not None:
+            params['religion'] = religion
+        if interests is not None:
+            params['interests'] = interests
+        if company is not None:
+            params['company'] = company
+        if position is not None:
+            params['position'] = position
+        if group_id is not None:
+            params['group_id'] = group_id
+        if from_list is not None:
+            params['from_list'] = _join(from_list)
+        return await self._call('users.search', params, priority)
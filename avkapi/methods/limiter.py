@@ -0,0 +1,137 @@
+import asyncio
+import heapq
+import itertools
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Limits for community tokens (users are allowed to make only 3 requests per second)
+DEFAULT_RATE = 20
+DEFAULT_PERIOD = 1.0
+
+
+class RequestPriority:
+    """
+    Priority classes of outgoing requests. Lower value is served first.
+    """
+    HIGH = 0  # e.g. replies to users
+    NORMAL = 1
+    LOW = 2  # e.g. broadcasts
+
+    ALL = HIGH, NORMAL, LOW
+
+
+class RateLimiter:
+    """
+    Token-bucket scheduler for outgoing API requests.
+
+    Requests which can't be sent right now wait in the priority queue,
+    so requests with higher priority are always sent first.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, period=DEFAULT_PERIOD, burst=None, loop=None):
+        """
+        :param rate: count of requests allowed per period
+        :param period: period in seconds
+        :param burst: bucket capacity (equal to `rate` by default)
+        :param loop: asyncio loop instance
+        """
+        if rate <= 0 or period <= 0:
+            raise ValueError('`rate` and `period` must be positive')
+        if loop is None:
+            loop = asyncio.get_event_loop()
+
+        self.loop = loop
+        self.rate = rate
+        self.period = period
+        self.burst = burst or rate
+
+        self._tokens = float(self.burst)
+        self._updated_at = loop.time()
+        self._waiters = []
+        self._counter = itertools.count()
+        self._wake_handle = None
+
+        self._stats = {priority: {'count': 0, 'total_wait': 0.0, 'max_wait': 0.0}
+                       for priority in RequestPriority.ALL}
+
+    @property
+    def waiting(self):
+        """
+        Count of requests waiting in the queue
+
+        :return:
+        """
+        return len(self._waiters)
+
+    def get_stats(self):
+        """
+        Get statistics of the time requests spent in the queue, grouped by priority
+
+        :return: dict of dicts with `count`, `waiting`, `avg_wait` and `max_wait` keys
+        """
+        waiting = {}
+        for priority, _, future, _ in self._waiters:
+            if not future.done():
+                waiting[priority] = waiting.get(priority, 0) + 1
+
+        result = {}
+        for priority, stats in self._stats.items():
+            result[priority] = {
+                'count': stats['count'],
+                'waiting': waiting.get(priority, 0),
+                'avg_wait': stats['total_wait'] / stats['count'] if stats['count'] else 0.0,
+                'max_wait': stats['max_wait'],
+            }
+        return result
+
+    async def acquire(self, priority=RequestPriority.NORMAL):
+        """
+        Wait until the request can be sent
+
+        :param priority: one of :class:`RequestPriority` values
+        """
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            self._record(priority, 0.0)
+            return
+
+        started_at = self.loop.time()
+        future = self.loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future, started_at))
+        self._schedule_wake()
+        await future
+
+    def _refill(self):
+        now = self.loop.time()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate / self.period)
+        self._updated_at = now
+
+    def _record(self, priority, wait):
+        stats = self._stats.setdefault(priority, {'count': 0, 'total_wait': 0.0, 'max_wait': 0.0})
+        stats['count'] += 1
+        stats['total_wait'] += wait
+        if wait > stats['max_wait']:
+            stats['max_wait'] = wait
+
+    def _schedule_wake(self):
+        if self._wake_handle is not None or not self._waiters:
+            return
+        delay = max(0.0, (1 - self._tokens) * self.period / self.rate)
+        self._wake_handle = self.loop.call_later(delay, self._wake)
+
+    def _wake(self):
+        self._wake_handle = None
+        self._refill()
+
+        now = self.loop.time()
+        while self._waiters and self._tokens >= 1:
+            priority, _, future, started_at = heapq.heappop(self._waiters)
+            if future.done():  # Cancelled
+                continue
+            self._tokens -= 1
+            self._record(priority, now - started_at)
+            future.set_result(None)
+
+        self._schedule_wake()
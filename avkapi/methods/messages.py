@@ -1,29 +1,55 @@
-from .base import BaseMethod
+from .base import _join
+from .generated import messages
+from ..utils.payload import prepare_arg
 
 
-class Messages(BaseMethod):
+class Messages(messages.Messages):
 
     async def send(self, user_id=None, random_id=None, peer_id=None, domain=None, chat_id=None, user_ids=None,
                    message=None, lat=None, long=None, attachment=None, forward_messages=None, sticker_id=None,
-                   group_id=None, keyboard=None, payload=None):
+                   group_id=None, keyboard=None, payload=None, notification=None, priority=None):
+        """
+        Sends a message.
 
-        params = {
-            'user_id': user_id,
-            'random_id': random_id,
-            'peer_id': peer_id,
-            'domain': domain,
-            'chat_id': chat_id,
-            'user_ids': user_ids,
-            'message': message,
-            'lat': lat,
-            'long': long,
-            'attachment': attachment,
-            'forward_messages': forward_messages,
-            'sticker_id': sticker_id,
-            'group_id': group_id,
-            'keyboard': keyboard,
-            'payload': payload,
-        }
+        Schema of the API doesn't describe bot keyboards and payloads yet, so this method is written by hand.
 
-        result = await self._api_request(method_name='messages.send', parameters=params)
-        return result
+        https://vk.com/dev/messages.send
+
+        :param keyboard: keyboard object (dict or JSON string)
+        :param payload: payload of the message (dict or JSON string)
+        :return: id of the message
+        """
+        params = {}
+        if user_id is not None:
+            params['user_id'] = user_id
+        if random_id is not None:
+            params['random_id'] = random_id
+        if peer_id is not None:
+            params['peer_id'] = peer_id
+        if domain is not None:
+            params['domain'] = domain
+        if chat_id is not None:
+            params['chat_id'] = chat_id
+        if user_ids is not None:
+            params['user_ids'] = _join(user_ids)
+        if message is not None:
+            params['message'] = message
+        if lat is not None:
+            params['lat'] = lat
+        if long is not None:
+            params['long'] = long
+        if attachment is not None:
+            params['attachment'] = _join(attachment)
+        if forward_messages is not None:
+            params['forward_messages'] = _join(forward_messages)
+        if sticker_id is not None:
+            params['sticker_id'] = sticker_id
+        if group_id is not None:
+            params['group_id'] = group_id
+        if keyboard is not None:
+            params['keyboard'] = prepare_arg(keyboard)
+        if payload is not None:
+            params['payload'] = prepare_arg(payload)
+        if notification is not None:
+            params['notification'] = int(notification)
+        return await self._call('messages.send', params, priority)
@@ -0,0 +1,49 @@
+import random
+
+# Too many requests per second, flood control, internal server error
+TRANSIENT_ERROR_CODES = (6, 9, 10)
+
+
+class RetryPolicy:
+    """
+    Retry policy for API requests with jittered exponential backoff.
+
+    Delays are randomized in range from 0 to the exponential delay ("full jitter"),
+    so clients failed at the same time don't retry at the same time again.
+    """
+
+    def __init__(self, max_retries=3, base_delay=0.5, max_delay=10.0, codes=TRANSIENT_ERROR_CODES, jitter=True):
+        """
+        :param max_retries: max count of retries of one request (0 disables retries)
+        :param base_delay: delay before the first retry in seconds
+        :param max_delay: upper bound of delay in seconds
+        :param codes: API error codes which can be retried
+        :param jitter: randomize delays
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.codes = frozenset(codes)
+        self.jitter = jitter
+
+    def should_retry(self, error, attempt):
+        """
+        Check request failed with `error` can be retried
+
+        :param error: instance of :obj:`avkapi.types.exceptions.VKAPIError`
+        :param attempt: count of already made retries
+        :return:
+        """
+        return attempt < self.max_retries and error.code in self.codes
+
+    def get_delay(self, attempt):
+        """
+        Get delay before the retry
+
+        :param attempt: count of already made retries
+        :return: delay in seconds
+        """
+        delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+        if self.jitter:
+            return random.uniform(0, delay)
+        return delay
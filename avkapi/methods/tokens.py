@@ -0,0 +1,161 @@
+import logging
+import time
+
+from .limiter import RateLimiter, RequestPriority
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_FAILURES = 3
+DEFAULT_RECOVERY_TIME = 60.0
+
+
+class TokenStrategy:
+    """
+    How the pool chooses the token for the next request
+    """
+    WEIGHTED = 'weighted'  # Smooth weighted round-robin
+    LRU = 'lru'  # Least recently used
+
+
+class Token:
+    """
+    Access token with its own rate budget and health state
+    """
+
+    def __init__(self, access_token, weight=1, limiter=None):
+        """
+        :param access_token:
+        :type access_token: str
+        :param weight: share of requests for the weighted strategy
+        :type weight: int
+        :param limiter: rate limiter of that token
+        :type limiter: :obj:`RateLimiter`
+        """
+        if weight <= 0:
+            raise ValueError('`weight` must be positive')
+
+        self.access_token = access_token
+        self.weight = weight
+        self.limiter = limiter
+
+        self.last_used = 0.0
+        self.failures = 0
+        self.disabled_until = 0.0
+
+        self._current_weight = 0
+
+    @property
+    def healthy(self):
+        """
+        Token is not taken out of the pool
+
+        :return:
+        """
+        return self.disabled_until <= time.monotonic()
+
+    def __repr__(self):
+        token = self.access_token
+        # Only the end of the token is shown, it can be missing (e.g. VK() without token)
+        token = f"...{token[-4:]}" if isinstance(token, str) else repr(token)
+        return f"<Token {token} weight={self.weight} failures={self.failures}>"
+
+
+class TokenPool:
+    """
+    Pool of access tokens for spreading API calls across them.
+
+    Token which fails `max_failures` times in a row is taken out of the pool for `recovery_time` seconds.
+    """
+
+    def __init__(self, tokens, strategy=TokenStrategy.LRU, rate_limit=None,
+                 max_failures=DEFAULT_MAX_FAILURES, recovery_time=DEFAULT_RECOVERY_TIME, loop=None):
+        """
+        :param tokens: list of access tokens (:obj:`str` or :obj:`Token`)
+        :param strategy: one of :class:`TokenStrategy` values
+        :param rate_limit: max count of requests per second for each token without own limiter
+        :param max_failures: count of failures in a row after which token is taken out of the pool
+        :param recovery_time: time in seconds after which failed token is returned to the pool
+        :param loop: asyncio loop instance
+        """
+        if not tokens:
+            raise ValueError('At least one access token is required!')
+        if strategy not in (TokenStrategy.WEIGHTED, TokenStrategy.LRU):
+            raise ValueError(f"Unknown strategy: {strategy}")
+
+        self.strategy = strategy
+        self.max_failures = max_failures
+        self.recovery_time = recovery_time
+
+        self.tokens = []
+        for token in tokens:
+            if not isinstance(token, Token):
+                token = Token(token)
+            if token.limiter is None and rate_limit is not None:
+                token.limiter = RateLimiter(rate=rate_limit, loop=loop)
+            self.tokens.append(token)
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def __iter__(self):
+        return iter(self.tokens)
+
+    def choose(self):
+        """
+        Choose token for the next request without waiting for its rate limit
+
+        :return: :obj:`Token`
+        """
+        candidates = [token for token in self.tokens if token.healthy]
+        if not candidates:
+            # All tokens are failing. Try the one which will be returned first
+            return min(self.tokens, key=lambda token: token.disabled_until)
+
+        if len(candidates) == 1:
+            return candidates[0]
+
+        if self.strategy == TokenStrategy.LRU:
+            return min(candidates, key=lambda token: token.last_used)
+
+        total = 0
+        best = None
+        for token in candidates:
+            token._current_weight += token.weight
+            total += token.weight
+            if best is None or token._current_weight > best._current_weight:
+                best = token
+        best._current_weight -= total
+        return best
+
+    async def acquire(self, priority=RequestPriority.NORMAL):
+        """
+        Choose token and wait for its rate limit
+
+        :param priority: one of :class:`RequestPriority` values
+        :return: :obj:`Token`
+        """
+        token = self.choose()
+        token.last_used = time.monotonic()
+        if token.limiter is not None:
+            await token.limiter.acquire(priority)
+        return token
+
+    def report_success(self, token):
+        """
+        Mark token as working
+
+        :param token:
+        """
+        token.failures = 0
+
+    def report_failure(self, token):
+        """
+        Count token failure and take it out of the pool when it fails too often
+
+        :param token:
+        """
+        token.failures += 1
+        if token.failures >= self.max_failures:
+            token.disabled_until = time.monotonic() + self.recovery_time
+            token.failures = 0
+            logger.warning(f"{token!r} is taken out of the pool for {self.recovery_time} seconds")
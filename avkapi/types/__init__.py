@@ -3,4 +3,9 @@ from .attachment import Attachment
 from .event import Event, EventType
 from .geo import Geo, Place, Coordinates
 from .message import Message, MessageType
+from .message_batch import MessageBatch
 from .photo import Photo
+from . import base
+
+# Check forward references of the fields once all types are defined
+base.MetaVKObject.resolve_types()
@@ -1,14 +1,21 @@
 import io
 import typing
+from collections import abc
 from typing import TypeVar
 
-from .fields import BaseField
-import json
-__all__ = ('MetaVKObject', 'VKObject', 'InputFile', 'String', 'Integer', 'Float', 'Boolean')
+from .fields import BaseField, DateTimeField, Field
+from ..utils import json
+
+__all__ = ('MetaVKObject', 'VKObject', 'Values', 'InputFile', 'String', 'Integer', 'Float', 'Boolean')
 
 PROPS_ATTR_NAME = '_props'
 VALUES_ATTR_NAME = '_values'
 ALIASES_ATTR_NAME = '_aliases'
+DEFAULTS_ATTR_NAME = '_defaults'
+SERIALIZER_ATTR_NAME = '_serializer'
+
+# Prefix of slots which keep values of fields
+SLOT_PREFIX = '_vk_'
 
 # Binding of builtin types
 InputFile = TypeVar('InputFile', 'InputFile', io.BytesIO, io.FileIO, str)
@@ -21,49 +28,204 @@ Boolean = TypeVar('Boolean', bound=bool)
 class MetaVKObject(type):
     """
     Metaclass for vk objects
+
+    Generates compact layout of the object: value of each field is kept in its own slot
+    (``_vk_<alias>``), so objects don't have ``__dict__`` and fields are read by precomputed offsets.
     """
     _objects = {}
+    _unresolved = []
 
     def __new__(mcs, name, bases, namespace, **kwargs):
-        cls = super(MetaVKObject, mcs).__new__(mcs, name, bases, namespace)
-
         props = {}
-        values = {}
         aliases = {}
 
-        # Get props, values, aliases from parent objects
+        # Get props, aliases from parent objects
         for base in bases:
             if not isinstance(base, MetaVKObject):
                 continue
             props.update(getattr(base, PROPS_ATTR_NAME))
-            # values.update(getattr(base, VALUES_ATTR_NAME))
             aliases.update(getattr(base, ALIASES_ATTR_NAME))
 
-        # Scan current object for props
-        for name, prop in ((name, prop) for name, prop in namespace.items() if isinstance(prop, BaseField)):
+        # Scan current object for props and generate slots for the new ones
+        own_props = [(prop_name, prop) for prop_name, prop in namespace.items() if isinstance(prop, BaseField)]
+        slots = list(namespace.get('__slots__', ()))
+        for prop_name, prop in own_props:
+            alias = prop.alias or prop_name
+            if not alias.isidentifier():
+                raise TypeError(f"Alias of the field '{name}.{prop_name}' must be an identifier: {alias!r}")
+            if alias not in props:
+                slots.append(SLOT_PREFIX + alias)
+        namespace['__slots__'] = tuple(slots)
+
+        cls = super(MetaVKObject, mcs).__new__(mcs, name, bases, namespace)
+
+        for prop_name, prop in own_props:
+            prop.bind(getattr(cls, SLOT_PREFIX + prop.alias))
             props[prop.alias] = prop
-            if prop.default is not None:
-                values[prop.alias] = prop.default
-            aliases[name] = prop.alias
+            aliases[prop_name] = prop.alias
 
         # Set attributes
         setattr(cls, PROPS_ATTR_NAME, props)
-        # setattr(cls, VALUES_ATTR_NAME, values)
         setattr(cls, ALIASES_ATTR_NAME, aliases)
+        setattr(cls, DEFAULTS_ATTR_NAME, tuple((key, prop) for key, prop in props.items() if prop.default))
+        setattr(cls, SERIALIZER_ATTR_NAME, staticmethod(_make_serializer(props)))
 
         mcs._objects[cls.__name__] = cls
+
+        # Bind forward references (e.g. `ListField(base='Message')`) to the classes already defined
+        for prop_name, prop in own_props:
+            if isinstance(prop.base_object, str):
+                mcs._unresolved.append((cls, prop_name, prop))
+        mcs._resolve_references()
         return cls
 
+    @classmethod
+    def _resolve_references(mcs):
+        unresolved = []
+        for owner, prop_name, prop in mcs._unresolved:
+            base_object = mcs._objects.get(prop.base_object)
+            if base_object is None:
+                unresolved.append((owner, prop_name, prop))
+            else:
+                prop.base_object = base_object
+        mcs._unresolved[:] = unresolved
+
+    @classmethod
+    def resolve_types(mcs):
+        """
+        Check that all forward references of fields are bound to classes.
+
+        References are bound when the target class is defined, so only references
+        to unknown classes are left here.
+
+        :raise: TypeError
+        """
+        mcs._resolve_references()
+        if mcs._unresolved:
+            names = ', '.join(f"{owner.__name__}.{prop_name} -> {prop.base_object!r}"
+                              for owner, prop_name, prop in mcs._unresolved)
+            raise TypeError(f"Unknown types in fields: {names}")
+
     @property
     def types(cls):
         return cls._objects
 
 
+def _make_serializer(props):
+    """
+    Build function which converts object with given props to python.
+
+    Accessors and serializers of fields are looked up once, plain fields are exported as is.
+    Raw values of plain and datetime fields of lazy objects are exported without deserializing.
+
+    :param props: dict of props by aliases
+    :return: callable
+    """
+    plan = []
+    for name, prop in props.items():
+        plain = type(prop) is Field and prop.base_object is None
+        passthrough = plain or isinstance(prop, DateTimeField)
+        plan.append((name, prop._get_slot, prop.get_value, None if plain else prop.serialize, passthrough))
+    plan = tuple(plan)
+
+    def serialize(obj):
+        result = {}
+        raw = obj._raw
+        for name, get_slot, get_value, export, passthrough in plan:
+            try:
+                value = get_slot(obj)
+            except AttributeError:
+                if raw is None or name not in raw:
+                    continue
+                value = raw[name] if passthrough else get_value(obj)
+            if value is None:
+                continue
+            if export is not None:
+                value = export(value)
+            elif isinstance(value, VKObject):
+                value = value.to_python()
+            result[name] = value
+
+        extra = obj._extra
+        if extra:
+            for name, value in extra.items():
+                if value is None:
+                    continue
+                if isinstance(value, VKObject):
+                    value = value.to_python()
+                result[name] = value
+        return result
+
+    return serialize
+
+
+class Values(abc.MutableMapping):
+    """
+    Mapping view of the object values (by aliases).
+
+    Values of fields are kept in slots of the object, other values are kept in the extra dict.
+    """
+    __slots__ = ('_obj',)
+
+    def __init__(self, obj):
+        self._obj = obj
+
+    def __getitem__(self, key):
+        prop = self._obj.props.get(key)
+        if prop is not None:
+            if not prop.is_set(self._obj):
+                raise KeyError(key)
+            return prop.get_value(self._obj)
+        extra = self._obj._extra
+        if extra is None:
+            raise KeyError(key)
+        return extra[key]
+
+    def __setitem__(self, key, value):
+        self._obj._reset_hash()
+        prop = self._obj.props.get(key)
+        if prop is not None:
+            prop._set_slot(self._obj, value)
+            return
+        if self._obj._extra is None:
+            self._obj._extra = {}
+        self._obj._extra[key] = value
+
+    def __delitem__(self, key):
+        prop = self._obj.props.get(key)
+        if prop is not None:
+            if not prop.is_set(self._obj):
+                raise KeyError(key)
+            prop.del_value(self._obj)
+            return
+        extra = self._obj._extra
+        if extra is None:
+            raise KeyError(key)
+        del extra[key]
+        self._obj._reset_hash()
+
+    def __iter__(self):
+        obj = self._obj
+        for key, prop in obj.props.items():
+            if prop.is_set(obj):
+                yield key
+        if obj._extra:
+            yield from list(obj._extra)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
 class VKObject(metaclass=MetaVKObject):
     """
     Abstract class for vk objects
     """
 
+    __slots__ = ('_conf', '_extra', '_raw', '_hash')
+
     def __init__(self, conf=None, **kwargs):
         """
         Deserialize object
@@ -71,24 +233,31 @@ class VKObject(metaclass=MetaVKObject):
         :param conf:
         :param kwargs:
         """
-        if conf is None:
-            conf = {}
         self._conf = conf
+        self._extra = None
+        self._raw = None
+        self._hash = None
 
         # Load data
+        props = self.props
         for key, value in kwargs.items():
-            if key in self.props:
-                self.props[key].set_value(self, value, parent=self)
+            prop = props.get(key)
+            if prop is not None:
+                prop.set_value(self, value, parent=self)
             else:
-                self.values[key] = value
+                if self._extra is None:
+                    self._extra = {}
+                self._extra[key] = value
 
         # Load default values
-        for key, value in self.props.items():
-            if value.default and key not in self.values:
-                self.values[key] = value.default
+        for key, prop in getattr(self, DEFAULTS_ATTR_NAME):
+            if not prop.is_set(self):
+                prop._set_slot(self, prop.default)
 
     @property
     def conf(self) -> typing.Dict[str, typing.Any]:
+        if self._conf is None:
+            self._conf = {}
         return self._conf
 
     @property
@@ -110,29 +279,51 @@ class VKObject(metaclass=MetaVKObject):
         return getattr(self, ALIASES_ATTR_NAME, {})
 
     @property
-    def values(self):
+    def values(self) -> Values:
         """
         Get values
 
-        :return:
+        :return: mutable mapping view of values
         """
-        if not hasattr(self, VALUES_ATTR_NAME):
-            setattr(self, VALUES_ATTR_NAME, {})
-        return getattr(self, VALUES_ATTR_NAME)
+        return Values(self)
 
     @property
     def types(self):
         return type(self).types
 
     @classmethod
-    def to_object(cls, data):
+    def to_object(cls, data, conf=None, lazy=False):
         """
         Deserialize object
 
+        In lazy mode raw data is kept in the object and each field is deserialized
+        on the first access, so `data` must not be changed after that.
+
         :param data:
+        :param conf:
+        :param lazy: deserialize fields on access
         :return:
         """
-        return cls(**data)
+        if not lazy:
+            return cls(conf=conf, **data)
+
+        obj = cls.__new__(cls)
+        obj._conf = conf
+        obj._extra = None
+        obj._raw = data
+        obj._hash = None
+
+        props = obj.props
+        for key, value in data.items():
+            if key not in props:
+                if obj._extra is None:
+                    obj._extra = {}
+                obj._extra[key] = value
+
+        for key, prop in getattr(obj, DEFAULTS_ATTR_NAME):
+            if key not in data:
+                prop._set_slot(obj, prop.default)
+        return obj
 
     def to_python(self) -> typing.Dict:
         """
@@ -140,33 +331,59 @@ class VKObject(metaclass=MetaVKObject):
 
         :return:
         """
-        self.clean()
-        result = {}
-        for name, value in self.values.items():
-            if name in self.props:
-                value = self.props[name].export(self)
-            if isinstance(value, VKObject):
-                value = value.to_python()
-            result[self.props_aliases.get(name, name)] = value
-        return result
+        return getattr(self, SERIALIZER_ATTR_NAME)(self)
 
     def clean(self):
         """
         Remove empty values
         """
-        for key, value in self.values.copy().items():
-            if value is None:
-                del self.values[key]
-
-    def as_json(self) -> str:
+        for prop in self.props.values():
+            if prop.is_set(self) and prop.get_value(self) is None:
+                prop.del_value(self)
+        if self._extra:
+            for key, value in list(self._extra.items()):
+                if value is None:
+                    del self._extra[key]
+
+    def as_json(self, binary=False) -> typing.Union[str, bytes]:
         """
         Get object as JSON string
 
+        :param binary: get UTF-8 encoded JSON (it is faster than encoding of the string)
         :return: JSON
-        :rtype: :obj:`str`
+        :rtype: :obj:`str` or :obj:`bytes`
         """
+        if binary:
+            return json.dumps_bytes(self.to_python())
         return json.dumps(self.to_python())
 
+    def as_bytes(self) -> bytes:
+        """
+        Get object in the compact binary format (see :mod:`avkapi.types.codec`)
+
+        :return: bytes
+        """
+        from . import codec
+        return codec.dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """
+        Decode object from the binary format
+
+        :param data:
+        :return:
+        """
+        from . import codec
+        obj = codec.loads(data)
+        if not isinstance(obj, cls):
+            raise TypeError(f"Data contains {type(obj).__name__}, not {cls.__name__}")
+        return obj
+
+    def __reduce__(self):
+        from . import codec
+        return codec.loads, (codec.dumps(self),)
+
     @classmethod
     def create(cls, *args, **kwargs):
         raise NotImplemented
@@ -199,7 +416,7 @@ class VKObject(metaclass=MetaVKObject):
         :return:
         """
         if key in self.props:
-            return self.props[key].set_value(self, value, self.conf.get('parent', None))
+            return self.props[key].set_value(self, value, parent=self)
         raise KeyError(key)
 
     def __contains__(self, item):
@@ -209,8 +426,13 @@ class VKObject(metaclass=MetaVKObject):
         :param item:
         :return:
         """
-        self.clean()
-        return item in self.values
+        prop = self.props.get(item)
+        if prop is not None:
+            try:
+                return prop._get_slot(self) is not None
+            except AttributeError:
+                return self._raw is not None and self._raw.get(item) is not None
+        return bool(self._extra) and self._extra.get(item) is not None
 
     def __iter__(self):
         """
@@ -227,8 +449,9 @@ class VKObject(metaclass=MetaVKObject):
 
         :return:
         """
-        for key, _ in self:
-            yield key
+        for key in self.values:
+            if key in self:
+                yield key
 
     def iter_values(self):
         """
@@ -239,15 +462,68 @@ class VKObject(metaclass=MetaVKObject):
         for _, value in self:
             yield value
 
+    def get_key(self):
+        """
+        Get natural identity of the object.
+
+        Objects having the key are hashed and compared by the key instead of all values.
+
+        :return: hashable key or None
+        """
+        return None
+
+    def _reset_hash(self):
+        """
+        Drop cached hash of the object and of the objects containing it
+        """
+        obj = self
+        # Hash of the object is computed from hashes of its children and it's cached only if they are cached
+        while obj._hash is not None:
+            obj._hash = None
+            parent = obj._conf.get('parent') if obj._conf else None
+            if not isinstance(parent, VKObject):
+                break
+            obj = parent
+
     def __hash__(self):
+        if self._hash is not None:
+            return self._hash
+        key = self.get_key()
+        if key is not None:
+            self._hash = hash(key)
+            return self._hash
+
+        result, cacheable = self._get_hash()
+        if cacheable:
+            self._hash = result
+        return result
+
+    def _get_hash(self):
+        """
+        Compute hash of the object from its values.
+
+        Lists and dicts can be changed in place without notification of the object,
+        so hash of the object containing them (directly or in child objects) must not be cached.
+
+        :return: hash and flag that hash can be cached
+        """
+        cacheable = True
+
         def _hash(obj):
+            nonlocal cacheable
             buf = 0
             if isinstance(obj, list):
+                cacheable = False
                 for item in obj:
                     buf += _hash(item)
             elif isinstance(obj, dict):
+                cacheable = False
                 for dict_key, dict_value in obj.items():
                     buf += hash(dict_key) + _hash(dict_value)
+            elif isinstance(obj, VKObject):
+                buf += hash(obj)
+                if obj._hash is None:
+                    cacheable = False
             else:
                 try:
                     buf += hash(obj)
@@ -256,10 +532,20 @@ class VKObject(metaclass=MetaVKObject):
             return buf
 
         result = 0
-        for key, value in sorted(self.values.items()):
-            result += hash(key) + _hash(value)
+        for key, value in self.values.items():
+            if value is not None:
+                result += hash(key) + _hash(value)
 
-        return result
+        # Sum can be out of range of hashes, it's reduced as Python does for the returned value
+        return hash(result), cacheable
 
     def __eq__(self, other):
-        return isinstance(other, self.__class__) and hash(other) == hash(self)
+        if self is other:
+            return True
+        if not isinstance(other, self.__class__):
+            return False
+        key = self.get_key()
+        if key is not None:
+            return key == other.get_key()
+        # Hashes of equal objects are equal, values are compared only in case of possible collision
+        return hash(self) == hash(other) and self.to_python() == other.to_python()
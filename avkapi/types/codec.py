@@ -0,0 +1,286 @@
+"""
+Compact binary format of vk objects for storage and IPC.
+
+Values are encoded msgpack-style: one type tag byte and the payload, integers and lengths are varints.
+Objects are encoded by schema of their class: fields are referenced by index instead of name,
+so both sides must have the same versions of the types. Datetime values are encoded as unixtime.
+
+.. code-block:: python3
+
+    data = codec.dumps(message)
+    message = codec.loads(data)
+"""
+import datetime
+import struct
+
+from .base import MetaVKObject, VKObject
+
+__all__ = ('dumps', 'loads')
+
+MAGIC = b'VK\x01'
+
+NONE = 0x00
+FALSE = 0x01
+TRUE = 0x02
+INT = 0x03
+FLOAT = 0x04
+STR = 0x05
+BYTES = 0x06
+LIST = 0x07
+DICT = 0x08
+OBJECT = 0x09
+MISSING = 0x0a
+
+# Decoded value of the unset slot
+_missing = object()
+
+_float = struct.Struct('<d')
+
+_schemas = {}
+
+
+class _Schema:
+    """
+    Layout of the encoded object of the class
+    """
+    __slots__ = ('cls', 'name', 'props', 'fields', 'state')
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.name = cls.__name__.encode()
+        self.props = tuple(cls._props.values())
+        self.fields = tuple((index, prop.alias, prop.slot_name) for index, prop in enumerate(self.props))
+
+        # Other public slots declared by the class (e.g. `Event.message`), private ones keep caches
+        state = []
+        for klass in reversed(cls.__mro__):
+            for slot in klass.__dict__.get('__slots__', ()):
+                if not slot.startswith('_'):
+                    state.append(slot)
+        self.state = tuple(state)
+
+
+def _get_schema(cls):
+    schema = _schemas.get(cls)
+    if schema is None:
+        schema = _schemas[cls] = _Schema(cls)
+    return schema
+
+
+def _write_uint(buf, value):
+    while value > 0x7f:
+        buf.append((value & 0x7f) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def _write_str(buf, value):
+    value = value.encode('utf-8', 'surrogatepass')
+    _write_uint(buf, len(value))
+    buf += value
+
+
+def _encode(buf, value):
+    if value is None:
+        buf.append(NONE)
+    elif value is True:
+        buf.append(TRUE)
+    elif value is False:
+        buf.append(FALSE)
+    elif isinstance(value, int):
+        buf.append(INT)
+        _write_uint(buf, value << 1 if value >= 0 else (-value << 1) - 1)
+    elif isinstance(value, str):
+        buf.append(STR)
+        _write_str(buf, value)
+    elif isinstance(value, VKObject):
+        _encode_object(buf, value)
+    elif isinstance(value, (list, tuple)):
+        buf.append(LIST)
+        _write_uint(buf, len(value))
+        for item in value:
+            _encode(buf, item)
+    elif isinstance(value, dict):
+        buf.append(DICT)
+        _write_uint(buf, len(value))
+        for key, item in value.items():
+            _encode(buf, key)
+            _encode(buf, item)
+    elif isinstance(value, float):
+        buf.append(FLOAT)
+        buf += _float.pack(value)
+    elif isinstance(value, (bytes, bytearray)):
+        buf.append(BYTES)
+        _write_uint(buf, len(value))
+        buf += value
+    elif isinstance(value, datetime.datetime):
+        _encode(buf, round(value.timestamp()))
+    else:
+        raise TypeError(f"Object of type {type(value).__name__} can't be encoded")
+
+
+def _encode_object(buf, obj):
+    schema = _get_schema(type(obj))
+    buf.append(OBJECT)
+    _write_uint(buf, len(schema.name))
+    buf += schema.name
+
+    # Fields: deserialized values and raw values of lazy objects which are not accessed yet
+    values = []
+    raw_values = []
+    raw = obj._raw
+    for index, alias, slot_name in schema.fields:
+        value = getattr(obj, slot_name, _missing)
+        if value is _missing:
+            if raw is not None and alias in raw:
+                raw_values.append((index, raw[alias]))
+        elif value is not None:
+            values.append((index, value))
+
+    for items in (values, raw_values):
+        _write_uint(buf, len(items))
+        for index, value in items:
+            _write_uint(buf, index)
+            _encode(buf, value)
+
+    _encode(buf, obj._extra or None)
+
+    for slot in schema.state:
+        value = getattr(obj, slot, _missing)
+        if value is _missing:
+            buf.append(MISSING)
+        else:
+            _encode(buf, value)
+
+
+def dumps(value) -> bytes:
+    """
+    Encode vk object (or plain python value containing them)
+
+    :param value:
+    :return: bytes
+    """
+    buf = bytearray(MAGIC)
+    _encode(buf, value)
+    return bytes(buf)
+
+
+class _Decoder:
+    __slots__ = ('data', 'pos')
+
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def read_uint(self):
+        data = self.data
+        byte = data[self.pos]
+        if byte < 0x80:
+            self.pos += 1
+            return byte
+
+        result = shift = 0
+        while True:
+            byte = data[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def read_bytes(self):
+        size = self.read_uint()
+        start = self.pos
+        self.pos += size
+        if self.pos > len(self.data):
+            raise ValueError('Unexpected end of data')
+        return self.data[start:self.pos]
+
+    def decode(self, parent=None):
+        data = self.data
+        pos = self.pos
+        tag = data[pos]
+        if tag == INT:
+            value = data[pos + 1]
+            if value < 0x80:
+                self.pos = pos + 2
+            else:
+                self.pos = pos + 1
+                value = self.read_uint()
+            return value >> 1 if not value & 1 else -((value + 1) >> 1)
+        self.pos = pos + 1
+        if tag == STR:
+            return self.read_bytes().decode('utf-8', 'surrogatepass')
+        if tag == NONE:
+            return None
+        if tag == OBJECT:
+            return self.decode_object(parent)
+        if tag == LIST:
+            return [self.decode(parent) for _ in range(self.read_uint())]
+        if tag == DICT:
+            result = {}
+            for _ in range(self.read_uint()):
+                key = self.decode()
+                result[key] = self.decode(parent)
+            return result
+        if tag == TRUE:
+            return True
+        if tag == FALSE:
+            return False
+        if tag == FLOAT:
+            value, = _float.unpack_from(self.data, self.pos)
+            self.pos += _float.size
+            return value
+        if tag == BYTES:
+            return bytes(self.read_bytes())
+        if tag == MISSING:
+            return _missing
+        raise ValueError(f"Unknown tag: {tag:#x}")
+
+    def decode_object(self, parent):
+        name = self.read_bytes().decode()
+        cls = MetaVKObject._objects.get(name)
+        if cls is None:
+            raise ValueError(f"Unknown type: {name}")
+        schema = _get_schema(cls)
+
+        # Values are written straight to slots, without __init__
+        obj = cls.__new__(cls)
+        obj._conf = {'parent': parent} if parent is not None else None
+        obj._raw = None
+        obj._hash = None
+
+        props = schema.props
+        for _ in range(self.read_uint()):
+            prop = props[self.read_uint()]
+            prop._set_slot(obj, self.decode(obj))
+
+        count = self.read_uint()
+        if count:
+            obj._raw = raw = {}
+            for _ in range(count):
+                prop = props[self.read_uint()]
+                raw[prop.alias] = self.decode()
+
+        obj._extra = self.decode()
+
+        for slot in schema.state:
+            value = self.decode()
+            if value is not _missing:
+                setattr(obj, slot, value)
+        return obj
+
+
+def loads(data: bytes):
+    """
+    Decode data encoded by :func:`dumps`
+
+    :param data:
+    :return:
+    """
+    data = bytes(data)
+    if not data.startswith(MAGIC):
+        raise ValueError('Data is not encoded by the codec of this version')
+    decoder = _Decoder(data)
+    decoder.pos = len(MAGIC)
+    return decoder.decode()
@@ -5,6 +5,11 @@ from .message import Message
 
 
 class EventType:
+    """
+    Types of Callback API and Bots Long Poll events
+
+    https://vk.com/dev/groups_events
+    """
     CONFIRMATION = 'confirmation'
 
     MESSAGE_NEW = 'message_new'
@@ -15,17 +20,74 @@ class EventType:
     MESSAGE_ALLOW = 'message_allow'
     MESSAGE_DENY = 'message_deny'
 
+    PHOTO_NEW = 'photo_new'
+    PHOTO_COMMENT_NEW = 'photo_comment_new'
+    PHOTO_COMMENT_EDIT = 'photo_comment_edit'
+    PHOTO_COMMENT_RESTORE = 'photo_comment_restore'
+    PHOTO_COMMENT_DELETE = 'photo_comment_delete'
+
+    AUDIO_NEW = 'audio_new'
+
+    VIDEO_NEW = 'video_new'
+    VIDEO_COMMENT_NEW = 'video_comment_new'
+    VIDEO_COMMENT_EDIT = 'video_comment_edit'
+    VIDEO_COMMENT_RESTORE = 'video_comment_restore'
+    VIDEO_COMMENT_DELETE = 'video_comment_delete'
+
+    WALL_POST_NEW = 'wall_post_new'
+    WALL_REPOST = 'wall_repost'
+    WALL_REPLY_NEW = 'wall_reply_new'
+    WALL_REPLY_EDIT = 'wall_reply_edit'
+    WALL_REPLY_RESTORE = 'wall_reply_restore'
+    WALL_REPLY_DELETE = 'wall_reply_delete'
+
+    BOARD_POST_NEW = 'board_post_new'
+    BOARD_POST_EDIT = 'board_post_edit'
+    BOARD_POST_RESTORE = 'board_post_restore'
+    BOARD_POST_DELETE = 'board_post_delete'
+
+    MARKET_COMMENT_NEW = 'market_comment_new'
+    MARKET_COMMENT_EDIT = 'market_comment_edit'
+    MARKET_COMMENT_RESTORE = 'market_comment_restore'
+    MARKET_COMMENT_DELETE = 'market_comment_delete'
+
+    GROUP_LEAVE = 'group_leave'
+    GROUP_JOIN = 'group_join'
+    USER_BLOCK = 'user_block'
+    USER_UNBLOCK = 'user_unblock'
+
+    POLL_VOTE_NEW = 'poll_vote_new'
+
+    GROUP_OFFICERS_EDIT = 'group_officers_edit'
+    GROUP_CHANGE_SETTINGS = 'group_change_settings'
+    GROUP_CHANGE_PHOTO = 'group_change_photo'
+
+    VKPAY_TRANSACTION = 'vkpay_transaction'
+
 
 class Event(VKObject):
+    """
+    Event of Callback API or Bots Long Poll.
+
+    Objects of message events are deserialized into :obj:`Message`,
+    objects of other events are available as :obj:`dict` in `object` field.
+
+    Message is lazy: its fields (forwarded messages, attachments, etc.)
+    are deserialized only when they are accessed.
+    """
+    __slots__ = ('message',)
+
     type: base.String = fields.Field()
+    object: dict = fields.Field()
     group_id: base.String = fields.Field()
+    event_id: base.String = fields.Field()
     secret: base.String = fields.Field()
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        object_data = kwargs.get('object')
-        object_data['content_type'] = self.type
-
+        self.message = None
         if self.type in EventType.MESSAGES:
-            self.message = Message(**object_data)
+            object_data = kwargs.get('object')
+            object_data['content_type'] = self.type
+            self.message = Message.to_object(object_data, lazy=True)
@@ -8,3 +8,86 @@ class TimeoutWarning(VKException):
 
 class FSMStorageWarning(VKException):
     pass
+
+
+class VKAPIError(VKException):
+    """
+    Error returned by the API.
+
+    Use :meth:`VKAPIError.detect` for getting exception of the right type by error payload.
+    """
+    code = None
+    _codes = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.code is not None:
+            VKAPIError._codes[cls.code] = cls
+
+    def __init__(self, message=None, code=None, request_params=None, method=None):
+        if code is not None:
+            self.code = code
+        self.message = message
+        self.request_params = request_params or []
+        self.method = method
+        super().__init__(f"[{self.code}] {message}")
+
+    @classmethod
+    def detect(cls, error):
+        """
+        Get exception instance for the `error` object of the response
+
+        :param error: `error` object or item of `execute_errors`
+        :type error: dict
+        :return: :obj:`VKAPIError`
+        """
+        code = error.get('error_code')
+        error_class = cls._codes.get(code, VKAPIError)
+        return error_class(message=error.get('error_msg'), code=code,
+                           request_params=error.get('request_params'), method=error.get('method'))
+
+
+class TransientError(VKAPIError):
+    """
+    Request can be retried later
+    """
+
+
+class UnknownError(VKAPIError):
+    code = 1
+
+
+class AuthorizationFailed(VKAPIError):
+    code = 5
+
+
+class TooManyRequests(TransientError):
+    code = 6
+
+
+class PermissionDenied(VKAPIError):
+    code = 7
+
+
+class InvalidRequest(VKAPIError):
+    code = 8
+
+
+class FloodControl(TransientError):
+    code = 9
+
+
+class InternalServerError(TransientError):
+    code = 10
+
+
+class CaptchaNeeded(VKAPIError):
+    code = 14
+
+
+class AccessDenied(VKAPIError):
+    code = 15
+
+
+class InvalidParameter(VKAPIError):
+    code = 100
@@ -13,7 +13,7 @@ class BaseField(metaclass=abc.ABCMeta):
         """
         Init prop
 
-        :param base: class for child element
+        :param base: class for child element or name of the class defined later
         :param default: default value
         :param alias: alias name (for e.g. field 'type' has to be named 'event_type'
                       as 'type' is a builtin Python keyword
@@ -22,15 +22,26 @@ class BaseField(metaclass=abc.ABCMeta):
         self.default = default
         self.alias = alias
 
+        # Accessors of the slot which keeps the value. Bound by MetaVKObject.
+        self.slot_name = None
+        self._get_slot = None
+        self._set_slot = None
+        self._del_slot = None
+
     def __set_name__(self, owner, name):
         if self.alias is None:
             self.alias = name
 
-    def resolve_base(self, instance):
-        if self.base_object is None or hasattr(self.base_object, 'types'):
-            return
-        elif isinstance(self.base_object, str):
-            self.base_object = instance.types.get(self.base_object)
+    def bind(self, slot):
+        """
+        Bind field to the slot of the object
+
+        :param slot: member descriptor generated for `__slots__`
+        """
+        self.slot_name = slot.__name__
+        self._get_slot = slot.__get__
+        self._set_slot = slot.__set__
+        self._del_slot = slot.__delete__
 
     def get_value(self, instance):
         """
@@ -39,7 +50,52 @@ class BaseField(metaclass=abc.ABCMeta):
         :param instance:
         :return:
         """
-        return instance.values.get(self.alias, self.default)
+        try:
+            return self._get_slot(instance)
+        except AttributeError:
+            return self._missing(instance)
+
+    def _missing(self, instance):
+        raw = instance._raw
+        if raw is not None and self.alias in raw:
+            # Lazy object: deserialize raw value on the first access and keep it in the slot
+            value = self.deserialize(raw[self.alias], instance)
+            self._set_slot(instance, value)
+            return value
+        if self.default is None:
+            # Empty values are skipped everywhere, so remember that field is empty for the next access
+            self._set_slot(instance, None)
+        return self.default
+
+    def is_set(self, instance):
+        """
+        Check value is set for the current object instance.
+        Empty values are not counted, as they are skipped by the export.
+
+        :param instance:
+        :return:
+        """
+        try:
+            return self._get_slot(instance) is not None
+        except AttributeError:
+            raw = instance._raw
+            return raw is not None and raw.get(self.alias) is not None
+
+    def del_value(self, instance):
+        """
+        Remove value of the current object instance
+
+        :param instance:
+        """
+        try:
+            self._del_slot(instance)
+        except AttributeError:
+            pass
+        instance._reset_hash()
+        raw = instance._raw
+        if raw is not None and self.alias in raw:
+            # Raw data can be shared with other objects, so it is copied instead of changing
+            instance._raw = {key: value for key, value in raw.items() if key != self.alias}
 
     def set_value(self, instance, value, parent=None):
         """
@@ -50,15 +106,20 @@ class BaseField(metaclass=abc.ABCMeta):
         :param parent:
         :return:
         """
-        self.resolve_base(instance)
         value = self.deserialize(value, parent)
-        instance.values[self.alias] = value
+        self._set_slot(instance, value)
+        instance._reset_hash()
 
     def __get__(self, instance, owner):
-        return self.get_value(instance)
+        if instance is None:
+            return self
+        try:
+            return self._get_slot(instance)
+        except AttributeError:
+            return self._missing(instance)
 
     def __set__(self, instance, value):
-        self.set_value(instance, value)
+        self.set_value(instance, value, parent=instance)
 
     @abc.abstractmethod
     def serialize(self, value):
@@ -100,7 +161,9 @@ class Field(BaseField):
                 and self.base_object is not None \
                 and not hasattr(value, 'base_object') \
                 and not hasattr(value, 'to_python'):
-            return self.base_object(conf={'parent': parent}, **value)
+            # Children of lazy objects are lazy too
+            lazy = getattr(parent, '_raw', None) is not None
+            return self.base_object.to_object(value, conf={'parent': parent}, lazy=lazy)
         return value
 
 
@@ -160,10 +223,51 @@ class DateTimeField(BaseField):
 
     in: unixtime
     out: datetime
+
+    Unixtime is kept as is and converted to datetime on the first access,
+    so objects which dates are not read are serialized back without conversions.
     """
 
-    def serialize(self, value: datetime.datetime):
-        return round(value.timestamp())
+    # Default timezone of datetime objects. Naive local time is used when it is None,
+    # set it to e.g. `datetime.timezone.utc` for getting timezone-aware datetime objects.
+    timezone = None
+
+    def __init__(self, *, tz=None, **kwargs):
+        """
+        :param tz: timezone of this field (overrides :attr:`DateTimeField.timezone`)
+        """
+        super(DateTimeField, self).__init__(**kwargs)
+        self.tz = tz
+
+    def to_datetime(self, value) -> datetime.datetime:
+        """
+        Convert unixtime to datetime
+
+        :param value: unixtime
+        :return:
+        """
+        tz = self.tz or self.timezone
+        return datetime.datetime.fromtimestamp(value, tz)
+
+    def get_value(self, instance):
+        try:
+            value = self._get_slot(instance)
+        except AttributeError:
+            value = self._missing(instance)
+        if isinstance(value, (int, float)):
+            value = self.to_datetime(value)
+            self._set_slot(instance, value)
+        return value
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return self.get_value(instance)
+
+    def serialize(self, value):
+        if isinstance(value, datetime.datetime):
+            return round(value.timestamp())
+        return value
 
     def deserialize(self, value, parent=None):
-        return datetime.datetime.fromtimestamp(value)
+        return value
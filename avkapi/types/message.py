@@ -22,6 +22,9 @@ class Message(base.VKObject):
 
     https://vk.com/dev/objects/message
     """
+    # Parsed command cache: (text, (command, args))
+    __slots__ = ('_command',)
+
     message_id: base.Integer = fields.Field(alias='id')
     date: datetime.datetime = fields.DateTimeField()
     peer_id: base.Integer = fields.Field()
@@ -36,6 +39,63 @@ class Message(base.VKObject):
     action: Action = fields.Field(base=Action)
     content_type = fields.Field()
 
+    def get_full_command(self) -> typing.Optional[typing.Tuple[str, str]]:
+        """
+        Get command (without slash and mention) and its arguments.
+        Result is cached until text of the message is changed.
+
+        :return: (command, args) or None if message is not a command
+        """
+        text = self.text
+        cached = getattr(self, '_command', None)
+        if cached is not None and cached[0] is text:
+            return cached[1]
+
+        result = None
+        if text and text.startswith('/'):
+            parts = text.split(maxsplit=1)
+            command = parts[0][1:].partition('@')[0]
+            result = command, parts[1] if len(parts) > 1 else ''
+        self._command = text, result
+        return result
+
+    def is_command(self) -> bool:
+        """
+        Check message text is a command
+
+        :return:
+        """
+        return self.get_full_command() is not None
+
+    def get_command(self) -> typing.Optional[str]:
+        """
+        Get command without slash and mention
+
+        :return: command or None
+        """
+        full_command = self.get_full_command()
+        return full_command[0] if full_command is not None else None
+
+    def get_args(self) -> typing.Optional[str]:
+        """
+        Get arguments of the command
+
+        :return: text after command or None
+        """
+        full_command = self.get_full_command()
+        return full_command[1] if full_command is not None else None
+
+    def get_key(self):
+        """
+        Messages are identified by conversation and id
+
+        :return: (peer_id, message_id) or None
+        """
+        # Id of the message is 0 in some events (e.g. messages of chats in Callback API)
+        if self.peer_id is None or not self.message_id:
+            return None
+        return self.peer_id, self.message_id
+
     def __int__(self):
         return self.message_id
 
@@ -0,0 +1,149 @@
+import array
+import datetime
+import itertools
+import typing
+
+from .message import Message
+
+# Type code of columns with ids and dates (signed 64-bit integers)
+INT_TYPECODE = 'q'
+
+
+def _timestamp(value):
+    if isinstance(value, datetime.datetime):
+        return round(value.timestamp())
+    return value
+
+
+class MessageBatch:
+    """
+    Columnar representation of the list of messages.
+
+    Ids, peer ids, sender ids and dates are kept in arrays and texts in the list,
+    so large lists of messages (e.g. from `messages.getHistory`) are decoded
+    without creating :obj:`Message` for each of them. Missing ids and dates are stored as 0.
+
+    .. code-block:: python3
+
+        batch = MessageBatch.from_list(response['items'])
+        for message in batch.filter_peer(peer_id).filter_date(since=yesterday):
+            ...
+    """
+    __slots__ = ('ids', 'peer_ids', 'from_ids', 'dates', 'texts', 'raw')
+
+    def __init__(self, ids=None, peer_ids=None, from_ids=None, dates=None, texts=None, raw=None):
+        """
+        :param ids: array of message ids
+        :param peer_ids: array of peer ids
+        :param from_ids: array of sender ids
+        :param dates: array of unixtime dates
+        :param texts: list of texts
+        :param raw: list of source dicts or None
+        """
+        self.ids = ids if ids is not None else array.array(INT_TYPECODE)
+        self.peer_ids = peer_ids if peer_ids is not None else array.array(INT_TYPECODE)
+        self.from_ids = from_ids if from_ids is not None else array.array(INT_TYPECODE)
+        self.dates = dates if dates is not None else array.array(INT_TYPECODE)
+        self.texts = texts if texts is not None else []
+        self.raw = raw
+
+    @classmethod
+    def from_list(cls, items: typing.Iterable[typing.Dict], keep_raw=True) -> 'MessageBatch':
+        """
+        Decode list of message objects
+
+        :param items: raw messages
+        :param keep_raw: keep source dicts, so rows are converted to :obj:`Message` with all fields
+        :return:
+        """
+        batch = cls(raw=[] if keep_raw else None)
+        add_id = batch.ids.append
+        add_peer_id = batch.peer_ids.append
+        add_from_id = batch.from_ids.append
+        add_date = batch.dates.append
+        add_text = batch.texts.append
+        add_raw = batch.raw.append if keep_raw else None
+
+        for item in items:
+            get = item.get
+            add_id(get('id') or 0)
+            add_peer_id(get('peer_id') or 0)
+            add_from_id(get('from_id') or 0)
+            add_date(get('date') or 0)
+            add_text(get('text'))
+            if add_raw is not None:
+                add_raw(item)
+        return batch
+
+    def __len__(self):
+        return len(self.ids)
+
+    def row(self, index: int) -> Message:
+        """
+        Get message of the row
+
+        :param index:
+        :return: :obj:`Message` (lazy when source dicts are kept)
+        """
+        if self.raw is not None:
+            return Message.to_object(self.raw[index], lazy=True)
+        return Message(id=self.ids[index] or None, peer_id=self.peer_ids[index] or None,
+                       from_id=self.from_ids[index] or None, date=self.dates[index] or None,
+                       text=self.texts[index])
+
+    def __getitem__(self, index: int) -> Message:
+        return self.row(index)
+
+    def __iter__(self) -> typing.Iterator[Message]:
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def compress(self, mask: typing.Iterable[bool]) -> 'MessageBatch':
+        """
+        Get batch of the rows selected by mask
+
+        :param mask: iterable of booleans, one for each row
+        :return:
+        """
+        mask = list(mask)
+        if len(mask) != len(self):
+            raise ValueError(f"Length of the mask ({len(mask)}) doesn't match length of the batch ({len(self)})")
+        return type(self)(
+            ids=array.array(INT_TYPECODE, itertools.compress(self.ids, mask)),
+            peer_ids=array.array(INT_TYPECODE, itertools.compress(self.peer_ids, mask)),
+            from_ids=array.array(INT_TYPECODE, itertools.compress(self.from_ids, mask)),
+            dates=array.array(INT_TYPECODE, itertools.compress(self.dates, mask)),
+            texts=list(itertools.compress(self.texts, mask)),
+            raw=list(itertools.compress(self.raw, mask)) if self.raw is not None else None,
+        )
+
+    def filter_peer(self, *peer_ids: int) -> 'MessageBatch':
+        """
+        Get messages of the conversations
+
+        :param peer_ids:
+        :return:
+        """
+        if len(peer_ids) == 1:
+            peer_id = peer_ids[0]
+            return self.compress([value == peer_id for value in self.peer_ids])
+        peer_ids = frozenset(peer_ids)
+        return self.compress([value in peer_ids for value in self.peer_ids])
+
+    def filter_date(self, since=None, until=None) -> 'MessageBatch':
+        """
+        Get messages sent in the period
+
+        :param since: start of the period (included), unixtime or datetime
+        :param until: end of the period (excluded), unixtime or datetime
+        :return:
+        """
+        since = _timestamp(since)
+        until = _timestamp(until)
+        if since is None and until is None:
+            return self.compress([True] * len(self))
+        if until is None:
+            return self.compress([since <= value for value in self.dates])
+        if since is None:
+            return self.compress([value < until for value in self.dates])
+        return self.compress([since <= value < until for value in self.dates])
@@ -10,6 +10,9 @@ import typing
 
 CONFIGURED = '@CONFIGURED_TASK_FACTORY'
 
+# `Task.current_task` is deprecated since Python 3.7 and removed in 3.9
+_current_task = getattr(asyncio, 'current_task', None) or asyncio.Task.current_task
+
 
 def task_factory(loop: asyncio.BaseEventLoop, coro: typing.Coroutine):
     """
@@ -31,7 +34,7 @@ def task_factory(loop: asyncio.BaseEventLoop, coro: typing.Coroutine):
         del task._source_traceback[-1]
 
     try:
-        task.context = asyncio.Task.current_task().context.copy()
+        task.context = _current_task(loop).context.copy()
 
     except AttributeError:
         task.context = {CONFIGURED: True}
@@ -46,7 +49,7 @@ def get_current_state() -> typing.Dict:
     :return: context
     :rtype: :obj:`dict`
     """
-    task = asyncio.Task.current_task()
+    task = _current_task()
     if task is None:
         raise RuntimeError('Can be used only in Task context.')
     context_ = getattr(task, 'context', None)
@@ -9,6 +9,7 @@ from aiohttp import web
 
 from . import context
 from ..dispatcher.webhook import VK_DISPATCHER_KEY, WebhookRequestHandler
+from ..types.base import MetaVKObject
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +50,7 @@ def start_webhook(dispatcher, webhook_path, *, loop=None, skip_updates=None,
     :param dispatcher:
     :param webhook_path:
     :param loop:
-    :param skip_updates:
+    :param skip_updates: not used in webhook mode (Callback API has no queue of updates to skip)
     :param on_startup:
     :param on_shutdown:
     :param check_ip:
@@ -178,12 +179,16 @@ class Executor:
         self._check_frozen()
         self._freeze = True
 
+        # Fail on unknown types of fields before receiving events
+        MetaVKObject.resolve_types()
         self.loop.set_task_factory(context.task_factory)
 
     def _prepare_webhook(self, path=None, handler=WebhookRequestHandler):
         self._check_frozen()
         self._freeze = True
 
+        # Fail on unknown types of fields before receiving events
+        MetaVKObject.resolve_types()
         self.loop.set_task_factory(context.task_factory)
 
         app = self._web_app
@@ -291,12 +296,15 @@ class Executor:
 
     async def _shutdown(self):
         self.dispatcher.stop_polling()
+        if self.dispatcher.events_queue is not None:
+            await self.dispatcher.events_queue.close()
         await self.dispatcher.storage.close()
         await self.dispatcher.storage.wait_closed()
         await self.dispatcher.vk.close()
 
     async def _startup_polling(self):
         await self._welcome()
+        await self.dispatcher.vk.warm_up()
 
         if self.skip_updates:
             await self._skip_updates()
@@ -323,5 +331,5 @@ class Executor:
 
     async def _startup_webhook(self):
         await self._welcome()
-        if self.skip_updates:
-            await self._skip_updates()
+        await self.dispatcher.vk.warm_up()
+        # Updates are skipped only for polling, Long Poll can be disabled for the group in webhook mode
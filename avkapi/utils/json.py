@@ -7,7 +7,15 @@ try:
 except ImportError:
     _UJSON_IS_AVAILABLE = False
 
+try:
+    import orjson
+    _ORJSON_IS_AVAILABLE = True
+
+except ImportError:
+    _ORJSON_IS_AVAILABLE = False
+
 _use_ujson = _UJSON_IS_AVAILABLE
+_use_orjson = _ORJSON_IS_AVAILABLE
 
 
 def disable_ujson():
@@ -15,12 +23,32 @@ def disable_ujson():
     _use_ujson = False
 
 
+def disable_orjson():
+    global _use_orjson
+    _use_orjson = False
+
+
 def dumps(data):
     if _use_ujson:
         return ujson.dumps(data)
     return json.dumps(data)
 
 
+def dumps_bytes(data):
+    """
+    Serialize data to UTF-8 encoded JSON
+
+    :param data:
+    :return: bytes
+    """
+    if _use_orjson:
+        try:
+            return orjson.dumps(data)
+        except TypeError:  # Integers out of 64-bit range are not supported by orjson
+            pass
+    return dumps(data).encode()
+
+
 def loads(data):
     if _use_ujson:
         return ujson.loads(data)
@@ -1,9 +1,11 @@
 import asyncio
 import logging
 
-from aiohttp import ClientSession
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 
-from .methods import Messages
+from .methods import BaseMethod, Docs, ExecuteBatcher, Groups, Messages, Photos, RateLimiter, RetryPolicy, Token, \
+    TokenPool, Users
+from .methods.batch import DEFAULT_BATCH_DELAY
 from .utils import json
 
 logger = logging.getLogger(__name__)
@@ -11,14 +13,63 @@ logger = logging.getLogger(__name__)
 API_URL = 'https://api.vk.com/method/'
 
 
+class ConnectionProfile:
+    """
+    Settings of the connection pool shared by all API requests
+    """
+
+    def __init__(self, limit=100, limit_per_host=30, keepalive_timeout=60.0, ttl_dns_cache=300, warm_up=0):
+        """
+        :param limit: total limit of simultaneous connections
+        :param limit_per_host: limit of simultaneous connections to the same host
+        :param keepalive_timeout: how long (in seconds) idle connections are kept alive
+        :param ttl_dns_cache: how long (in seconds) resolved addresses are cached
+        :param warm_up: count of connections opened at executor startup
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.warm_up = warm_up
+
+    def get_connector(self, loop=None):
+        """
+        Create connector with this profile
+
+        :param loop:
+        :return: :obj:`aiohttp.TCPConnector`
+        """
+        return TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host,
+                            keepalive_timeout=self.keepalive_timeout,
+                            use_dns_cache=True, ttl_dns_cache=self.ttl_dns_cache, loop=loop)
+
+
 class VK:
-    def __init__(self, confirmation_code=None, secret_key=None, access_token=None, loop=None):
+    def __init__(self, confirmation_code=None, secret_key=None, access_token=None, loop=None,
+                 batch_calls=False, batch_delay=DEFAULT_BATCH_DELAY, rate_limit=None, retry_policy=None,
+                 connection_profile=None, group_id=None):
         """
         :type confirmation_code: str
+        :param access_token: access token, list of tokens or configured pool of tokens
+        :type access_token: :obj:`typing.Union[str, typing.List[typing.Union[str, Token]], TokenPool]`
+        :param batch_calls: coalesce API calls into `execute` requests
+        :type batch_calls: bool
+        :param batch_delay: how long (in seconds) calls are collected into one batch
+        :type batch_delay: float
+        :param rate_limit: max count of requests per second for each token or configured limiter
+            for the single token. Requests are not limited by default.
+        :type rate_limit: :obj:`typing.Union[int, float, RateLimiter, None]`
+        :param retry_policy: policy for retrying requests failed with transient errors
+        :type retry_policy: :obj:`RetryPolicy`
+        :param connection_profile: settings of the connection pool
+        :type connection_profile: :obj:`ConnectionProfile`
+        :param group_id: ID of the community. Required for long polling with user token.
+        :type group_id: int
         """
         self.confirmation_code = confirmation_code
         self.secret_key = secret_key
         self.access_token = access_token
+        self.group_id = group_id
         self.api_version = '5.80'
 
         # asyncio loop instance
@@ -26,24 +77,132 @@ class VK:
             loop = asyncio.get_event_loop()
         self.loop = loop
 
-        self._session = ClientSession(loop=self.loop, json_serialize=json.dumps)
-        self.messages = Messages(access_token=access_token, session=self._session, api_version=self.api_version)
+        if connection_profile is None:
+            connection_profile = ConnectionProfile()
+        self.connection_profile = connection_profile
+        self._session = self._create_session()
+
+        if isinstance(access_token, TokenPool):
+            tokens = access_token
+        else:
+            if not isinstance(access_token, (list, tuple)):
+                access_token = [access_token]
+            if isinstance(rate_limit, RateLimiter):
+                if len(access_token) != 1:
+                    raise ValueError('Limiter instance can be shared only by the single token')
+                access_token = [Token(access_token[0], limiter=rate_limit)]
+                rate_limit = None
+            tokens = TokenPool(access_token, rate_limit=rate_limit, loop=self.loop)
+        self.tokens = tokens
+
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
+        self.retry_policy = retry_policy
+
+        self._batcher = None
+        if batch_calls:
+            api = BaseMethod(access_token=self.tokens, session=self._session, api_version=self.api_version,
+                             retry_policy=self.retry_policy)
+            self._batcher = ExecuteBatcher(api, loop=self.loop, delay=batch_delay)
+
+        self._api = BaseMethod(access_token=self.tokens, session=self._session, api_version=self.api_version,
+                               batcher=self._batcher, retry_policy=self.retry_policy)
+        self.messages = Messages(access_token=self.tokens, session=self._session, api_version=self.api_version,
+                                 batcher=self._batcher, retry_policy=self.retry_policy)
+        self.groups = Groups(access_token=self.tokens, session=self._session, api_version=self.api_version,
+                             batcher=self._batcher, retry_policy=self.retry_policy)
+        self.users = Users(access_token=self.tokens, session=self._session, api_version=self.api_version,
+                           batcher=self._batcher, retry_policy=self.retry_policy)
+        self.photos = Photos(access_token=self.tokens, session=self._session, api_version=self.api_version,
+                             batcher=self._batcher, retry_policy=self.retry_policy)
+        self.docs = Docs(access_token=self.tokens, session=self._session, api_version=self.api_version,
+                         batcher=self._batcher, retry_policy=self.retry_policy)
+
+    def _create_session(self):
+        return ClientSession(loop=self.loop, json_serialize=json.dumps,
+                             connector=self.connection_profile.get_connector(loop=self.loop))
+
+    def _get_method_groups(self):
+        groups = [self._api, self.messages, self.groups, self.users, self.photos, self.docs]
+        if self._batcher is not None:
+            groups.append(self._batcher._api)
+        return groups
 
     async def get_session(self):
-        if not self._session:
-            self._session = ClientSession()
+        """
+        Get session shared by all method groups. Closed session is replaced by the new one.
+
+        :return: :obj:`aiohttp.ClientSession`
+        """
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+            for group in self._get_method_groups():
+                group._session = self._session
+        return self._session
+
+    async def warm_up(self, connections=None):
+        """
+        Open connections to the API (DNS lookup and TLS handshake) before the first requests
+
+        :param connections: count of connections. By default is taken from connection profile.
+        """
+        if connections is None:
+            connections = self.connection_profile.warm_up
+        if not connections:
+            return
+
+        session = await self.get_session()
+
+        async def _connect():
+            try:
+                async with session.head(API_URL) as resp:
+                    await resp.release()
+            except Exception as e:
+                logger.warning(f"Connection warm-up is failed: {e}")
+
+        await asyncio.gather(*(_connect() for _ in range(connections)))
+        logger.info(f"Opened {connections} connections to the API")
 
     async def api_request(self, method_name, parameters):
-        link = f'{API_URL}{method_name}?{parameters}'
-        params = {
-            'access_token': self.access_token,
-            'v': self.api_version
-        }
-        params.update(**parameters)
-        async with self._session.post(link) as resp:
-            status = resp.status
-            text = await resp.text()
-            logger.info(f'Response: {status}, {text}')
+        """
+        Call any API method
+
+        :param method_name: e.g. 'users.get'
+        :type method_name: str
+        :param parameters:
+        :type parameters: dict
+        :return: decoded `response` object
+        :raise: :obj:`avkapi.types.exceptions.VKAPIError`
+        """
+        return await self._api._api_request(method_name, parameters)
+
+    async def get_group_id(self):
+        """
+        Get ID of the community. If it's not configured, it's taken from the community token.
+
+        :return: :obj:`int`
+        """
+        if self.group_id is None:
+            groups = await self.groups.get_by_id()
+            self.group_id = groups[0]['id']
+        return self.group_id
+
+    async def check_long_poll(self, server, key, ts, wait=25):
+        """
+        Wait for events from Bots Long Poll server
+
+        :param server: server address from `groups.getLongPollServer`
+        :param key: secret key of the session
+        :param ts: number of the last received event
+        :param wait: max waiting time in seconds (up to 90)
+        :return: decoded response with `ts` and `updates` or `failed` keys
+        :rtype: :obj:`dict`
+        """
+        session = await self.get_session()
+        params = {'act': 'a_check', 'key': key, 'ts': ts, 'wait': wait}
+        async with session.get(server, params=params, timeout=ClientTimeout(total=wait + 10)) as resp:
+            body = await resp.read()
+        return json.loads(body)
 
     async def close(self):
         if isinstance(self._session, ClientSession) and not self._session.closed:
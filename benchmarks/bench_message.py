@@ -0,0 +1,67 @@
+"""
+Memory and speed of :class:`avkapi.types.Message` objects.
+
+Usage::
+
+    python benchmarks/bench_message.py
+"""
+import gc
+import timeit
+import tracemalloc
+
+from avkapi.types import Message
+
+COUNT = 10000
+
+PAYLOAD = {
+    'id': 1234,
+    'date': 1546300800,
+    'peer_id': 2000000001,
+    'from_id': 1,
+    'text': 'Hello, world!',
+    'random_id': 0,
+    'important': False,
+    'attachments': [],
+    'fwd_messages': [],
+    'content_type': 'message_new',
+}
+
+# Message with forwarded messages, only top-level fields of which are read by handlers
+FORWARDED_PAYLOAD = dict(PAYLOAD, fwd_messages=[dict(PAYLOAD, fwd_messages=[PAYLOAD] * 3)] * 5)
+
+
+def bytes_per_message():
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    messages = [Message(**PAYLOAD) for _ in range(COUNT)]
+    # Touch fields, so lazily created structures are counted too
+    for message in messages:
+        message.text, message.peer_id
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / COUNT
+
+
+def main():
+    message = Message(**PAYLOAD)
+    number = 200000
+
+    print(f"bytes per Message: {bytes_per_message():.0f}")
+    for expression in ('message.text', 'message.peer_id', 'message.geo'):
+        seconds = timeit.timeit(expression, globals={'message': message}, number=number)
+        print(f"{expression}: {seconds / number * 1e9:.0f} ns")
+    seconds = timeit.timeit('Message(**PAYLOAD)', globals={'Message': Message, 'PAYLOAD': PAYLOAD},
+                            number=number // 10)
+    print(f"Message(**payload): {seconds / (number // 10) * 1e6:.2f} us")
+    for lazy in (False, True):
+        seconds = timeit.timeit('Message.to_object(FORWARDED_PAYLOAD, lazy=lazy).text',
+                                globals={'Message': Message, 'FORWARDED_PAYLOAD': FORWARDED_PAYLOAD, 'lazy': lazy},
+                                number=number // 100)
+        print(f"Message.to_object(forwarded, lazy={lazy}).text: {seconds / (number // 100) * 1e6:.2f} us")
+    seconds = timeit.timeit('message.to_python()', globals={'message': message}, number=number // 10)
+    print(f"message.to_python(): {seconds / (number // 10) * 1e6:.2f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+"""
+Generate method groups from the VK API schema (avkapi/schema/methods.json).
+
+Generated modules are checked in to avkapi/methods/generated/, so run this script
+after updating the schema and commit the result.
+
+Usage::
+
+    python scripts/generate_methods.py
+"""
+import json
+import keyword
+import os
+import re
+import textwrap
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCHEMA_PATH = os.path.join(ROOT, 'avkapi', 'schema', 'methods.json')
+OUTPUT_PATH = os.path.join(ROOT, 'avkapi', 'methods', 'generated')
+
+# Method groups (prefixes of method names) to generate
+GROUPS = ('docs', 'groups', 'messages', 'photos', 'users')
+
+LINE_LENGTH = 120
+HEADER = '# Generated by scripts/generate_methods.py from avkapi/schema/methods.json. Do not edit.\n'
+
+TYPES = {
+    'integer': 'int',
+    'number': 'float',
+    'string': 'str',
+    'boolean': 'bool',
+    'array': 'list',
+}
+
+
+def to_snake_case(name):
+    return re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
+
+
+def get_argument_name(name):
+    return name + '_' if keyword.iskeyword(name) else name
+
+
+def format_docstring(method, indent):
+    lines = []
+    description = method.get('description')
+    if description:
+        lines.extend(textwrap.wrap(description, LINE_LENGTH - len(indent)))
+        lines.append('')
+    lines.append(f"https://vk.com/dev/{method['name']}")
+    lines.append('')
+
+    for parameter in method.get('parameters', []):
+        text = f":param {get_argument_name(parameter['name'])}: {parameter.get('description', '')}".rstrip()
+        lines.extend(textwrap.wrap(text, LINE_LENGTH - len(indent), subsequent_indent='    '))
+        lines.append(f":type {get_argument_name(parameter['name'])}: "
+                     f":obj:`{TYPES.get(parameter.get('type'), 'typing.Any')}`")
+    lines.append(':return: `response` object')
+
+    result = [indent + '"""']
+    for line in lines:
+        line = line.replace('\\', '\\\\').replace('"""', '\\"\\"\\"')
+        result.append(indent + line if line else '')
+    result.append(indent + '"""')
+    return result
+
+
+def format_value(parameter, argument):
+    parameter_type = parameter.get('type')
+    if parameter_type == 'array':
+        return f"_join({argument})"
+    if parameter_type == 'boolean':
+        return f"int({argument})"
+    return argument
+
+
+def generate_method(method):
+    group, name = method['name'].split('.', 1)
+    parameters = method.get('parameters', [])
+    # Required parameters go first, so they can be passed positionally
+    ordered = [parameter for parameter in parameters if parameter.get('required')] + \
+              [parameter for parameter in parameters if not parameter.get('required')]
+
+    arguments = ['self']
+    for parameter in ordered:
+        argument = get_argument_name(parameter['name'])
+        arguments.append(argument if parameter.get('required') else f"{argument}=None")
+    arguments.append('priority=None')
+
+    indent = ' ' * 8
+    signature = f"    async def {to_snake_case(name)}("
+    lines = textwrap.wrap(', '.join(arguments), LINE_LENGTH - len(signature) - 2,
+                          subsequent_indent=' ' * (len(signature) - 4), break_long_words=False,
+                          break_on_hyphens=False)
+    lines[0] = signature + lines[0]
+    lines[1:] = ['    ' + line for line in lines[1:]]
+    lines[-1] += '):'
+    lines.extend(format_docstring(method, indent))
+
+    # Parameters are added to the request data directly, without filtering of the dict with all arguments
+    lines.append(indent + 'params = {}')
+    for parameter in ordered:
+        argument = get_argument_name(parameter['name'])
+        value = format_value(parameter, argument)
+        if parameter.get('required'):
+            lines.append(f"{indent}params['{parameter['name']}'] = {value}")
+        else:
+            lines.append(f"{indent}if {argument} is not None:")
+            lines.append(f"{indent}    params['{parameter['name']}'] = {value}")
+    lines.append(f"{indent}return await self._call('{method['name']}', params, priority)")
+    return lines
+
+
+def generate_group(group, methods):
+    class_name = group[0].upper() + group[1:]
+    lines = [
+        HEADER,
+        'from ..base import BaseMethod, _join',
+        '',
+        '',
+        f'class {class_name}(BaseMethod):',
+        '    """',
+        f'    Methods of `{group}` section',
+        '',
+        '    https://vk.com/dev/methods',
+        '    """',
+    ]
+    for method in sorted(methods, key=lambda item: item['name']):
+        lines.append('')
+        lines.extend(generate_method(method))
+    return class_name, '\n'.join(lines) + '\n'
+
+
+def main():
+    with open(SCHEMA_PATH, encoding='utf-8') as schema_file:
+        schema = json.load(schema_file)
+
+    groups = {group: [] for group in GROUPS}
+    for method in schema['methods']:
+        group = method['name'].split('.', 1)[0]
+        if group in groups:
+            groups[group].append(method)
+
+    os.makedirs(OUTPUT_PATH, exist_ok=True)
+    exports = []
+    for group, methods in groups.items():
+        class_name, code = generate_group(group, methods)
+        with open(os.path.join(OUTPUT_PATH, f'{group}.py'), 'w', encoding='utf-8') as output:
+            output.write(code)
+        exports.append((group, class_name))
+        print(f"{group}: {len(methods)} methods")
+
+    with open(os.path.join(OUTPUT_PATH, '__init__.py'), 'w', encoding='utf-8') as output:
+        output.write(HEADER)
+        for group, class_name in exports:
+            output.write(f'from .{group} import {class_name}\n')
+
+
+if __name__ == '__main__':
+    main()
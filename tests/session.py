@@ -0,0 +1,45 @@
+import json
+
+
+class FakeResponse:
+    def __init__(self, body, status=200):
+        self.body = body
+        self.status = status
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def read(self):
+        return self.body.encode()
+
+    def raise_for_status(self):
+        raise RuntimeError(f"Server error {self.status}")
+
+
+class FakeSession:
+    """
+    Session which answers API requests by the handler: (method_name, data) -> response dict
+    """
+    closed = False
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+
+    def post(self, link, data=None):
+        method_name = link.rsplit('/', 1)[-1]
+        self.requests.append((method_name, dict(data or {})))
+        response = self.handler(method_name, data)
+        if isinstance(response, FakeResponse):
+            return response
+        return FakeResponse(json.dumps(response))
+
+    @property
+    def methods(self):
+        return [method_name for method_name, _ in self.requests]
+
+    async def close(self):
+        pass
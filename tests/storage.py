@@ -0,0 +1,36 @@
+from avkapi.dispatcher.storage import BaseStorage
+
+
+class DictStorage(BaseStorage):
+    """
+    Storage in the dict which counts requests of state and data
+    """
+
+    def __init__(self):
+        self.states = {}
+        self.data = {}
+        self.reads = 0
+
+    async def close(self):
+        pass
+
+    async def wait_closed(self):
+        pass
+
+    async def get_state(self, *, chat=None, user=None, default=None):
+        self.reads += 1
+        return self.states.get(self.check_address(chat=chat, user=user), default)
+
+    async def get_data(self, *, chat=None, user=None, default=None):
+        self.reads += 1
+        return dict(self.data.get(self.check_address(chat=chat, user=user), default or {}))
+
+    async def set_state(self, *, chat=None, user=None, state=None):
+        self.states[self.check_address(chat=chat, user=user)] = state
+
+    async def set_data(self, *, chat=None, user=None, data=None):
+        self.data[self.check_address(chat=chat, user=user)] = dict(data or {})
+
+    async def update_data(self, *, chat=None, user=None, data=None, **kwargs):
+        key = self.check_address(chat=chat, user=user)
+        self.data.setdefault(key, {}).update(data or {}, **kwargs)
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from avkapi.methods import BaseMethod, ExecuteBatcher, RetryPolicy
+from avkapi.types.exceptions import InvalidParameter
+
+from .session import FakeSession
+
+
+def make_api(loop, handler, retry_policy=None):
+    session = FakeSession(handler)
+    retry_policy = retry_policy or RetryPolicy(base_delay=0.001, jitter=False)
+    api = BaseMethod(session, 'token', '5.80', retry_policy=retry_policy)
+    batcher = ExecuteBatcher(api, loop=loop, delay=0.001)
+    return BaseMethod(session, 'token', '5.80', batcher=batcher, retry_policy=retry_policy), session
+
+
+def test_calls_are_coalesced(loop):
+    api, session = make_api(loop, lambda method_name, data: {'response': [1, 2, 3]})
+
+    async def run():
+        return await asyncio.gather(*(api._call('users.get', {'user_ids': str(i)}) for i in range(3)))
+
+    assert loop.run_until_complete(run()) == [1, 2, 3]
+    assert session.methods == ['execute']
+    assert session.requests[0][1]['code'].count('API.users.get(') == 3
+
+
+def test_single_call_is_sent_directly(loop):
+    api, session = make_api(loop, lambda method_name, data: {'response': 42})
+
+    assert loop.run_until_complete(api._call('users.get', {})) == 42
+    assert session.methods == ['users.get']
+
+
+def test_errors_of_calls(loop):
+    def handler(method_name, data):
+        return {'response': [False, 7],
+                'execute_errors': [{'method': 'users.get', 'error_code': 100, 'error_msg': 'bad'}]}
+
+    api, session = make_api(loop, handler)
+
+    async def run():
+        return await asyncio.gather(api._call('users.get', {}), api._call('users.get', {}), return_exceptions=True)
+
+    first, second = loop.run_until_complete(run())
+    assert isinstance(first, InvalidParameter)
+    assert second == 7
+    assert session.methods == ['execute']
+
+
+def test_transient_errors_of_calls_are_retried(loop):
+    def handler(method_name, data):
+        if method_name == 'execute':
+            return {'response': [False, 7],
+                    'execute_errors': [{'method': 'users.get', 'error_code': 6, 'error_msg': 'Too many'}]}
+        return {'response': 42}
+
+    api, session = make_api(loop, handler)
+
+    async def run():
+        return await asyncio.gather(api._call('users.get', {}), api._call('users.get', {}))
+
+    assert loop.run_until_complete(run()) == [42, 7]
+    assert session.methods == ['execute', 'users.get']
+
+
+def test_max_calls(loop):
+    with pytest.raises(ValueError):
+        ExecuteBatcher(None, loop=loop, max_calls=26)
@@ -0,0 +1,65 @@
+import pickle
+
+import pytest
+
+from avkapi.types import Event, Geo, Message, codec
+
+PAYLOAD = {'id': 1, 'peer_id': 2, 'from_id': 3, 'date': 1546300800, 'text': 'привет \U0001f600',
+           'random_id': -(2 ** 40), 'important': False, 'payload': '{"button": 1}',
+           'fwd_messages': [{'id': 0, 'peer_id': 2, 'text': 'forwarded', 'geo': {'type': 'point'}}],
+           'geo': {'type': 'point', 'coordinates': [{'latitude': 1.5, 'longitude': -2.5}]},
+           'unknown_field': {'nested': [1, None, b'bytes']}}
+
+
+def test_plain_values():
+    values = [None, True, False, 0, 1, -1, 2 ** 70, -(2 ** 70), 1.5, '', 'text', b'\x00\xff',
+              [1, [2, 3]], {'a': {'b': None}}]
+    for value in values:
+        assert codec.loads(codec.dumps(value)) == value
+
+
+def test_message_round_trip():
+    message = Message(**PAYLOAD)
+    decoded = Message.from_bytes(message.as_bytes())
+    assert type(decoded) is Message
+    assert decoded.to_python() == message.to_python()
+    assert decoded.fwd_messages[0].geo.type == 'point'
+    assert decoded.geo.coordinates[0].longitude == -2.5
+    assert decoded.date == message.date
+
+
+def test_lazy_message_round_trip():
+    message = Message.to_object(PAYLOAD, lazy=True)
+    assert message.text == PAYLOAD['text']
+    decoded = codec.loads(codec.dumps(message))
+    assert decoded.to_python() == Message(**PAYLOAD).to_python()
+    assert decoded.fwd_messages[0].text == 'forwarded'
+
+
+def test_event_round_trip():
+    event = Event(type='message_new', group_id=1, object=dict(PAYLOAD))
+    decoded = codec.loads(codec.dumps(event))
+    assert decoded.type == 'message_new'
+    assert decoded.message.text == PAYLOAD['text']
+
+
+def test_objects_in_containers():
+    value = {'messages': [Message(**PAYLOAD)], 'geo': Geo(type='point')}
+    decoded = codec.loads(codec.dumps(value))
+    assert decoded['messages'][0] == value['messages'][0]
+    assert decoded['geo'].type == 'point'
+
+
+def test_pickle():
+    message = Message(**PAYLOAD)
+    decoded = pickle.loads(pickle.dumps(message))
+    assert decoded.to_python() == message.to_python()
+
+
+def test_invalid_data():
+    with pytest.raises(ValueError):
+        codec.loads(b'{}')
+    with pytest.raises(TypeError):
+        codec.dumps(object())
+    with pytest.raises(TypeError):
+        Geo.from_bytes(Message(**PAYLOAD).as_bytes())
@@ -0,0 +1,92 @@
+import pytest
+
+from avkapi.dispatcher.dedup import BloomDeduplicator, LRUDeduplicator, StorageDeduplicator, get_event_key
+from .storage import DictStorage
+
+
+def test_event_key():
+    assert get_event_key({'event_id': 'abc', 'type': 'message_new', 'object': {'id': 1}}) == 'abc'
+    data = {'group_id': 1, 'type': 'message_new', 'object': {'id': 5, 'peer_id': 2}}
+    assert get_event_key(data) == '1:message_new:2:5'
+    assert get_event_key({'group_id': 1, 'type': 'group_join', 'object': {'user_id': 5}}) is None
+    assert get_event_key({'group_id': 1, 'type': 'message_new', 'object': None}) is None
+
+
+def test_event_key_of_chat_message():
+    first = {'group_id': 1, 'type': 'message_new', 'object': {'id': 0, 'peer_id': 2000000001,
+                                                               'conversation_message_id': 10}}
+    second = {'group_id': 1, 'type': 'message_new', 'object': {'id': 0, 'peer_id': 2000000001,
+                                                                'conversation_message_id': 11}}
+    assert get_event_key(first) == '1:message_new:2000000001:c10'
+    assert get_event_key(first) != get_event_key(second)
+
+
+def test_lru():
+    dedup = LRUDeduplicator(capacity=2)
+    assert not dedup.add('a')
+    assert not dedup.add('b')
+    assert dedup.add('a')  # 'a' is recent now
+    assert not dedup.add('c')  # 'b' is dropped
+    assert 'b' not in dedup
+    assert len(dedup) == 2
+    assert dedup.add('a')
+
+    dedup.discard('a')
+    assert not dedup.add('a')
+
+
+def test_lru_check(loop):
+    dedup = LRUDeduplicator()
+    assert not loop.run_until_complete(dedup.check('a'))
+    assert loop.run_until_complete(dedup.check('a'))
+    loop.run_until_complete(dedup.forget('a'))
+    assert not loop.run_until_complete(dedup.check('a'))
+
+
+def test_bloom():
+    dedup = BloomDeduplicator(capacity=1000, error_rate=0.001)
+    keys = [f'key{n}' for n in range(1000)]
+    assert not any(dedup.add(key) for key in keys)
+    assert all(dedup.add(key) for key in keys)
+
+    false_positives = sum(dedup.add(f'other{n}') for n in range(1000))
+    assert false_positives < 20
+
+
+def test_bloom_generations():
+    dedup = BloomDeduplicator(capacity=100, generations=2)
+    for n in range(100):
+        dedup.add(f'key{n}')
+    assert dedup.add('key0')
+
+    for n in range(200):  # Two more generations
+        dedup.add(f'new{n}')
+    assert not dedup.add('key0')
+
+
+def test_bloom_forget():
+    dedup = BloomDeduplicator(capacity=100)
+    assert not dedup.add('a')
+    dedup.discard('a')
+    assert not dedup.add('a')
+    assert dedup.add('a')
+
+
+def test_bloom_invalid_params():
+    with pytest.raises(ValueError):
+        BloomDeduplicator(error_rate=1)
+    with pytest.raises(ValueError):
+        BloomDeduplicator(capacity=0)
+
+
+def test_storage(loop):
+    storage = DictStorage()
+    first = StorageDeduplicator(storage)
+    second = StorageDeduplicator(storage)  # Another process
+
+    assert not loop.run_until_complete(first.check('a'))
+    assert loop.run_until_complete(second.check('a'))
+    assert loop.run_until_complete(first.check('a'))
+
+    loop.run_until_complete(first.forget('a'))
+    assert not loop.run_until_complete(first.check('a'))
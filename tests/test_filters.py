@@ -0,0 +1,158 @@
+import re
+
+from avkapi import VK
+from avkapi.dispatcher import Dispatcher
+from avkapi.dispatcher.filters import (CHEAP_FILTER, DEFAULT_FILTER_COST, EXPENSIVE_FILTER, PATTERN_LITERAL,
+                                       PATTERN_REGEXP, PATTERN_WORD, REGEXP_FLAGS, Filter, FilterChain, RegexpFilter,
+                                       RegexpMatcher)
+from avkapi.types import Message
+
+PATTERNS = [r'\bhello\b', r'\bпривет\b', 'good morning', 'bye', r'^/start', r'\d{3}', r'\bhel', 'a b']
+TEXTS = ['Hello world', 'say hello_world', 'Привет, мир', 'GOOD MORNING!', 'goodbye', '/start now', 'x /start',
+         'call 911', 'HELP', 'a  b', 'line\nhello', '']
+
+
+def test_kinds():
+    matcher = RegexpMatcher()
+    kinds = [matcher.kinds[matcher.add(pattern)][0] for pattern in PATTERNS]
+    assert kinds == [PATTERN_WORD, PATTERN_WORD, PATTERN_LITERAL, PATTERN_LITERAL,
+                     PATTERN_REGEXP, PATTERN_REGEXP, PATTERN_REGEXP, PATTERN_LITERAL]
+
+    case_sensitive = RegexpMatcher(flags=0)
+    assert case_sensitive.kinds[case_sensitive.add(r'\bhello\b')][0] == PATTERN_REGEXP
+
+
+def test_matcher_is_equal_to_search():
+    matcher = RegexpMatcher()
+    indexes = [matcher.add(pattern) for pattern in PATTERNS]
+    for text in TEXTS:
+        found = matcher.match(text)
+        for pattern, index in zip(PATTERNS, indexes):
+            assert (index in found) == bool(re.search(pattern, text, REGEXP_FLAGS)), (pattern, text)
+
+
+def test_same_pattern_is_added_once():
+    matcher = RegexpMatcher()
+    assert matcher.add('bye') == matcher.add('bye')
+    assert matcher.add('hello') != matcher.add('bye')
+    assert len(matcher.patterns) == 2
+
+
+def test_result_of_last_text_is_reused():
+    matcher = RegexpMatcher()
+    matcher.add('bye')
+    result = matcher.match('goodbye')
+    assert matcher.match('goodbye') is result
+    assert matcher.match('hello') is not result
+
+
+def test_regexp_filter():
+    matcher = RegexpMatcher()
+    shared = RegexpFilter(r'\bhello\b', matcher=matcher)
+    own = RegexpFilter(r'\bhello\b')
+    for text in ('Hello there', 'hell', None):
+        message = Message(id=1, peer_id=1, text=text)
+        assert shared.check(message) == own.check(message) == (text == 'Hello there')
+    assert not shared.check(object())
+
+
+def test_dispatcher_filters_share_matcher(loop):
+    vk = VK(access_token='token', loop=loop)
+    dp = Dispatcher(vk, loop=loop)
+
+    @dp.message_handler(regexp=r'\bhello\b', run_task=False)
+    async def hello(message):
+        return 'hello'
+
+    @dp.message_handler(regexp='good morning', run_task=False)
+    async def morning(message):
+        return 'morning'
+
+    assert len(dp.regexp_matcher.patterns) == 2
+    for text, expected in (('Hello!', ['hello']), ('Good morning', ['morning']), ('hi', [])):
+        message = Message(id=1, peer_id=1, text=text)
+        assert loop.run_until_complete(dp.message_handlers.notify(message)) == expected
+    loop.run_until_complete(vk.close())
+
+
+class Recorder(Filter):
+    def __init__(self, name, calls, result=True, cost=DEFAULT_FILTER_COST):
+        self.name = name
+        self.calls = calls
+        self.result = result
+        self.cost = cost
+
+    def check(self, *args):
+        self.calls.append(self.name)
+        return self.result
+
+
+class AsyncRecorder(Recorder):
+    async def check(self, *args):
+        return super(AsyncRecorder, self).check(*args)
+
+
+def test_chain_order():
+    calls = []
+    expensive = Recorder('expensive', calls, cost=EXPENSIVE_FILTER)
+    default = Recorder('default', calls)
+    cheap = Recorder('cheap', calls, cost=CHEAP_FILTER)
+    chain = FilterChain([expensive, default, cheap])
+    assert chain.filters == (cheap, default, expensive)
+    assert not chain.is_async
+    assert chain.check_sync(())
+    assert calls == ['cheap', 'default', 'expensive']
+
+    assert FilterChain([expensive, default, cheap], reorder=False).filters == (expensive, default, cheap)
+    assert FilterChain([expensive, default, cheap]).without(default).filters == (cheap, expensive)
+
+
+def test_chain_stops_on_failed_filter(loop):
+    calls = []
+    chain = FilterChain([AsyncRecorder('async', calls, cost=EXPENSIVE_FILTER), Recorder('sync', calls, result=False),
+                         lambda *args: calls.append('function') or True])
+    assert chain.is_async
+    assert not loop.run_until_complete(chain.check(()))
+    assert calls == ['sync']
+
+
+def test_async_filters_are_awaited(loop):
+    calls = []
+
+    async def coroutine_filter(*args):
+        calls.append('coroutine')
+        return True
+
+    chain = FilterChain([coroutine_filter, AsyncRecorder('async', calls), Recorder('sync', calls)])
+    assert loop.run_until_complete(chain.check(()))
+    assert calls == ['coroutine', 'async', 'sync']
+
+    calls.clear()
+    chain = FilterChain([AsyncRecorder('async', calls, result=False)])
+    assert not loop.run_until_complete(chain.check(()))
+
+
+def test_handler_filters_order(loop):
+    vk = VK(access_token='token', loop=loop)
+    dp = Dispatcher(vk, loop=loop)
+    calls = []
+
+    @dp.message_handler(Recorder('expensive', calls, cost=EXPENSIVE_FILTER),
+                        Recorder('cheap', calls, cost=CHEAP_FILTER), run_task=False)
+    async def reordered(message):
+        calls.append('handler')
+
+    loop.run_until_complete(dp.message_handlers.notify(Message(id=1, peer_id=1, text='text')))
+    assert calls == ['cheap', 'expensive', 'handler']
+
+    calls.clear()
+    dp.message_handlers.unregister(reordered)
+
+    @dp.message_handler(Recorder('expensive', calls, cost=EXPENSIVE_FILTER),
+                        Recorder('cheap', calls, cost=CHEAP_FILTER), run_task=False, reorder_filters=False)
+    async def ordered(message):
+        calls.append('handler')
+
+    loop.run_until_complete(dp.message_handlers.notify(Message(id=1, peer_id=1, text='text')))
+    assert calls == ['expensive', 'cheap', 'handler']
+    loop.run_until_complete(vk.close())
@@ -0,0 +1,76 @@
+import pytest
+
+from avkapi import VK
+from avkapi.dispatcher import Dispatcher
+from avkapi.dispatcher.filters import CommandsFilter
+from avkapi.types import Message
+
+
+@pytest.fixture
+def dp(loop):
+    vk = VK(access_token='token', loop=loop)
+    yield Dispatcher(vk, loop=loop)
+    loop.run_until_complete(vk.close())
+
+
+def notify(loop, dp, *texts):
+    results = []
+    for text in texts:
+        message = Message(id=1, peer_id=1, from_id=1, text=text)
+        results.append(loop.run_until_complete(dp.message_handlers.notify(message)))
+    return [result[0] if result else None for result in results]
+
+
+def test_commands_index(loop, dp):
+    @dp.message_handler(commands=['start'], run_task=False)
+    async def start(message):
+        return 'start'
+
+    @dp.message_handler(lambda message: message.text == '/help me', run_task=False)
+    async def help_text(message):
+        return 'help text'
+
+    @dp.message_handler(commands=['help', 'info'], run_task=False)
+    async def help_command(message):
+        return 'help'
+
+    @dp.message_handler(run_task=False)
+    async def fallback(message):
+        return 'fallback'
+
+    assert notify(loop, dp, '/start', '/help', '/info x', '/help me', '/other', 'text', '/start@bot') == \
+        ['start', 'help', 'help', 'help text', 'fallback', 'fallback', 'start']
+    assert set(dp.message_handlers._commands_index) == {'start', 'help', 'info'}
+
+
+def test_commands_index_is_rebuilt(loop, dp):
+    @dp.message_handler(commands=['start'], run_task=False)
+    async def start(message):
+        return 'start'
+
+    assert notify(loop, dp, '/start') == ['start']
+    dp.message_handlers.unregister(start)
+    assert notify(loop, dp, '/start') == [None]
+
+    @dp.message_handler(commands=['start'], run_task=False)
+    async def new_start(message):
+        return 'new start'
+
+    assert notify(loop, dp, '/start') == ['new start']
+
+
+def test_subclass_of_commands_filter_is_not_indexed(loop, dp):
+    class AnyCaseCommandsFilter(CommandsFilter):
+        async def check(self, message):
+            command = message.get_command()
+            return command is not None and command.lower() in self.commands
+
+    @dp.message_handler(AnyCaseCommandsFilter(['start']), run_task=False)
+    async def start(message):
+        return 'start'
+
+    @dp.message_handler(commands=['help'], run_task=False)
+    async def help_command(message):
+        return 'help'
+
+    assert notify(loop, dp, '/START', '/help', '/other') == ['start', 'help', None]
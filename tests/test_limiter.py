@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from avkapi.methods import RateLimiter, RequestPriority
+
+
+def test_burst_is_not_delayed(loop):
+    limiter = RateLimiter(rate=5, period=1, loop=loop)
+
+    async def run():
+        started = loop.time()
+        for _ in range(5):
+            await limiter.acquire()
+        return loop.time() - started
+
+    assert loop.run_until_complete(run()) < 0.05
+
+
+def test_higher_priority_is_served_first(loop):
+    limiter = RateLimiter(rate=100, period=1, burst=1, loop=loop)
+    order = []
+
+    async def request(name, priority):
+        await limiter.acquire(priority)
+        order.append(name)
+
+    async def run():
+        await limiter.acquire()  # Bucket is empty now
+        await asyncio.gather(request('low', RequestPriority.LOW), request('normal', RequestPriority.NORMAL),
+                             request('high', RequestPriority.HIGH))
+
+    loop.run_until_complete(run())
+    assert order == ['high', 'normal', 'low']
+
+    stats = limiter.get_stats()
+    assert stats[RequestPriority.HIGH]['count'] == 1
+    assert stats[RequestPriority.LOW]['max_wait'] > 0
+    assert limiter.waiting == 0
+
+
+def test_rate_is_limited(loop):
+    limiter = RateLimiter(rate=100, period=1, burst=1, loop=loop)
+
+    async def run():
+        started = loop.time()
+        for _ in range(6):
+            await limiter.acquire()
+        return loop.time() - started
+
+    assert loop.run_until_complete(run()) >= 0.045
+
+
+def test_invalid_rate(loop):
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0, loop=loop)
@@ -0,0 +1,66 @@
+import datetime
+
+import pytest
+
+from avkapi.types import Message, MessageBatch
+
+ITEMS = [
+    {'id': 1, 'peer_id': 10, 'from_id': 100, 'date': 1000, 'text': 'a', 'geo': {'type': 'point'}},
+    {'id': 2, 'peer_id': 20, 'from_id': 200, 'date': 2000, 'text': 'b'},
+    {'id': 3, 'peer_id': 10, 'from_id': 100, 'date': 3000, 'text': 'c'},
+    {'id': 0, 'peer_id': 30, 'date': 4000, 'text': None},
+]
+
+
+def test_columns():
+    batch = MessageBatch.from_list(ITEMS)
+    assert len(batch) == 4
+    assert list(batch.ids) == [1, 2, 3, 0]
+    assert list(batch.peer_ids) == [10, 20, 10, 30]
+    assert list(batch.from_ids) == [100, 200, 100, 0]
+    assert list(batch.dates) == [1000, 2000, 3000, 4000]
+    assert batch.texts == ['a', 'b', 'c', None]
+    assert batch.ids.typecode == 'q'
+
+
+def test_rows():
+    batch = MessageBatch.from_list(ITEMS)
+    message = batch[0]
+    assert isinstance(message, Message)
+    assert message.geo.type == 'point'
+    assert [message.text for message in batch] == ['a', 'b', 'c', None]
+
+
+def test_rows_without_raw():
+    batch = MessageBatch.from_list(ITEMS, keep_raw=False)
+    assert batch.raw is None
+    assert batch.row(0).to_python() == {'id': 1, 'peer_id': 10, 'from_id': 100, 'date': 1000, 'text': 'a'}
+    assert batch.row(3).to_python() == {'peer_id': 30, 'date': 4000}
+
+
+def test_filter_peer():
+    batch = MessageBatch.from_list(ITEMS)
+    assert list(batch.filter_peer(10).ids) == [1, 3]
+    assert list(batch.filter_peer(20, 30).ids) == [2, 0]
+    assert [message.text for message in batch.filter_peer(10)] == ['a', 'c']
+
+
+def test_filter_date():
+    batch = MessageBatch.from_list(ITEMS)
+    assert list(batch.filter_date(since=2000).ids) == [2, 3, 0]
+    assert list(batch.filter_date(until=3000).ids) == [1, 2]
+    assert list(batch.filter_date(since=2000, until=4000).ids) == [2, 3]
+    assert len(batch.filter_date()) == 4
+
+    since = datetime.datetime.fromtimestamp(2000)
+    assert list(batch.filter_date(since=since).filter_peer(10).ids) == [3]
+
+
+def test_compress():
+    batch = MessageBatch.from_list(ITEMS, keep_raw=False)
+    selected = batch.compress([True, False, False, True])
+    assert list(selected.ids) == [1, 0]
+    assert selected.texts == ['a', None]
+    assert selected.raw is None
+    with pytest.raises(ValueError):
+        batch.compress([True])
@@ -0,0 +1,44 @@
+import importlib.util
+import json
+import os
+
+from avkapi.methods.generated import Groups, Users
+
+from .session import FakeSession
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_generator():
+    spec = importlib.util.spec_from_file_location('generate_methods',
+                                                  os.path.join(ROOT, 'scripts', 'generate_methods.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_generated_methods_are_up_to_date():
+    generator = load_generator()
+    with open(generator.SCHEMA_PATH, encoding='utf-8') as schema_file:
+        schema = json.load(schema_file)
+
+    for group in generator.GROUPS:
+        methods = [method for method in schema['methods'] if method['name'].split('.', 1)[0] == group]
+        _, code = generator.generate_group(group, methods)
+        with open(os.path.join(generator.OUTPUT_PATH, f'{group}.py'), encoding='utf-8') as module:
+            assert module.read() == code, f"Run scripts/generate_methods.py to update '{group}' methods"
+
+
+def test_params(loop):
+    session = FakeSession(lambda method_name, data: {'response': []})
+    users = Users(session, 'token', '5.80')
+    groups = Groups(session, 'token', '5.80')
+
+    loop.run_until_complete(users.get(user_ids=[1, 2], fields=('sex', 'city')))
+    loop.run_until_complete(groups.get(user_id=1, extended=True, count=0))
+    loop.run_until_complete(users.get())
+
+    params = [{key: value for key, value in data.items() if key not in ('access_token', 'v')}
+              for _, data in session.requests]
+    assert session.methods == ['users.get', 'groups.get', 'users.get']
+    assert params == [{'user_ids': '1,2', 'fields': 'sex,city'}, {'user_id': 1, 'extended': 1, 'count': 0}, {}]
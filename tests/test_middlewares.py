@@ -0,0 +1,98 @@
+import pytest
+
+from avkapi import VK
+from avkapi.dispatcher import Dispatcher
+from avkapi.dispatcher.handler import CancelHandler
+from avkapi.dispatcher.middlewares import BaseMiddleware
+from avkapi.types import Message
+
+
+@pytest.fixture
+def dp(loop):
+    vk = VK(access_token='token', loop=loop)
+    yield Dispatcher(vk, loop=loop)
+    loop.run_until_complete(vk.close())
+
+
+class RecordingMiddleware(BaseMiddleware):
+    def __init__(self, name, calls):
+        super(RecordingMiddleware, self).__init__()
+        self.name = name
+        self.calls = calls
+
+    async def on_pre_process_message(self, message):
+        self.calls.append((self.name, 'pre', message.text))
+
+    async def on_post_process_message(self, message, results):
+        self.calls.append((self.name, 'post', results))
+
+
+class CancellingMiddleware(BaseMiddleware):
+    async def on_pre_process_message(self, message):
+        if message.text == 'cancel':
+            raise CancelHandler()
+
+
+class TriggerMiddleware(BaseMiddleware):
+    def __init__(self, calls):
+        super(TriggerMiddleware, self).__init__()
+        self.calls = calls
+
+    async def trigger(self, action, args):
+        self.calls.append(action)
+
+
+def notify(loop, dp, text):
+    return loop.run_until_complete(dp.message_handlers.notify(Message(id=1, peer_id=1, text=text)))
+
+
+def test_actions_table(dp):
+    middleware = dp.middleware.setup(RecordingMiddleware('first', []))
+    assert sorted(middleware.get_actions()) == ['post_process_message', 'pre_process_message']
+    assert dp.middleware.get_handlers('pre_process_message') == (middleware.on_pre_process_message,)
+    assert dp.middleware.get_handlers('process_message') == ()
+
+    second = dp.middleware.setup(RecordingMiddleware('second', []))
+    assert dp.middleware.get_handlers('pre_process_message') == (middleware.on_pre_process_message,
+                                                                 second.on_pre_process_message)
+    with pytest.raises(ValueError):
+        dp.middleware.setup(second)
+    with pytest.raises(TypeError):
+        dp.middleware.setup(object())
+
+
+def test_middlewares_are_called_in_order(loop, dp):
+    calls = []
+    dp.middleware.setup(RecordingMiddleware('first', calls))
+    dp.middleware.setup(RecordingMiddleware('second', calls))
+
+    @dp.message_handler(run_task=False)
+    async def handler(message):
+        return 'ok'
+
+    assert notify(loop, dp, 'text') == ['ok']
+    assert calls == [('first', 'pre', 'text'), ('second', 'pre', 'text'),
+                     ('first', 'post', ['ok']), ('second', 'post', ['ok'])]
+
+
+def test_event_is_cancelled(loop, dp):
+    dp.middleware.setup(CancellingMiddleware())
+
+    @dp.message_handler(run_task=False)
+    async def handler(message):
+        return 'ok'
+
+    assert notify(loop, dp, 'cancel') == []
+    assert notify(loop, dp, 'text') == ['ok']
+
+
+def test_overridden_trigger_receives_all_actions(loop, dp):
+    calls = []
+    dp.middleware.setup(TriggerMiddleware(calls))
+
+    @dp.message_handler(run_task=False)
+    async def handler(message):
+        return 'ok'
+
+    assert notify(loop, dp, 'text') == ['ok']
+    assert calls == ['pre_process_message', 'process_message', 'post_process_message']
@@ -0,0 +1,89 @@
+from avkapi import VK
+from avkapi.dispatcher import Dispatcher
+from avkapi.dispatcher.middlewares import BaseMiddleware
+from avkapi.utils.executor import Executor
+
+
+def make_message(message_id, text):
+    return {'type': 'message_new', 'group_id': 1,
+            'object': {'id': message_id, 'peer_id': 1, 'from_id': 1, 'date': 1, 'text': text}}
+
+
+class EventsMiddleware(BaseMiddleware):
+    def __init__(self):
+        super(EventsMiddleware, self).__init__()
+        self.events = []
+
+    async def on_pre_process_event(self, event):
+        self.events.append(event.type)
+
+
+def test_polling(loop):
+    vk = VK(access_token='token', loop=loop, group_id=1)
+    dp = Dispatcher(vk, loop=loop)
+    middleware = dp.middleware.setup(EventsMiddleware())
+    received = []
+    requests = []
+    servers = iter([{'server': 'server', 'key': 'key1', 'ts': '1'},
+                    ConnectionError('network is down'),
+                    {'server': 'server', 'key': 'key2', 'ts': '1'}])
+
+    async def get_long_poll_server(group_id):
+        server = next(servers)
+        if isinstance(server, Exception):
+            raise server
+        return server
+
+    async def check_long_poll(server, key, ts, wait=25):
+        requests.append((key, ts))
+        if key == 'key1':
+            return {'failed': 2}  # Key is expired
+        if ts == '1':
+            return {'ts': '3', 'updates': [make_message(1, 'first'), make_message(2, 'second')]}
+        dp.stop_polling()
+        return {'ts': ts, 'updates': []}
+
+    vk.groups.get_long_poll_server = get_long_poll_server
+    vk.check_long_poll = check_long_poll
+
+    @dp.message_handler(run_task=False)
+    async def handler(message):
+        received.append(message.text)
+
+    async def run():
+        await dp.start_polling(error_sleep=0.001)
+        await vk.close()
+
+    loop.run_until_complete(run())
+    assert received == ['first', 'second']
+    assert middleware.events == ['message_new', 'message_new']
+    # Failed refresh of the key is retried
+    assert requests == [('key1', '1'), ('key1', '1'), ('key2', '1'), ('key2', '3')]
+
+
+def test_events_without_handlers_are_skipped(loop):
+    vk = VK(access_token='token', loop=loop)
+    dp = Dispatcher(vk, loop=loop)
+
+    assert not dp.has_handlers('message_new')
+    assert loop.run_until_complete(dp.process_raw_event(make_message(1, 'text'))) is None
+    loop.run_until_complete(vk.close())
+
+
+def test_updates_are_not_skipped_in_webhook_mode(loop):
+    vk = VK(access_token='token', loop=loop, group_id=1)
+    dp = Dispatcher(vk, loop=loop)
+    calls = []
+
+    async def get_long_poll_server(group_id):
+        calls.append(group_id)
+        return {'server': 'server', 'key': 'key', 'ts': '1'}
+
+    vk.groups.get_long_poll_server = get_long_poll_server
+    executor = Executor(dp, skip_updates=True, loop=loop)
+    loop.run_until_complete(executor._startup_webhook())
+    assert calls == []
+
+    loop.run_until_complete(executor._startup_polling())
+    assert calls == [1]
+    loop.run_until_complete(vk.close())
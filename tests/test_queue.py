@@ -0,0 +1,172 @@
+import asyncio
+import random
+
+from avkapi import VK
+from avkapi.dispatcher import Dispatcher
+from avkapi.dispatcher.queue import EventQueue, QueuePolicy, ShardedEventQueue, get_peer_key
+
+
+class FakeDispatcher:
+    def __init__(self, loop, delay=0.0):
+        self.loop = loop
+        self.delay = delay
+        self.processed = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def process_raw_event(self, data):
+        await self.release.wait()
+        await asyncio.sleep(self.delay)
+        self.processed.append(data['n'])
+
+
+def make_event(n, event_type='message_new', peer_id=1):
+    return {'n': n, 'type': event_type, 'object': {'peer_id': peer_id}}
+
+
+def test_reject_policy(loop):
+    dispatcher = FakeDispatcher(loop)
+    dispatcher.release.clear()
+    queue = EventQueue(dispatcher, maxsize=1, workers=1)
+
+    async def run():
+        results = []
+        for n in range(3):
+            results.append(await queue.put(make_event(n)))
+            await asyncio.sleep(0)
+        dispatcher.release.set()
+        await queue.close()
+        return results
+
+    assert loop.run_until_complete(run()) == [True, True, False]
+    assert dispatcher.processed == [0, 1]
+    assert queue.get_stats()['rejected'] == 1
+
+
+def test_shed_policy_drops_low_priority_events(loop):
+    dispatcher = FakeDispatcher(loop)
+    dispatcher.release.clear()
+    queue = EventQueue(dispatcher, maxsize=2, workers=1, policy=QueuePolicy.SHED)
+
+    async def run():
+        await queue.put(make_event(0))
+        await asyncio.sleep(0)  # Taken by the worker
+        await queue.put(make_event(1, 'group_join'))
+        await queue.put(make_event(2))
+        await queue.put(make_event(3, 'wall_post_new'))  # Dropped itself
+        await queue.put(make_event(4))  # Replaces queued low priority event
+        dispatcher.release.set()
+        await queue.close()
+
+    loop.run_until_complete(run())
+    assert dispatcher.processed == [0, 2, 4]
+    assert queue.get_stats()['shed'] == 2
+
+
+def test_block_policy_waits(loop):
+    dispatcher = FakeDispatcher(loop)
+    queue = EventQueue(dispatcher, maxsize=1, workers=1, policy=QueuePolicy.BLOCK)
+
+    async def run():
+        for n in range(5):
+            assert await queue.put(make_event(n))
+        await queue.close()
+
+    loop.run_until_complete(run())
+    assert dispatcher.processed == [0, 1, 2, 3, 4]
+
+
+def test_close_processes_queued_events(loop):
+    dispatcher = FakeDispatcher(loop, delay=0.001)
+    queue = EventQueue(dispatcher, maxsize=10, workers=2)
+
+    async def run():
+        for n in range(8):
+            await queue.put(make_event(n))
+        await queue.close()
+
+    loop.run_until_complete(run())
+    assert sorted(dispatcher.processed) == list(range(8))
+    assert queue.depth == 0
+
+
+def test_close_by_timeout(loop):
+    dispatcher = FakeDispatcher(loop)
+    dispatcher.release.clear()
+    queue = EventQueue(dispatcher, maxsize=10, workers=1)
+
+    async def run():
+        for n in range(3):
+            await queue.put(make_event(n))
+        await queue.close(timeout=0.01)
+        return await queue.put(make_event(3))
+
+    assert loop.run_until_complete(run())
+    assert dispatcher.processed == []
+    loop.run_until_complete(queue.close(timeout=0))
+
+
+class RandomDelayDispatcher(FakeDispatcher):
+    async def process_raw_event(self, data):
+        await asyncio.sleep(random.random() * 0.002)
+        self.processed.append((data['object']['peer_id'], data['n']))
+
+
+def test_peer_key():
+    assert get_peer_key(make_event(1, peer_id=5)) == 5
+    assert get_peer_key({'type': 'group_join', 'object': {'user_id': 7}}) == 7
+
+
+def test_sharded_queue_keeps_order_of_conversation(loop):
+    dispatcher = RandomDelayDispatcher(loop)
+    queue = ShardedEventQueue(dispatcher, maxsize=100, workers=4)
+
+    async def run():
+        for n in range(40):
+            assert await queue.put(make_event(n, peer_id=n % 5))
+        await queue.close()
+
+    loop.run_until_complete(run())
+    assert len(dispatcher.processed) == 40
+    for peer_id in range(5):
+        numbers = [n for peer, n in dispatcher.processed if peer == peer_id]
+        assert numbers == sorted(numbers)
+
+    stats = queue.get_stats()
+    assert stats['processed'] == 40
+    assert sum(shard['processed'] for shard in stats['shards']) == 40
+
+
+class BlockingDispatcher(FakeDispatcher):
+    async def process_raw_event(self, data):
+        if data['n'] == 0:
+            await self.release.wait()
+        self.processed.append(data['n'])
+
+
+def test_sharded_queue_processes_conversations_in_parallel(loop):
+    dispatcher = BlockingDispatcher(loop)
+    dispatcher.release.clear()
+    queue = ShardedEventQueue(dispatcher, maxsize=10, workers=2, key=lambda event: event['object']['peer_id'])
+
+    async def run():
+        await queue.put(make_event(0, peer_id=0))  # Shard of the peer 0 is blocked
+        await queue.put(make_event(1, peer_id=0))
+        await queue.put(make_event(2, peer_id=1))
+        await asyncio.sleep(0.01)
+        processed = list(dispatcher.processed)
+        dispatcher.release.set()
+        await queue.close()
+        return processed
+
+    assert loop.run_until_complete(run()) == [2]
+    assert dispatcher.processed == [2, 0, 1]
+
+
+def test_ordered_dispatcher(loop):
+    vk = VK(access_token='token', loop=loop)
+    dp = Dispatcher(vk, loop=loop)
+    queue = dp.setup_events_queue(workers=2, ordered=True)
+    assert isinstance(queue, ShardedEventQueue)
+    assert dp.ordered_processing
+    loop.run_until_complete(vk.close())
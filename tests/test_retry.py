@@ -0,0 +1,44 @@
+import pytest
+
+from avkapi.methods import BaseMethod, RetryPolicy
+from avkapi.types.exceptions import FloodControl, InvalidParameter, TooManyRequests, VKAPIError
+
+from .session import FakeSession
+
+
+def test_errors_are_mapped_by_code():
+    assert isinstance(VKAPIError.detect({'error_code': 6, 'error_msg': 'Too many'}), TooManyRequests)
+    assert isinstance(VKAPIError.detect({'error_code': 100, 'error_msg': 'bad'}), InvalidParameter)
+    error = VKAPIError.detect({'error_code': 100500, 'error_msg': 'new'})
+    assert type(error) is VKAPIError and error.code == 100500
+
+
+def test_policy():
+    policy = RetryPolicy(max_retries=2, base_delay=1, max_delay=3, jitter=False)
+    assert policy.should_retry(FloodControl('x'), 0)
+    assert not policy.should_retry(FloodControl('x'), 2)
+    assert not policy.should_retry(InvalidParameter('x'), 0)
+    assert [policy.get_delay(attempt) for attempt in range(4)] == [1, 2, 3, 3]
+
+    jittered = RetryPolicy(base_delay=1, max_delay=3)
+    assert all(0 <= jittered.get_delay(2) <= 3 for _ in range(20))
+
+
+def test_transient_errors_are_retried(loop):
+    responses = iter([{'error': {'error_code': 6, 'error_msg': 'Too many'}},
+                      {'error': {'error_code': 10, 'error_msg': 'Internal'}},
+                      {'response': {'count': 1}}])
+    session = FakeSession(lambda method_name, data: next(responses))
+    api = BaseMethod(session, 'token', '5.80', retry_policy=RetryPolicy(base_delay=0.001))
+
+    assert loop.run_until_complete(api._call('users.get', {})) == {'count': 1}
+    assert len(session.requests) == 3
+
+
+def test_other_errors_are_raised(loop):
+    session = FakeSession(lambda method_name, data: {'error': {'error_code': 100, 'error_msg': 'bad'}})
+    api = BaseMethod(session, 'token', '5.80', retry_policy=RetryPolicy(base_delay=0.001))
+
+    with pytest.raises(InvalidParameter):
+        loop.run_until_complete(api._call('users.get', {}))
+    assert len(session.requests) == 1
@@ -0,0 +1,75 @@
+import pytest
+
+from avkapi import VK, types
+from avkapi.dispatcher import Dispatcher, dispatcher as dispatcher_module
+from avkapi.types import EventType
+
+
+@pytest.fixture
+def dp(loop):
+    vk = VK(access_token='token', loop=loop)
+    yield Dispatcher(vk, loop=loop)
+    loop.run_until_complete(vk.close())
+
+
+def test_events_routed_by_type(loop, dp):
+    received = []
+
+    @dp.group_join_handler(run_task=False)
+    async def join_handler(event: types.Event):
+        received.append(('join', event.object['user_id']))
+
+    @dp.event_handler(event_types=[EventType.MESSAGE_ALLOW, EventType.MESSAGE_DENY], run_task=False)
+    async def allow_handler(event: types.Event):
+        received.append((event.type, event.object['user_id']))
+
+    @dp.message_handler(run_task=False)
+    async def message_handler(message: types.Message):
+        received.append(('message', message.text))
+
+    events = [
+        {'type': 'group_join', 'group_id': 1, 'object': {'user_id': 1, 'join_type': 'join'}},
+        {'type': 'message_allow', 'group_id': 1, 'object': {'user_id': 2, 'key': ''}},
+        {'type': 'message_deny', 'group_id': 1, 'object': {'user_id': 3}},
+        {'type': 'message_new', 'group_id': 1, 'object': {'id': 1, 'peer_id': 1, 'text': 'hi', 'date': 1}},
+    ]
+    for event in events:
+        loop.run_until_complete(dp.process_raw_event(event))
+
+    assert received == [('join', 1), ('message_allow', 2), ('message_deny', 3), ('message', 'hi')]
+
+
+def test_event_without_handlers_is_not_deserialized(loop, dp, monkeypatch):
+    created = []
+
+    class Event(types.Event):
+        def __init__(self, **kwargs):
+            created.append(kwargs['type'])
+            super(Event, self).__init__(**kwargs)
+
+    monkeypatch.setattr(dispatcher_module, 'Event', Event)
+
+    @dp.group_leave_handler(run_task=False)
+    async def leave_handler(event):
+        pass
+
+    assert not dp.has_handlers('wall_post_new')
+    assert dp.has_handlers('group_leave')
+    assert not dp.has_handlers('message_new')
+
+    loop.run_until_complete(dp.process_raw_event({'type': 'wall_post_new', 'object': {'id': 1}}))
+    loop.run_until_complete(dp.process_raw_event({'type': 'message_new', 'object': {'id': 1}}))
+    loop.run_until_complete(dp.process_raw_event({'type': 'group_leave', 'object': {'user_id': 1}}))
+    assert created == ['group_leave']
+
+
+def test_message_types_share_message_handlers(dp):
+    assert dp.event_handlers[EventType.MESSAGE_NEW] is dp.message_handlers
+    with pytest.raises(ValueError):
+        dp.register_event_handler(lambda event: None, EventType.MESSAGE_NEW)
+
+
+def test_event_of_other_type_has_no_message():
+    event = types.Event(type='group_join', group_id=1, object={'user_id': 1})
+    assert event.message is None
+    assert event.object == {'user_id': 1}
@@ -0,0 +1,102 @@
+import pytest
+
+from avkapi import VK
+from avkapi.dispatcher import Dispatcher, filters
+from avkapi.dispatcher.storage import USER_STATE, reset_event_cache
+from avkapi.types import Event
+
+from .storage import DictStorage
+
+
+@pytest.fixture
+def storage():
+    return DictStorage()
+
+
+@pytest.fixture
+def dp(loop, storage):
+    vk = VK(access_token='token', loop=loop)
+    yield Dispatcher(vk, storage=storage, loop=loop)
+    loop.run_until_complete(vk.close())
+
+
+def make_event(text, peer_id=1):
+    return Event(type='message_new', group_id=1, object={'id': 1, 'peer_id': peer_id, 'text': text})
+
+
+def test_state_is_read_once_for_event(loop, dp, storage):
+    loop.run_until_complete(storage.set_state(chat=1, state='other'))
+    received = []
+
+    @dp.message_handler(state='first', run_task=False)
+    async def first(message):
+        received.append('first')
+
+    @dp.message_handler(state=['second', 'other'], run_task=False)
+    async def second(message):
+        received.append('second')
+
+    loop.run_until_complete(dp.process_event(make_event('text')))
+    assert received == ['second']
+    assert storage.reads == 1
+
+    loop.run_until_complete(dp.process_event(make_event('text')))
+    assert storage.reads == 2
+
+
+def test_cache_is_reset_by_changes(loop, storage):
+    async def run():
+        await storage.set_state(chat=1, state='first')
+        assert await storage.get_cached_state(chat=1) == 'first'
+        assert await storage.get_cached_state(chat=1, user=1) == 'first'
+        assert storage.reads == 1
+
+        await storage.set_state(chat=1, state='second')
+        assert await storage.get_cached_state(chat=1) == 'second'
+
+        await storage.update_data(chat=1, data={'key': 'value'})
+        assert await storage.get_cached_data(chat=1) == {'key': 'value'}
+        await storage.finish(chat=1)
+        assert await storage.get_cached_state(chat=1) is None
+        assert await storage.get_cached_data(chat=1) == {}
+
+        reads = storage.reads
+        await storage.get_cached_state(chat=1)
+        reset_event_cache()
+        await storage.get_cached_state(chat=1)
+        return storage.reads - reads
+
+    assert loop.run_until_complete(run()) == 1
+
+
+def test_cache_of_other_user_is_kept(loop, storage):
+    async def run():
+        await storage.get_cached_state(chat=1)
+        await storage.get_cached_state(chat=2)
+        await storage.set_state(chat=1, state='changed')
+        await storage.get_cached_state(chat=1)
+        await storage.get_cached_state(chat=2)
+
+    loop.run_until_complete(run())
+    assert storage.reads == 3
+
+
+def test_state_is_changed_by_handler(loop, dp, storage):
+    received = []
+
+    @dp.message_handler(state=None, commands=['start'], run_task=False)
+    async def start(message):
+        await storage.set_state(chat=message.peer_id, state='started')
+        received.append(await storage.get_cached_state(chat=message.peer_id))
+
+    @dp.message_handler(state='started', run_task=False)
+    async def started(message):
+        received.append('started')
+
+    loop.run_until_complete(dp.process_event(make_event('/start')))
+    loop.run_until_complete(dp.process_event(make_event('text')))
+    assert received == ['started', 'started']
+
+
+def test_user_state_is_reexported():
+    assert filters.USER_STATE is USER_STATE
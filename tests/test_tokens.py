@@ -0,0 +1,61 @@
+import collections
+
+import pytest
+
+from avkapi.methods import BaseMethod, RetryPolicy, Token, TokenPool, TokenStrategy
+from avkapi.types.exceptions import AuthorizationFailed
+
+from .session import FakeResponse, FakeSession
+
+
+def test_lru_strategy_rotates_tokens(loop):
+    pool = TokenPool(['a', 'b', 'c'])
+
+    async def run():
+        return [(await pool.acquire()).access_token for _ in range(6)]
+
+    assert loop.run_until_complete(run()) == ['a', 'b', 'c', 'a', 'b', 'c']
+
+
+def test_weighted_strategy():
+    pool = TokenPool([Token('a', weight=3), Token('b', weight=1)], strategy=TokenStrategy.WEIGHTED)
+    counts = collections.Counter(pool.choose().access_token for _ in range(8))
+    assert counts == {'a': 6, 'b': 2}
+
+
+def test_failing_token_is_taken_out(loop):
+    pool = TokenPool(['bad', 'good'], max_failures=2)
+
+    def handler(method_name, data):
+        if data['access_token'] == 'bad':
+            return {'error': {'error_code': 5, 'error_msg': 'User authorization failed'}}
+        return {'response': 1}
+
+    api = BaseMethod(FakeSession(handler), pool, '5.80', retry_policy=RetryPolicy(max_retries=0))
+
+    async def run():
+        results = []
+        for _ in range(6):
+            try:
+                results.append(await api._call('users.get', {}))
+            except AuthorizationFailed:
+                results.append('failed')
+        return results
+
+    assert loop.run_until_complete(run()) == ['failed', 1, 'failed', 1, 1, 1]
+    assert not pool.tokens[0].healthy
+
+
+def test_server_errors_are_not_token_failures(loop):
+    pool = TokenPool(['token'], max_failures=1)
+    api = BaseMethod(FakeSession(lambda method_name, data: FakeResponse('', status=502)), pool, '5.80')
+
+    with pytest.raises(RuntimeError):
+        loop.run_until_complete(api._call('users.get', {}))
+    assert pool.tokens[0].healthy
+
+
+def test_repr_without_token():
+    assert 'None' in repr(Token(None))
+    assert 'cret' in repr(Token('secret'))
+    assert 'secret' not in repr(Token('secret'))
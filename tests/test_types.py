@@ -0,0 +1,202 @@
+import datetime
+import json
+
+import pytest
+
+from avkapi.types import Coordinates, Geo, Message, base, fields
+
+PAYLOAD = {'id': 1, 'peer_id': 2, 'from_id': 3, 'date': 1546300800, 'text': 'hello'}
+
+
+def test_lazy_message_keeps_unixtime():
+    message = Message.to_object(PAYLOAD, lazy=True)
+    assert message.to_python()['date'] == 1546300800
+    assert isinstance(message.to_python()['date'], int)
+
+
+def test_datetime_is_converted_on_access():
+    message = Message.to_object(PAYLOAD, lazy=True)
+    assert isinstance(message.date, datetime.datetime)
+    assert message.to_python()['date'] == 1546300800
+
+
+def test_lazy_message_exports_raw_date_as_is():
+    message = Message.to_object(dict(PAYLOAD, date=1546300800.5), lazy=True)
+    assert message.to_python()['date'] == 1546300800.5
+
+
+def test_objects_have_no_dict():
+    message = Message(**PAYLOAD)
+    assert not hasattr(message, '__dict__')
+    assert '_vk_id' in Message.__slots__
+    with pytest.raises(AttributeError):
+        message.unknown_attribute = 1
+
+
+def test_fields_access():
+    message = Message(**PAYLOAD, extra_field='x')
+    assert message.message_id == 1
+    assert message['id'] == 1
+    assert message.values['text'] == 'hello'
+    assert message.values['extra_field'] == 'x'
+    assert set(message.props) >= {'id', 'peer_id', 'text', 'date'}
+    assert message.props_aliases['message_id'] == 'id'
+
+    message.text = 'bye'
+    message['peer_id'] = 10
+    message.values['other'] = 1
+    assert message.to_python() == dict(PAYLOAD, text='bye', peer_id=10, extra_field='x', other=1)
+
+    del message.values['text']
+    assert message.text is None
+    assert 'text' not in message
+    assert 'text' not in message.values
+
+
+def test_subclass_fields():
+    class Base(base.VKObject):
+        first: base.Integer = fields.Field()
+
+    class Child(Base):
+        second: base.Integer = fields.Field(alias='other', default=2)
+
+    child = Child(first=1)
+    assert child.to_python() == {'first': 1, 'other': 2}
+    assert set(Child.__slots__) == {'_vk_other'}
+
+
+def test_alias_must_be_identifier():
+    with pytest.raises(TypeError):
+        class Broken(base.VKObject):
+            value = fields.Field(alias='not identifier')
+
+
+FORWARDED = dict(PAYLOAD, fwd_messages=[dict(PAYLOAD, id=0, text='forwarded', geo={'type': 'point'})],
+                 geo={'type': 'point', 'place': {'id': 5, 'title': 'home'}})
+
+
+def is_built(obj, name):
+    try:
+        getattr(type(obj), base.SLOT_PREFIX + name).__get__(obj)
+    except AttributeError:
+        return False
+    return True
+
+
+def test_lazy_fields_are_deserialized_on_access():
+    message = Message.to_object(FORWARDED, lazy=True)
+    assert message.text == 'hello'
+    assert not is_built(message, 'fwd_messages')
+    assert not is_built(message, 'geo')
+
+    forwarded = message.fwd_messages
+    assert is_built(message, 'fwd_messages')
+    assert message.fwd_messages is forwarded
+    assert forwarded[0].text == 'forwarded'
+    assert forwarded[0].geo.type == 'point'
+    assert message.geo.place.title == 'home'
+
+
+def test_lazy_object_equals_eager():
+    lazy = Message.to_object(FORWARDED, lazy=True)
+    eager = Message.to_object(FORWARDED)
+    assert lazy.to_python() == eager.to_python()
+    assert lazy.fwd_messages[0].to_python() == eager.fwd_messages[0].to_python()
+    assert 'geo' in lazy
+    assert 'action' not in lazy
+
+
+def test_lazy_object_changes_do_not_touch_payload():
+    payload = dict(FORWARDED)
+    message = Message.to_object(payload, lazy=True)
+    message.text = 'changed'
+    del message.values['geo']
+    assert message.geo is None
+    assert payload == FORWARDED
+    assert message.to_python()['text'] == 'changed'
+    assert 'geo' not in message.to_python()
+
+
+def test_to_python_of_nested_objects():
+    message = Message(**FORWARDED)
+    result = message.to_python()
+    assert result['fwd_messages'][0]['geo'] == {'type': 'point'}
+    assert result['geo']['place'] == {'id': 5, 'title': 'home'}
+    assert result['date'] == 1546300800
+    assert dict(message) == result
+
+
+def test_as_json():
+    message = Message(**FORWARDED)
+    assert json.loads(message.as_json()) == message.to_python()
+    assert json.loads(message.as_json(binary=True)) == message.to_python()
+    assert str(message) == message.as_json()
+
+
+def test_as_json_with_big_integer():
+    message = Message(**dict(PAYLOAD, random_id=2 ** 70))
+    assert json.loads(message.as_json(binary=True))['random_id'] == 2 ** 70
+
+
+def test_messages_are_compared_by_key():
+    first = Message(**PAYLOAD)
+    second = Message.to_object(dict(PAYLOAD, text='edited'), lazy=True)
+    assert first == second
+    assert hash(first) == hash(second)
+    assert len({first, second}) == 1
+    assert first != Message(**dict(PAYLOAD, id=2))
+
+
+def test_chat_messages_without_id_are_compared_by_values():
+    first = Message(**dict(PAYLOAD, id=0))
+    assert first == Message(**dict(PAYLOAD, id=0))
+    assert first != Message(**dict(PAYLOAD, id=0, text='other'))
+
+
+def test_hash_is_cached_and_reset_on_change():
+    geo = Geo(type='point', place={'id': 1, 'title': 'home'})
+    value = hash(geo)
+    assert geo._hash == value
+    assert geo == Geo(type='point', place={'id': 1, 'title': 'home'})
+
+    geo.place.title = 'work'  # Hash of the parent is dropped too
+    assert geo._hash is None
+    assert hash(geo) != value
+    assert geo != Geo(type='point', place={'id': 1, 'title': 'home'})
+
+
+def test_hash_of_object_with_list_is_not_cached():
+    geo = Geo(type='point', coordinates=[{'latitude': 1.0, 'longitude': 2.0}])
+    value = hash(geo)
+    geo.coordinates.append(Coordinates(latitude=3.0, longitude=4.0))
+    assert hash(geo) != value
+    assert geo == Geo(type='point', coordinates=[{'latitude': 1.0, 'longitude': 2.0},
+                                                 {'latitude': 3.0, 'longitude': 4.0}])
+
+
+def test_forward_reference_is_bound():
+    prop = Message._props['fwd_messages']
+    assert prop.base_object is Message
+
+
+def test_forward_reference_to_later_class():
+    class Post(base.VKObject):
+        comments = fields.ListField(base='PostComment')
+
+    class PostComment(base.VKObject):
+        text = fields.Field()
+
+    base.MetaVKObject.resolve_types()
+    post = Post(comments=[{'text': 'hi'}])
+    assert isinstance(post.comments[0], PostComment)
+
+
+def test_unknown_forward_reference():
+    class Broken(base.VKObject):
+        items = fields.ListField(base='UnknownObject')
+
+    try:
+        with pytest.raises(TypeError, match='Broken.items'):
+            base.MetaVKObject.resolve_types()
+    finally:
+        base.MetaVKObject._unresolved.clear()
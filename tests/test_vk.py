@@ -0,0 +1,30 @@
+from avkapi import VK, ConnectionProfile
+
+
+def test_connector_of_profile(loop):
+    profile = ConnectionProfile(limit=10, limit_per_host=5, keepalive_timeout=30, ttl_dns_cache=60)
+
+    async def run():
+        connector = profile.get_connector(loop=loop)
+        try:
+            return connector.limit, connector.limit_per_host
+        finally:
+            await connector.close()
+
+    assert loop.run_until_complete(run()) == (10, 5)
+
+
+def test_method_groups_share_session(loop):
+    async def run():
+        vk = VK(access_token='token', loop=loop, connection_profile=ConnectionProfile(limit=10))
+        sessions = {id(group._session) for group in vk._get_method_groups()}
+        connector_limit = vk._session.connector.limit
+
+        # Closed session is replaced for all groups
+        await vk._session.close()
+        session = await vk.get_session()
+        replaced = all(group._session is session for group in vk._get_method_groups())
+        await vk.close()
+        return len(sessions), connector_limit, replaced
+
+    assert loop.run_until_complete(run()) == (1, 10, True)
@@ -0,0 +1,135 @@
+import asyncio
+import json
+
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from avkapi import VK
+from avkapi.dispatcher import Dispatcher
+from avkapi.dispatcher.webhook import WebhookRequestHandler, configure_app
+
+SECRET = 'secret'
+
+
+def make_event(message_id):
+    return json.dumps({'type': 'message_new', 'group_id': 1, 'secret': SECRET,
+                       'object': {'id': message_id, 'peer_id': 1, 'text': str(message_id), 'date': 1}})
+
+
+def test_event_rejected_by_queue_is_not_duplicate(loop):
+    async def run():
+        vk = VK(access_token='token', loop=loop, secret_key=SECRET)
+        dp = Dispatcher(vk, loop=loop)
+        dp.setup_deduplicator()
+        dp.setup_events_queue(maxsize=1, workers=1)
+
+        release = asyncio.Event()
+        received = []
+
+        @dp.message_handler(run_task=False)
+        async def handler(message):
+            await release.wait()
+            received.append(message.text)
+
+        app = web.Application()
+        configure_app(dp, app)
+        async with TestClient(TestServer(app)) as client:
+            # The first event is taken by the worker, the second one fills the queue
+            for message_id in (1, 2):
+                response = await client.post('/webhook', data=make_event(message_id))
+                assert response.status == 200
+                await asyncio.sleep(0.01)
+
+            response = await client.post('/webhook', data=make_event(3))
+            assert response.status == 503
+
+            release.set()
+            await asyncio.sleep(0.01)
+
+            # Retry of the rejected event is processed
+            response = await client.post('/webhook', data=make_event(3))
+            assert response.status == 200
+            await asyncio.sleep(0.01)
+
+            # And the next retry is a duplicate
+            response = await client.post('/webhook', data=make_event(3))
+            assert response.status == 200
+            await asyncio.sleep(0.01)
+
+        await dp.events_queue.close()
+        await vk.close()
+        return received
+
+    assert loop.run_until_complete(run()) == ['1', '2', '3']
+
+
+def post_events(loop, dp, *events, handler_class=None):
+    async def run():
+        app = web.Application()
+        configure_app(dp, app)
+        if handler_class is not None:
+            app.router.add_route('*', '/custom', handler_class)
+        path = '/webhook' if handler_class is None else '/custom'
+        responses = []
+        async with TestClient(TestServer(app)) as client:
+            for event in events:
+                response = await client.post(path, data=event)
+                responses.append((response.status, await response.text()))
+            await asyncio.sleep(0.01)
+        await dp.vk.close()
+        return responses
+
+    return loop.run_until_complete(run())
+
+
+def test_confirmation(loop):
+    vk = VK(access_token='token', loop=loop, secret_key=SECRET, confirmation_code='code')
+    dp = Dispatcher(vk, loop=loop)
+    event = json.dumps({'type': 'confirmation', 'group_id': 1, 'secret': SECRET})
+    assert post_events(loop, dp, event) == [(200, 'code')]
+
+
+def test_confirmation_without_code(loop):
+    vk = VK(access_token='token', loop=loop, secret_key=SECRET)
+    dp = Dispatcher(vk, loop=loop)
+    event = json.dumps({'type': 'confirmation', 'group_id': 1, 'secret': SECRET})
+    assert post_events(loop, dp, event) == [(200, '')]
+
+
+def test_wrong_secret(loop):
+    vk = VK(access_token='token', loop=loop, secret_key='other')
+    dp = Dispatcher(vk, loop=loop)
+    [(status, _)] = post_events(loop, dp, make_event(1))
+    assert status == 403
+
+
+def test_event_without_handlers_is_not_processed(loop):
+    vk = VK(access_token='token', loop=loop, secret_key=SECRET)
+    dp = Dispatcher(vk, loop=loop)
+    processed = []
+
+    async def process_raw_event(data):
+        processed.append(data)
+
+    dp.process_raw_event = process_raw_event
+    assert post_events(loop, dp, make_event(1)) == [(200, 'ok')]
+    assert processed == []
+
+
+def test_async_secret_check_override(loop):
+    vk = VK(access_token='token', loop=loop, secret_key='other')
+    dp = Dispatcher(vk, loop=loop)
+    received = []
+
+    class RequestHandler(WebhookRequestHandler):
+        @staticmethod
+        async def check_secret_key(vk, data):
+            await asyncio.sleep(0)
+            return data.get('secret') == SECRET
+
+    @dp.message_handler(run_task=False)
+    async def handler(message):
+        received.append(message.text)
+
+    assert post_events(loop, dp, make_event(1), handler_class=RequestHandler) == [(200, 'ok')]
+    assert received == ['1']